@@ -2,289 +2,477 @@
 """
 BEFORE/AFTER DEBLOAT ANALYSIS
 Shows the dramatic improvements from UAD debloating
-"""
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-import numpy as np
-from datetime import datetime
+Usage:
+    python3 analyze_debloat.py            # full report + debloat_comparison.png
+    python3 analyze_debloat.py --text     # report only, no figure
+    python3 analyze_debloat.py --json     # machine-readable results only
+    python3 analyze_debloat.py --packages BEFORE AFTER   # real package dumps or capture folders
+    python3 analyze_debloat.py --processes BEFORE AFTER  # real `ps -A` dumps or capture folders
+    python3 analyze_debloat.py --profile  # per-stage timings (profiling.py)
+
+Importing this module has no side effects; the report runs from main().
+matplotlib is only imported when the figure is rendered; unchanged figures
+come from the render cache (render_cache.py, --no-cache to bypass).
+"""
 
-print("="*80)
-print("🔥 DEBLOAT ANALYSIS: BEFORE vs AFTER 🔥")
-print("="*80)
-print()
+import argparse
+import json
+import sys
+from textwrap import dedent
+
+from bloat_classifier import NOT_BLOAT, BloatClassifier
+from package_diff import diff_inventories, load_inventory
+from plotting import pyplot, save_figure
+from profiling import add_profile_arguments, profiling_from_args, span
+from recorded_captures import RECORDED_CAPTURES
+from render_cache import render_cached
+
+DEBLOAT_KEYS = (
+    'total_packages',
+    'system_apps',
+    'user_apps',
+    'running_processes',
+    'storage_free_gb',
+    'storage_total_gb',
+)
 
 # ============================================================================
-# BEFORE DATA (from original forensic scan)
+# LIST OF REMOVED APPS (sample)
 # ============================================================================
-before = {
-    'total_packages': 573,
-    'system_apps': 311,
-    'user_apps': 262,
-    'running_processes': 1070,
-    'storage_free_gb': 140.5,
-    'storage_total_gb': 220.9,
-}
+REMOVED_APPS = [
+    "Google AdServices (tracking/ads)",
+    "Google Bard (AI assistant bloat)",
+    "Google Photos (if you don't use it)",
+    "Samsung Pass (password manager bloat)",
+    "Samsung Game Tools",
+    "Google Voice Access",
+    "Verizon My Verizon app",
+    "Microsoft Office apps",
+    "Spotify (if removed)",
+    "Google Duo/Tachyon",
+    "Samsung Easy Mover",
+    "Android Auto",
+    "And 174 MORE!",
+]
 
-# ============================================================================
-# AFTER DATA (post-UAD debloat)
-# ============================================================================
-after = {
-    'total_packages': 392,
-    'system_apps': 312,  # Slight increase due to counting methodology
-    'user_apps': 80,     # MASSIVE drop!
-    'running_processes': 1063,
-    'storage_free_gb': 142.3,
-    'storage_total_gb': 220.9,
-}
-
-# Calculate improvements
-improvements = {
-    'packages_removed': before['total_packages'] - after['total_packages'],
-    'user_apps_removed': before['user_apps'] - after['user_apps'],
-    'processes_killed': before['running_processes'] - after['running_processes'],
-    'storage_freed_gb': after['storage_free_gb'] - before['storage_free_gb'],
-}
-
-print("📊 SUMMARY STATISTICS")
-print("="*80)
-print()
-print(f"TOTAL PACKAGES:")
-print(f"  Before: {before['total_packages']}")
-print(f"  After:  {after['total_packages']}")
-print(f"  🗑️  REMOVED: {improvements['packages_removed']} packages ({improvements['packages_removed']/before['total_packages']*100:.1f}%)")
-print()
-
-print(f"USER APPS:")
-print(f"  Before: {before['user_apps']}")
-print(f"  After:  {after['user_apps']}")
-print(f"  🔥 NUKED: {improvements['user_apps_removed']} apps ({improvements['user_apps_removed']/before['user_apps']*100:.1f}%)")
-print()
-
-print(f"RUNNING PROCESSES:")
-print(f"  Before: {before['running_processes']}")
-print(f"  After:  {after['running_processes']}")
-print(f"  ⚡ KILLED: {improvements['processes_killed']} processes ({improvements['processes_killed']/before['running_processes']*100:.1f}%)")
-print()
-
-print(f"STORAGE:")
-print(f"  Before: {before['storage_free_gb']:.1f} GB free")
-print(f"  After:  {after['storage_free_gb']:.1f} GB free")
-print(f"  💾 GAINED: {improvements['storage_freed_gb']:.2f} GB")
-print()
-
-# Calculate percentages
-before_bloat_pct = (before['system_apps'] / before['total_packages']) * 100
-after_bloat_pct = (after['system_apps'] / after['total_packages']) * 100
-
-print(f"BLOATWARE RATIO:")
-print(f"  Before: {before_bloat_pct:.1f}% bloatware")
-print(f"  After:  {after_bloat_pct:.1f}% bloatware")
-print()
-
-print("="*80)
-print()
 
 # ============================================================================
-# CREATE VISUALIZATIONS
+# DATA
 # ============================================================================
-print("🎨 Creating comparison visualizations...")
+def from_capture(capture):
+    """Before/after dict from a capture_loader.py capture holding DEBLOAT_KEYS."""
+    return {key: capture[key] for key in DEBLOAT_KEYS}
 
-fig = plt.figure(figsize=(18, 12))
-gs = fig.add_gridspec(3, 3, hspace=0.4, wspace=0.3)
 
-fig.suptitle('🔥 UAD DEBLOAT SUCCESS REPORT 🔥\nBefore vs After Comparison',
-             fontsize=22, fontweight='bold')
+def recorded_capture(name):
+    """Before/after dict for one of the recorded scans ('before' or 'after')."""
+    return from_capture(RECORDED_CAPTURES[name])
 
-# ============================================================================
-# 1. TOTAL PACKAGES COMPARISON (Big impact visual)
-# ============================================================================
-ax1 = fig.add_subplot(gs[0, :])
-categories = ['Before UAD', 'After UAD']
-values = [before['total_packages'], after['total_packages']]
-colors = ['#ff6b6b', '#51cf66']
-
-bars = ax1.bar(categories, values, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
-ax1.set_ylabel('Total Packages', fontweight='bold', fontsize=14)
-ax1.set_title(f'📦 TOTAL PACKAGES: {improvements["packages_removed"]} REMOVED!',
-             fontweight='bold', fontsize=16, pad=20)
-ax1.set_ylim(0, 600)
-ax1.grid(axis='y', alpha=0.3)
-
-# Add value labels
-for bar, val in zip(bars, values):
-    height = bar.get_height()
-    ax1.text(bar.get_x() + bar.get_width()/2., height,
-            f'{int(val)}\npackages', ha='center', va='bottom',
-            fontweight='bold', fontsize=14)
-
-# Add massive removal arrow
-ax1.annotate('', xy=(1, after['total_packages']), xytext=(0, before['total_packages']),
-            arrowprops=dict(arrowstyle='->', lw=5, color='red'))
-ax1.text(0.5, (before['total_packages'] + after['total_packages'])/2,
-        f'-{improvements["packages_removed"]}',
-        ha='center', va='center', fontsize=20, fontweight='bold',
-        color='red', bbox=dict(boxstyle='round', facecolor='white', edgecolor='red', linewidth=3))
 
-# ============================================================================
-# 2. USER APPS DESTRUCTION
-# ============================================================================
-ax2 = fig.add_subplot(gs[1, 0])
-labels = ['Kept', 'Removed']
-sizes = [after['user_apps'], improvements['user_apps_removed']]
-colors_pie = ['#51cf66', '#ff6b6b']
-explode = (0.1, 0)
-
-wedges, texts, autotexts = ax2.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
-                                     autopct='%1.1f%%', startangle=90,
-                                     textprops={'fontweight': 'bold', 'fontsize': 12})
-for autotext in autotexts:
-    autotext.set_color('white')
-    autotext.set_fontsize(14)
-
-ax2.set_title(f'🗑️ USER APPS NUKED\n{improvements["user_apps_removed"]}/{before["user_apps"]} Removed',
-             fontweight='bold', fontsize=13, pad=15)
+def compute_improvements(before, after):
+    return {
+        'packages_removed': before['total_packages'] - after['total_packages'],
+        'user_apps_removed': before['user_apps'] - after['user_apps'],
+        'processes_killed': before['running_processes'] - after['running_processes'],
+        'storage_freed_gb': after['storage_free_gb'] - before['storage_free_gb'],
+    }
 
-# ============================================================================
-# 3. SYSTEM APPS (Stayed about the same - harder to remove)
-# ============================================================================
-ax3 = fig.add_subplot(gs[1, 1])
-x = ['Before', 'After']
-sys_values = [before['system_apps'], after['system_apps']]
-bars = ax3.bar(x, sys_values, color=['#ffd93d', '#ffd93d'], edgecolor='black', linewidth=2, alpha=0.8)
-ax3.set_ylabel('System Apps', fontweight='bold', fontsize=11)
-ax3.set_title('🔧 SYSTEM APPS\n(Harder to Remove)', fontweight='bold', fontsize=13, pad=15)
-ax3.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, sys_values):
-    height = bar.get_height()
-    ax3.text(bar.get_x() + bar.get_width()/2., height,
-            f'{int(val)}', ha='center', va='bottom',
-            fontweight='bold', fontsize=12)
 
-# ============================================================================
-# 4. RUNNING PROCESSES
-# ============================================================================
-ax4 = fig.add_subplot(gs[1, 2])
-x = ['Before', 'After']
-proc_values = [before['running_processes'], after['running_processes']]
-bars = ax4.bar(x, proc_values, color=['#ff6b6b', '#51cf66'], edgecolor='black', linewidth=2, alpha=0.8)
-ax4.set_ylabel('Processes', fontweight='bold', fontsize=11)
-ax4.set_title(f'⚡ PROCESSES KILLED\n-{improvements["processes_killed"]} Processes',
-             fontweight='bold', fontsize=13, pad=15)
-ax4.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, proc_values):
-    height = bar.get_height()
-    ax4.text(bar.get_x() + bar.get_width()/2., height,
-            f'{int(val)}', ha='center', va='bottom',
-            fontweight='bold', fontsize=12)
+def bloat_pct(capture):
+    """Bloatware as a share of all packages - the "bloatware ratio".
 
-# ============================================================================
-# 5. STORAGE FREED
-# ============================================================================
-ax5 = fig.add_subplot(gs[2, 0])
-storage_labels = ['Before\nFree', 'After\nFree', 'Gained']
-storage_values = [before['storage_free_gb'], after['storage_free_gb'], improvements['storage_freed_gb']]
-colors_storage = ['#ffd93d', '#51cf66', '#4ecdc4']
-
-bars = ax5.bar(storage_labels, storage_values, color=colors_storage, edgecolor='black',
-              linewidth=2, alpha=0.8)
-ax5.set_ylabel('Storage (GB)', fontweight='bold', fontsize=11)
-ax5.set_title('💾 STORAGE RECLAIMED', fontweight='bold', fontsize=13, pad=15)
-ax5.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, storage_values):
-    height = bar.get_height()
-    ax5.text(bar.get_x() + bar.get_width()/2., height,
-            f'{val:.2f}\nGB', ha='center', va='bottom',
-            fontweight='bold', fontsize=11)
+    With a package inventory (--packages) the bloat is what
+    bloat_classifier.py labels with a vendor (`bloat_packages`); the
+    recorded scans only have counts, so there it is the system apps.
+    """
+    bloat = capture.get('bloat_packages', capture['system_apps'])
+    return (bloat / capture['total_packages']) * 100
 
-# ============================================================================
-# 6. BLOATWARE PERCENTAGE
-# ============================================================================
-ax6 = fig.add_subplot(gs[2, 1])
-x_pos = np.arange(2)
-bloat_pcts = [before_bloat_pct, after_bloat_pct]
-colors_bloat = ['#ff6b6b', '#ff8800']
-
-bars = ax6.bar(x_pos, bloat_pcts, color=colors_bloat, edgecolor='black', linewidth=2, alpha=0.8)
-ax6.set_xticks(x_pos)
-ax6.set_xticklabels(['Before', 'After'])
-ax6.set_ylabel('Percentage', fontweight='bold', fontsize=11)
-ax6.set_title('📊 BLOATWARE RATIO', fontweight='bold', fontsize=13, pad=15)
-ax6.set_ylim(0, 100)
-ax6.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, bloat_pcts):
-    height = bar.get_height()
-    ax6.text(bar.get_x() + bar.get_width()/2., height,
-            f'{val:.1f}%', ha='center', va='bottom',
-            fontweight='bold', fontsize=12)
 
-# ============================================================================
-# 7. OVERALL IMPROVEMENT SCORE
-# ============================================================================
-ax7 = fig.add_subplot(gs[2, 2])
-ax7.axis('off')
-
-# Calculate overall improvement score
-pkg_improvement = (improvements['packages_removed'] / before['total_packages']) * 100
-proc_improvement = (improvements['processes_killed'] / before['running_processes']) * 100
-storage_improvement = (improvements['storage_freed_gb'] / before['storage_free_gb']) * 100
-avg_improvement = (pkg_improvement + proc_improvement + storage_improvement) / 3
-
-score_text = f"""
-🏆 DEBLOAT SUCCESS SCORE
-
-Overall Improvement:
-{avg_improvement:.1f}%
-
-Breakdown:
-━━━━━━━━━━━━━━━━━━━━━
-✓ Packages: -{pkg_improvement:.1f}%
-✓ Processes: -{proc_improvement:.1f}%
-✓ Storage: +{storage_improvement:.1f}%
-
-Status: EXCELLENT!
-Your phone is now
-{improvements['packages_removed']} apps lighter!
-"""
+def vendor_breakdown(before_inventory, after_inventory, classifier):
+    """Packages per vendor label (bloat_classifier.py) before and after, most packages first."""
+    before = classifier.counts(before_inventory.paths.keys())
+    after = classifier.counts(after_inventory.paths.keys())
+    breakdown = {}
+    for label in sorted(before.keys() | after.keys(), key=lambda label: (-before.get(label, 0), label)):
+        count_before, count_after = before.get(label, 0), after.get(label, 0)
+        breakdown[label] = {'before': count_before, 'after': count_after,
+                            'removed': count_before - count_after, 'bloat': label not in NOT_BLOAT}
+    return breakdown
 
-ax7.text(0.1, 0.95, score_text, transform=ax7.transAxes,
-        fontsize=11, verticalalignment='top', fontfamily='monospace',
-        bbox=dict(boxstyle='round', facecolor='#d4f1d4', alpha=0.9, pad=1.5,
-                 edgecolor='#51cf66', linewidth=3))
 
-plt.savefig('debloat_comparison.png', dpi=150, bbox_inches='tight', facecolor='white')
-print("✅ Visualization saved: debloat_comparison.png")
+def improvement_score(before, improvements):
+    """Overall debloat success score and its three components, in percent."""
+    pkg_improvement = (improvements['packages_removed'] / before['total_packages']) * 100
+    proc_improvement = (improvements['processes_killed'] / before['running_processes']) * 100
+    storage_improvement = (improvements['storage_freed_gb'] / before['storage_free_gb']) * 100
+    return {
+        'pkg_improvement': pkg_improvement,
+        'proc_improvement': proc_improvement,
+        'storage_improvement': storage_improvement,
+        'avg_improvement': (pkg_improvement + proc_improvement + storage_improvement) / 3,
+    }
+
 
 # ============================================================================
-# LIST OF REMOVED APPS (sample)
+# TEXT REPORT
 # ============================================================================
-print("\n" + "="*80)
-print("🗑️  SAMPLE OF NUKED APPS")
-print("="*80)
-
-removed_apps = [
-    "Google AdServices (tracking/ads)",
-    "Google Bard (AI assistant bloat)",
-    "Google Photos (if you don't use it)",
-    "Samsung Pass (password manager bloat)",
-    "Samsung Game Tools",
-    "Google Voice Access",
-    "Verizon My Verizon app",
-    "Microsoft Office apps",
-    "Spotify (if removed)",
-    "Google Duo/Tachyon",
-    "Samsung Easy Mover",
-    "Android Auto",
-    "And 174 MORE!",
-]
+def print_header():
+    print("="*80)
+    print("🔥 DEBLOAT ANALYSIS: BEFORE vs AFTER 🔥")
+    print("="*80)
+    print()
+
+
+def print_report(before, after, improvements, breakdown=None):
+    print("📊 SUMMARY STATISTICS")
+    print("="*80)
+    print()
+    print(f"TOTAL PACKAGES:")
+    print(f"  Before: {before['total_packages']}")
+    print(f"  After:  {after['total_packages']}")
+    print(f"  🗑️  REMOVED: {improvements['packages_removed']} packages ({improvements['packages_removed']/before['total_packages']*100:.1f}%)")
+    print()
+
+    print(f"USER APPS:")
+    print(f"  Before: {before['user_apps']}")
+    print(f"  After:  {after['user_apps']}")
+    print(f"  🔥 NUKED: {improvements['user_apps_removed']} apps ({improvements['user_apps_removed']/before['user_apps']*100:.1f}%)")
+    print()
+
+    print(f"RUNNING PROCESSES:")
+    print(f"  Before: {before['running_processes']}")
+    print(f"  After:  {after['running_processes']}")
+    print(f"  ⚡ KILLED: {improvements['processes_killed']} processes ({improvements['processes_killed']/before['running_processes']*100:.1f}%)")
+    print()
+
+    print(f"STORAGE:")
+    print(f"  Before: {before['storage_free_gb']:.1f} GB free")
+    print(f"  After:  {after['storage_free_gb']:.1f} GB free")
+    print(f"  💾 GAINED: {improvements['storage_freed_gb']:.2f} GB")
+    print()
+
+    before_bloat_pct = bloat_pct(before)
+    after_bloat_pct = bloat_pct(after)
+
+    print(f"BLOATWARE RATIO:")
+    print(f"  Before: {before_bloat_pct:.1f}% bloatware")
+    print(f"  After:  {after_bloat_pct:.1f}% bloatware")
+    print()
+
+    if breakdown:
+        print(f"BLOAT BY VENDOR:")
+        for label, row in breakdown.items():
+            tag = '' if row['bloat'] else '  (not bloat)'
+            print(f"  {label:<24} {row['before']:>4} → {row['after']:<4} "
+                  f"{-row['removed']:+5d}{tag}")
+        print()
+
+    print("="*80)
+    print()
+
+
+def print_process_diff(diff, top=10):
+    """Processes and RSS per vendor and package between two `ps -A` tables."""
+    processes, rss = diff['processes'], diff['rss_kb']
+    print("⚙️  PROCESS TABLE DIFF")
+    print("="*80)
+    print()
+    print(f"  Stopped: {len(diff['stopped'])} process names    Started: {len(diff['started'])}")
+    print(f"  RSS: {rss['before'] / 1024:,.1f} MB → {rss['after'] / 1024:,.1f} MB "
+          f"({rss['freed'] / 1024:,.1f} MB freed)")
+    print()
+    print("  By vendor:")
+    for label, row in diff['by_label'].items():
+        print(f"    {label:<24} {row['before']:>5} → {row['after']:<5} {row['rss_freed_kb'] / 1024:>9,.1f} MB freed")
+    print()
+    print(f"  Top {top} packages by RSS freed:")
+    for row in diff['by_package'][:top]:
+        print(f"    {row['package']:<48} {row['before']:>3} → {row['after']:<3} "
+              f"{row['rss_freed_kb'] / 1024:>9,.1f} MB")
+    print()
+    print("="*80)
+    print()
+
+
+def print_removed_apps(apps=REMOVED_APPS, title="SAMPLE OF NUKED APPS"):
+    print("\n" + "="*80)
+    print(f"🗑️  {title}")
+    print("="*80)
+
+    for i, app in enumerate(apps, 1):
+        print(f"  {i:2d}. ❌ {app}")
 
-for i, app in enumerate(removed_apps, 1):
-    print(f"  {i:2d}. ❌ {app}")
 
-print("\n" + "="*80)
-print("✅ DEBLOAT ANALYSIS COMPLETE!")
-print("="*80)
+# ============================================================================
+# VISUALIZATION
+# ============================================================================
+DEBLOAT_PANELS = 7
+
+
+def render_debloat_comparison(before, after, improvements, path='debloat_comparison.png', layer=None):
+    """Seven-panel before/after figure, saved to `path`.
+
+    With `layer`, that layer is returned instead (plotting.figure_layer).
+    """
+    import numpy as np
+
+    plt = pyplot()
+
+    fig = plt.figure(figsize=(18, 12))
+    gs = fig.add_gridspec(3, 3, hspace=0.4, wspace=0.3)
+
+    fig.suptitle('🔥 UAD DEBLOAT SUCCESS REPORT 🔥\nBefore vs After Comparison',
+                 fontsize=22, fontweight='bold')
+
+    # ========================================================================
+    # 1. TOTAL PACKAGES COMPARISON (Big impact visual)
+    # ========================================================================
+    ax1 = fig.add_subplot(gs[0, :])
+    categories = ['Before UAD', 'After UAD']
+    values = [before['total_packages'], after['total_packages']]
+    colors = ['#ff6b6b', '#51cf66']
+
+    bars = ax1.bar(categories, values, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
+    ax1.set_ylabel('Total Packages', fontweight='bold', fontsize=14)
+    ax1.set_title(f'📦 TOTAL PACKAGES: {improvements["packages_removed"]} REMOVED!',
+                 fontweight='bold', fontsize=16, pad=20)
+    ax1.set_ylim(0, 600)
+    ax1.grid(axis='y', alpha=0.3)
+
+    # Add value labels
+    for bar, val in zip(bars, values):
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                f'{int(val)}\npackages', ha='center', va='bottom',
+                fontweight='bold', fontsize=14)
+
+    # Add massive removal arrow
+    ax1.annotate('', xy=(1, after['total_packages']), xytext=(0, before['total_packages']),
+                arrowprops=dict(arrowstyle='->', lw=5, color='red'))
+    ax1.text(0.5, (before['total_packages'] + after['total_packages'])/2,
+            f'-{improvements["packages_removed"]}',
+            ha='center', va='center', fontsize=20, fontweight='bold',
+            color='red', bbox=dict(boxstyle='round', facecolor='white', edgecolor='red', linewidth=3))
+
+    # ========================================================================
+    # 2. USER APPS DESTRUCTION
+    # ========================================================================
+    ax2 = fig.add_subplot(gs[1, 0])
+    labels = ['Kept', 'Removed']
+    sizes = [after['user_apps'], improvements['user_apps_removed']]
+    colors_pie = ['#51cf66', '#ff6b6b']
+    explode = (0.1, 0)
+
+    wedges, texts, autotexts = ax2.pie(sizes, explode=explode, labels=labels, colors=colors_pie,
+                                         autopct='%1.1f%%', startangle=90,
+                                         textprops={'fontweight': 'bold', 'fontsize': 12})
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(14)
+
+    ax2.set_title(f'🗑️ USER APPS NUKED\n{improvements["user_apps_removed"]}/{before["user_apps"]} Removed',
+                 fontweight='bold', fontsize=13, pad=15)
+
+    # ========================================================================
+    # 3. SYSTEM APPS (Stayed about the same - harder to remove)
+    # ========================================================================
+    ax3 = fig.add_subplot(gs[1, 1])
+    x = ['Before', 'After']
+    sys_values = [before['system_apps'], after['system_apps']]
+    bars = ax3.bar(x, sys_values, color=['#ffd93d', '#ffd93d'], edgecolor='black', linewidth=2, alpha=0.8)
+    ax3.set_ylabel('System Apps', fontweight='bold', fontsize=11)
+    ax3.set_title('🔧 SYSTEM APPS\n(Harder to Remove)', fontweight='bold', fontsize=13, pad=15)
+    ax3.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, sys_values):
+        height = bar.get_height()
+        ax3.text(bar.get_x() + bar.get_width()/2., height,
+                f'{int(val)}', ha='center', va='bottom',
+                fontweight='bold', fontsize=12)
+
+    # ========================================================================
+    # 4. RUNNING PROCESSES
+    # ========================================================================
+    ax4 = fig.add_subplot(gs[1, 2])
+    x = ['Before', 'After']
+    proc_values = [before['running_processes'], after['running_processes']]
+    bars = ax4.bar(x, proc_values, color=['#ff6b6b', '#51cf66'], edgecolor='black', linewidth=2, alpha=0.8)
+    ax4.set_ylabel('Processes', fontweight='bold', fontsize=11)
+    ax4.set_title(f'⚡ PROCESSES KILLED\n-{improvements["processes_killed"]} Processes',
+                 fontweight='bold', fontsize=13, pad=15)
+    ax4.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, proc_values):
+        height = bar.get_height()
+        ax4.text(bar.get_x() + bar.get_width()/2., height,
+                f'{int(val)}', ha='center', va='bottom',
+                fontweight='bold', fontsize=12)
+
+    # ========================================================================
+    # 5. STORAGE FREED
+    # ========================================================================
+    ax5 = fig.add_subplot(gs[2, 0])
+    storage_labels = ['Before\nFree', 'After\nFree', 'Gained']
+    storage_values = [before['storage_free_gb'], after['storage_free_gb'], improvements['storage_freed_gb']]
+    colors_storage = ['#ffd93d', '#51cf66', '#4ecdc4']
+
+    bars = ax5.bar(storage_labels, storage_values, color=colors_storage, edgecolor='black',
+                  linewidth=2, alpha=0.8)
+    ax5.set_ylabel('Storage (GB)', fontweight='bold', fontsize=11)
+    ax5.set_title('💾 STORAGE RECLAIMED', fontweight='bold', fontsize=13, pad=15)
+    ax5.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, storage_values):
+        height = bar.get_height()
+        ax5.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.2f}\nGB', ha='center', va='bottom',
+                fontweight='bold', fontsize=11)
+
+    # ========================================================================
+    # 6. BLOATWARE PERCENTAGE
+    # ========================================================================
+    ax6 = fig.add_subplot(gs[2, 1])
+    x_pos = np.arange(2)
+    bloat_pcts = [bloat_pct(before), bloat_pct(after)]
+    colors_bloat = ['#ff6b6b', '#ff8800']
+
+    bars = ax6.bar(x_pos, bloat_pcts, color=colors_bloat, edgecolor='black', linewidth=2, alpha=0.8)
+    ax6.set_xticks(x_pos)
+    ax6.set_xticklabels(['Before', 'After'])
+    ax6.set_ylabel('Percentage', fontweight='bold', fontsize=11)
+    ax6.set_title('📊 BLOATWARE RATIO', fontweight='bold', fontsize=13, pad=15)
+    ax6.set_ylim(0, 100)
+    ax6.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, bloat_pcts):
+        height = bar.get_height()
+        ax6.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.1f}%', ha='center', va='bottom',
+                fontweight='bold', fontsize=12)
+
+    # ========================================================================
+    # 7. OVERALL IMPROVEMENT SCORE
+    # ========================================================================
+    ax7 = fig.add_subplot(gs[2, 2])
+    ax7.axis('off')
+
+    score = improvement_score(before, improvements)
+    score_text = dedent(f"""
+    🏆 DEBLOAT SUCCESS SCORE
+
+    Overall Improvement:
+    {score['avg_improvement']:.1f}%
+
+    Breakdown:
+    ━━━━━━━━━━━━━━━━━━━━━
+    ✓ Packages: -{score['pkg_improvement']:.1f}%
+    ✓ Processes: -{score['proc_improvement']:.1f}%
+    ✓ Storage: +{score['storage_improvement']:.1f}%
+
+    Status: EXCELLENT!
+    Your phone is now
+    {improvements['packages_removed']} apps lighter!
+    """)
+
+    ax7.text(0.1, 0.95, score_text, transform=ax7.transAxes,
+            fontsize=11, verticalalignment='top', fontfamily='monospace',
+            bbox=dict(boxstyle='round', facecolor='#d4f1d4', alpha=0.9, pad=1.5,
+                     edgecolor='#51cf66', linewidth=3))
+
+    with span('savefig'):
+        saved = save_figure(fig, path, layer, facecolor='white')
+    plt.close(fig)
+    return saved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Package/process counts before vs after debloat.')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--text', action='store_true', help='text report only, no figure')
+    mode.add_argument('--json', action='store_true', help='JSON results only, no figure')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always re-render the figure (skip the render cache)')
+    parser.add_argument('--packages', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='`pm list packages -f` dumps or capture folders to diff '
+                             '(default: recorded counts)')
+    parser.add_argument('--processes', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='`ps -A` dumps or capture folders to diff (default: recorded counts)')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # Keep --json output parseable: the profile table goes to stderr
+    with profiling_from_args(args, sys.stderr if args.json else None):
+        run(args)
+
+
+def run(args):
+    before = recorded_capture('before')
+    after = recorded_capture('after')
+    diff = breakdown = None
+    if args.packages:
+        with span('load'):
+            before_inventory, after_inventory = (load_inventory(path) for path in args.packages)
+            before.update(before_inventory.counts())
+            after.update(after_inventory.counts())
+        with span('diff'):
+            diff = diff_inventories(before_inventory, after_inventory)
+        with span('classify'):
+            classifier = BloatClassifier()
+            breakdown = vendor_breakdown(before_inventory, after_inventory, classifier)
+            before['bloat_packages'] = classifier.bloat_count(before_inventory.paths.keys())
+            after['bloat_packages'] = classifier.bloat_count(after_inventory.paths.keys())
+    process_diff = None
+    if args.processes:
+        # numpy-backed; only imported when real process tables are asked for
+        from ps_parser import diff_process_tables, load_process_table
+
+        with span('load'):
+            before_table, after_table = (load_process_table(path) for path in args.processes)
+            before['running_processes'] = len(before_table)
+            after['running_processes'] = len(after_table)
+        with span('diff'):
+            process_diff = diff_process_tables(before_table, after_table)
+    with span('improvements'):
+        improvements = compute_improvements(before, after)
+
+    if args.json:
+        print(json.dumps({
+            'before': before,
+            'after': after,
+            'improvements': improvements,
+            'bloat_pct': {'before': bloat_pct(before), 'after': bloat_pct(after)},
+            'improvement_score': improvement_score(before, improvements),
+            'vendor_breakdown': breakdown,
+            'package_diff': diff,
+            'process_diff': process_diff,
+        }, indent=2))
+        return
+
+    with span('report'):
+        print_header()
+        print_report(before, after, improvements, breakdown)
+        if process_diff:
+            print_process_diff(process_diff)
+
+    if not args.text:
+        print("🎨 Creating comparison visualizations...")
+        with span('render'):
+            render_cached(render_debloat_comparison, before, after, improvements,
+                          path='debloat_comparison.png', cache=not args.no_cache)
+        print("✅ Visualization saved: debloat_comparison.png")
+
+    with span('removed_apps'):
+        if diff:
+            print_removed_apps(diff['removed'], f"NUKED APPS ({len(diff['removed'])})")
+        else:
+            print_removed_apps()
+
+    print("\n" + "="*80)
+    print("✅ DEBLOAT ANALYSIS COMPLETE!")
+    print("="*80)
+
+
+if __name__ == '__main__':
+    main()
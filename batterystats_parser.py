@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+"""
+BATTERYSTATS PARSER - Incremental reader for the `Battery History` block
+
+Turns `dumpsys batterystats` history lines into a compact time series of
+battery level, charge state and wakelock events. Progress is checkpointed
+as a byte offset plus a small state snapshot, so when a new capture of the
+same device is appended to the dump file only the new lines are parsed.
+
+Checkpoint directory layout:
+    state.json      offset, parser state, series lengths, wakelock tag table
+    time_ms.bin     int64   sample timestamps (device wall clock as UTC epoch ms, or ms since start)
+    level.bin       int8    battery level at each sample
+    charging.bin    int8    1 while plugged in / charging
+    wl_time_ms.bin  int64   wakelock event timestamps
+    wl_sign.bin     int8    +1 acquire, -1 release
+    wl_tag.bin      int32   index into the tag table (-1 = untagged)
+
+Usage:
+    python3 batterystats_parser.py batterystats.txt [checkpoint_dir]
+"""
+
+import io
+import json
+import os
+import re
+import sys
+from array import array
+from datetime import datetime, timezone
+
+# ============================================================================
+# LINE PATTERNS
+# ============================================================================
+# "           +1h02m03s004ms (2) 097 status=discharging -wake_lock"
+_HISTORY_RE = re.compile(r'\s+(0|\+[0-9dhms]+) \(\d+\) ?(\d{3})?(.*)$')
+_DURATION_RE = re.compile(
+    r'\+(?:(\d+)d)?(?:(\d+)h)?(?:(\d+)m(?!s))?(?:(\d+)s)?(?:(\d+)ms)?$'
+)
+_TIME_RE = re.compile(r'TIME:\s*(\d{4}-\d{2}-\d{2}-\d{2}:\d{2}:\d{2})')
+_WAKELOCK_RE = re.compile(r'([+-])(?:wake_lock|Ewl)(?:=(\S+))?')
+_HEADER = 'Battery History'
+# The history block ends at the first blank or unindented line
+_BLOCK_END_RE = re.compile(rb'\n(?![ \t])')
+
+_SERIES = {
+    'time_ms': 'q',
+    'level': 'b',
+    'charging': 'b',
+    'wl_time_ms': 'q',
+    'wl_sign': 'b',
+    'wl_tag': 'i',
+}
+
+_CHARGING_STATUS = ('charging', 'full')
+
+
+def parse_duration_ms(token):
+    """'+1h02m03s004ms' -> 3723004. A bare '0' is the start of history."""
+    if token == '0':
+        return 0
+    match = _DURATION_RE.match(token)
+    if not match:
+        return None
+    d, h, m, s, ms = (int(x) if x else 0 for x in match.groups())
+    return (((d * 24 + h) * 60 + m) * 60 + s) * 1000 + ms
+
+
+def _initial_state():
+    return {
+        'offset': 0,
+        'in_history': False,
+        'base_ms': 0,           # wall clock of the last RESET/TIME marker
+        'last_ms': 0,
+        'level': -1,
+        'charging': 0,
+        'temp': -1,             # last battery temperature, tenths of a degree C
+        'lines_parsed': 0,
+        'lengths': {name: 0 for name in _SERIES},
+        'tags': [],
+    }
+
+
+class BatteryHistory:
+    """Checkpointed batterystats history for one device."""
+
+    def __init__(self, checkpoint_dir=None):
+        self.checkpoint_dir = checkpoint_dir
+        self.state = _initial_state()
+        if checkpoint_dir and os.path.exists(os.path.join(checkpoint_dir, 'state.json')):
+            with open(os.path.join(checkpoint_dir, 'state.json')) as f:
+                self.state = json.load(f)
+            # Checkpoints from older versions lack newer state keys
+            for key, value in _initial_state().items():
+                self.state.setdefault(key, value)
+        self._tag_ids = {tag: i for i, tag in enumerate(self.state['tags'])}
+        self._pending = {name: array(code) for name, code in _SERIES.items()}
+
+    # ------------------------------------------------------------------------
+    # Parsing
+    # ------------------------------------------------------------------------
+    def update(self, path):
+        """Parse lines appended to `path` since the last checkpoint.
+
+        Returns the number of new lines read. Only complete lines count, so
+        a capture that is still being written is picked up next time.
+        """
+        if os.path.getsize(path) < self.state['offset']:
+            # File was rotated or truncated: start over
+            self._restart()
+        with open(path, 'rb') as f:
+            f.seek(self.state['offset'])
+            return self._consume(f)
+
+    def update_bytes(self, data):
+        """update() for a dump held in memory, e.g. polled from a live device.
+
+        `data` is the whole `dumpsys batterystats` output. Between polls
+        only the Battery History block grows: its header line and the
+        sections after it (Per-PID Stats, Statistics since last charge)
+        change size every time. So the block is found afresh in each dump,
+        the offset counts from its first event, and only events past the
+        offset are parsed. A shorter block means the history was reset.
+        """
+        header = data.find(_HEADER.encode())
+        if header < 0:
+            return 0
+        start = data.find(b'\n', header) + 1
+        if not start:
+            return 0
+        end = _BLOCK_END_RE.search(data, start - 1)
+        end = len(data) if end is None else end.start() + 1
+        if end - start < self.state['offset']:
+            self._restart()
+        self.state['in_history'] = True
+        return self._consume(io.BytesIO(data[start + self.state['offset']:end]))
+
+    def update_stream(self, raw_lines):
+        """update() for binary lines that cannot be seeked, e.g. a zip member.
+
+        The lines are taken to follow the last offset: pass a whole dump to
+        a fresh history, or only what was appended to a resumed one.
+        """
+        return self._consume(raw_lines)
+
+    def _restart(self):
+        self._reset_checkpoint()
+        self.state = _initial_state()
+        self._tag_ids = {}
+        for pending in self._pending.values():
+            del pending[:]
+
+    def _consume(self, raw_lines):
+        state = self.state
+        new_lines = 0
+        for raw in raw_lines:
+            if not raw.endswith(b'\n'):
+                break
+            state['offset'] += len(raw)
+            new_lines += 1
+            self._parse_line(raw.decode('utf-8', 'replace'))
+
+        state['lines_parsed'] += new_lines
+        if self.checkpoint_dir:
+            self.save()
+        return new_lines
+
+    def _parse_line(self, line):
+        state = self.state
+        if line.startswith(_HEADER):
+            state['in_history'] = True
+            return
+        if not state['in_history']:
+            return
+
+        match = _HISTORY_RE.match(line)
+        if not match:
+            if not line.strip() or not line[0].isspace():
+                state['in_history'] = False
+            return
+
+        offset_ms = parse_duration_ms(match.group(1))
+        if offset_ms is None:
+            return
+        rest = match.group(3)
+
+        if 'TIME:' in rest:
+            stamp = _TIME_RE.search(rest)
+            if stamp:
+                # The device's wall clock, pinned to UTC: the analysing machine's zone must not matter
+                wall = datetime.strptime(stamp.group(1), '%Y-%m-%d-%H:%M:%S').replace(tzinfo=timezone.utc)
+                state['base_ms'] = int(wall.timestamp() * 1000) - offset_ms
+        now = state['base_ms'] + offset_ms
+        state['last_ms'] = now
+
+        level = int(match.group(2)) if match.group(2) else state['level']
+        charging = state['charging']
+        if 'status=' in rest or 'plugged' in rest or 'temp=' in rest:
+            for token in rest.split():
+                if token.startswith('status='):
+                    charging = 1 if token[7:] in _CHARGING_STATUS else 0
+                elif token == '+plugged':
+                    charging = 1
+                elif token == '-plugged':
+                    charging = 0
+                elif token.startswith('temp=') and token[5:].isdigit():
+                    state['temp'] = int(token[5:])
+
+        if level != state['level'] or charging != state['charging']:
+            state['level'] = level
+            state['charging'] = charging
+            self._pending['time_ms'].append(now)
+            self._pending['level'].append(level)
+            self._pending['charging'].append(charging)
+
+        if 'wake_lock' in rest or 'Ewl' in rest:
+            for sign, tag in _WAKELOCK_RE.findall(rest):
+                self._pending['wl_time_ms'].append(now)
+                self._pending['wl_sign'].append(1 if sign == '+' else -1)
+                self._pending['wl_tag'].append(self._tag_id(tag) if tag else -1)
+
+    def _tag_id(self, tag):
+        tag_id = self._tag_ids.get(tag)
+        if tag_id is None:
+            tag_id = len(self.state['tags'])
+            self.state['tags'].append(tag)
+            self._tag_ids[tag] = tag_id
+        return tag_id
+
+    # ------------------------------------------------------------------------
+    # Checkpointing
+    # ------------------------------------------------------------------------
+    def save(self):
+        """Append pending samples to the series files, then commit state.json.
+
+        Series are written before the state, and readers truncate to the
+        lengths recorded in state.json, so a crash between the two steps
+        never exposes half-written samples.
+        """
+        os.makedirs(self.checkpoint_dir, exist_ok=True)
+        lengths = self.state['lengths']
+        for name, pending in self._pending.items():
+            path = os.path.join(self.checkpoint_dir, f'{name}.bin')
+            with open(path, 'ab') as f:
+                f.truncate(lengths[name] * pending.itemsize)
+                pending.tofile(f)
+            lengths[name] += len(pending)
+            del pending[:]
+
+        tmp = os.path.join(self.checkpoint_dir, 'state.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.state, f)
+        os.replace(tmp, os.path.join(self.checkpoint_dir, 'state.json'))
+
+    def _reset_checkpoint(self):
+        if not self.checkpoint_dir:
+            return
+        for name in _SERIES:
+            path = os.path.join(self.checkpoint_dir, f'{name}.bin')
+            if os.path.exists(path):
+                os.remove(path)
+
+    def timeline(self):
+        """Load the full time series as a dict of arrays plus the tag table."""
+        series = {}
+        for name, code in _SERIES.items():
+            values = array(code)
+            length = self.state['lengths'][name]
+            if self.checkpoint_dir and length:
+                with open(os.path.join(self.checkpoint_dir, f'{name}.bin'), 'rb') as f:
+                    values.fromfile(f, length)
+            values.extend(self._pending[name])
+            series[name] = values
+        series['tags'] = list(self.state['tags'])
+        return series
+
+
+# ============================================================================
+# DRAIN ANALYSIS
+# ============================================================================
+def worst_drain(timeline, window_hours=24):
+    """Largest cumulative discharge (percentage points) inside any window.
+
+    Charging refills the battery, so a device that cycles while plugged in
+    can "drain" more than 100% in a day - the October Incident.
+    Returns (drain_pct, window_start_ms).
+    """
+    times = timeline['time_ms']
+    levels = timeline['level']
+    window_ms = window_hours * 3600 * 1000
+
+    drops = []
+    for i in range(1, len(levels)):
+        if levels[i - 1] >= 0 and levels[i] < levels[i - 1]:
+            drops.append((times[i], levels[i - 1] - levels[i]))
+
+    best = (0, times[0] if len(times) else 0)
+    total = 0
+    start = 0
+    for end in range(len(drops)):
+        total += drops[end][1]
+        while drops[end][0] - drops[start][0] > window_ms:
+            total -= drops[start][1]
+            start += 1
+        if total > best[0]:
+            best = (total, drops[start][0])
+    return best
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print(__doc__.strip())
+        sys.exit(1)
+
+    history = BatteryHistory(sys.argv[2] if len(sys.argv) == 3 else None)
+    new_lines = history.update(sys.argv[1])
+    timeline = history.timeline()
+    drain, start_ms = worst_drain(timeline)
+
+    print("="*80)
+    print("🔋 BATTERY HISTORY")
+    print("="*80)
+    print(f"  New lines parsed:  {new_lines:,} (total {history.state['lines_parsed']:,})")
+    print(f"  Level samples:     {len(timeline['level']):,}")
+    print(f"  Wakelock events:   {len(timeline['wl_sign']):,} ({len(timeline['tags'])} tags)")
+    print(f"  Worst 24h drain:   {drain}%")
+    if drain > 100:
+        print("  💥 More than a full battery in one day - metabolic crisis!")
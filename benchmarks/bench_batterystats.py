@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: incremental batterystats history parsing
+
+Parses one capture from scratch, then appends a second capture to the same
+file and resumes from the checkpoint. The resumed run should cost about
+the size of the new capture, not the whole file.
+
+Usage:
+    python3 benchmarks/bench_batterystats.py [captures_already_on_file]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from batterystats_parser import BatteryHistory, worst_drain  # noqa: E402
+from synthetic_dumps import batterystats_lines  # noqa: E402
+
+
+def _append(path, seed):
+    with open(path, 'a', encoding='utf-8') as f:
+        f.writelines(batterystats_lines(seed=seed))
+
+
+def main():
+    history_captures = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+
+    with tempfile.TemporaryDirectory() as tmp:
+        dump = os.path.join(tmp, 'batterystats.txt')
+        ckpt = os.path.join(tmp, 'checkpoint')
+        for seed in range(history_captures):
+            _append(dump, seed)
+
+        start = time.perf_counter()
+        history = BatteryHistory(ckpt)
+        full_lines = history.update(dump)
+        full_ms = (time.perf_counter() - start) * 1000
+
+        _append(dump, history_captures)
+        start = time.perf_counter()
+        resumed = BatteryHistory(ckpt)
+        new_lines = resumed.update(dump)
+        resume_ms = (time.perf_counter() - start) * 1000
+
+        # Resumed state must match a from-scratch parse of the whole file
+        fresh = BatteryHistory()
+        fresh.update(dump)
+        a, b = resumed.timeline(), fresh.timeline()
+        assert all(a[name] == b[name] for name in a), "resume diverged from full parse"
+        drain, _ = worst_drain(b)
+
+    print("="*80)
+    print("⏱️  BATTERYSTATS INCREMENTAL BENCHMARK")
+    print("="*80)
+    print(f"  Full parse:    {full_lines:,} lines in {full_ms:.1f} ms")
+    print(f"  Resume:        {new_lines:,} new lines in {resume_ms:.1f} ms")
+    print(f"  Speedup:       {full_ms / resume_ms:.1f}x (ideal {full_lines / new_lines:.1f}x)")
+    print(f"  Worst 24h drain: {drain}%")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
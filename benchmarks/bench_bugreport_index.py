@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: pulling one dumpsys section out of a large bugreport
+
+Writes a synthetic bugreport of about SIZE_MB (logcat around the meminfo,
+batterystats and usagestats services) and times:
+
+    line scan     reading the file line by line up to the end of meminfo,
+                  which is what a plain text parser has to do
+    first open    scanning for section headers and writing the sidecar
+    indexed open  loading the sidecar, mapping the file and copying out
+                  meminfo (best of 5)
+
+The indexed meminfo section is parsed and checked against the line scan.
+
+Usage:
+    python3 benchmarks/bench_bugreport_index.py [size_mb]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bugreport_index import BugreportIndex  # noqa: E402
+from meminfo_parser import parse_meminfo  # noqa: E402
+from synthetic_dumps import bugreport_lines, write_lines  # noqa: E402
+
+BYTES_PER_LOG_LINE = 108
+
+
+def line_scan_meminfo(path):
+    """Meminfo lines found by reading the bugreport from the top."""
+    lines = []
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        for line in f:
+            if line.startswith('DUMP OF SERVICE meminfo'):
+                break
+        for line in f:
+            if line.startswith('---'):
+                break
+            lines.append(line)
+    return lines
+
+
+def main():
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bugreport.txt')
+        start = time.perf_counter()
+        size = write_lines(path, bugreport_lines(size_mb * 1024 * 1024 // BYTES_PER_LOG_LINE))
+        write_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        expected = parse_meminfo(line_scan_meminfo(path))
+        scan_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        with BugreportIndex(path) as index:
+            sections = len(index.sections)
+        first_ms = (time.perf_counter() - start) * 1000
+
+        best = float('inf')
+        for _ in range(5):
+            start = time.perf_counter()
+            with BugreportIndex(path) as index:
+                assert not index.rebuilt, "sidecar was not reused"
+                section = index.section('meminfo')
+            best = min(best, time.perf_counter() - start)
+        open_ms = best * 1000
+
+        start = time.perf_counter()
+        with BugreportIndex(path) as index:
+            snapshot = parse_meminfo(index.lines('meminfo'))
+        parse_ms = (time.perf_counter() - start) * 1000
+
+    print("="*80)
+    print(f"📑 BUGREPORT INDEX: {size / 1024 / 1024:,.0f} MB, {sections} sections "
+          f"(written in {write_s:.1f} s)")
+    print("="*80)
+    print(f"  Line scan to meminfo:      {scan_ms:10.1f} ms")
+    print(f"  First open (index+sidecar): {first_ms:9.1f} ms")
+    print(f"  Indexed open + meminfo:    {open_ms:10.2f} ms  ({len(section) / 1024:,.0f} KB section)")
+    print(f"  Indexed open + parse:      {parse_ms:10.1f} ms")
+    print(f"  Speed-up over line scan:   {scan_ms / open_ms:10,.0f}x")
+    ok = snapshot == expected
+    print(f"  Check: {'✅ same meminfo as the line scan' if ok else '❌ MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: section-parallel parsing of one bugreport
+
+Writes a synthetic bugreport with large batterystats and usagestats
+sections, then times:
+
+    per section   each known section parsed alone (serial)
+    serial        load_bugreport(workers=1)
+    parallel      load_bugreport(workers=None): one process per section,
+                  unless plan_workers() falls back to serial
+
+The plan and the measured ratio are reported as they come out: on one
+core, or when one section dominates, the load runs serially and shows
+no speed-up. The two captures must be identical.
+
+Usage:
+    python3 benchmarks/bench_bugreport_parallel.py [events_per_section] [workers]
+"""
+
+import io
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bugreport_index import BugreportIndex  # noqa: E402
+from capture_loader import BUGREPORT_SECTIONS, load_bugreport, plan_workers  # noqa: E402
+from synthetic_dumps import bugreport_lines, write_lines  # noqa: E402
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def main():
+    events = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+    workers = int(sys.argv[2]) if len(sys.argv) > 2 else None
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'bugreport.txt')
+        size = write_lines(path, bugreport_lines(200_000, battery_events=events,
+                                                 usage_events=events, n_processes=5_000))
+
+        sections = {}
+        with BugreportIndex(path) as index:
+            spans = {name: index.find(name) for name in BUGREPORT_SECTIONS}
+            plan = plan_workers({name: span for name, span in spans.items() if span}, workers)
+            for name, parse in BUGREPORT_SECTIONS.items():
+                data = index.section(name)
+                _, ms = timed(lambda: parse(io.BytesIO(data)))
+                sections[name] = (len(data), ms)
+
+        serial, serial_ms = timed(lambda: load_bugreport(path))
+        parallel, parallel_ms = timed(lambda: load_bugreport(path, workers=workers))
+
+    largest = max(ms for _, ms in sections.values())
+    print("="*80)
+    print(f"🧵 SECTION-PARALLEL BUGREPORT: {size / 1024 / 1024:,.0f} MB, "
+          f"{os.cpu_count()} core(s), workers={workers or 'auto'}")
+    print("="*80)
+    for name, (nbytes, ms) in sections.items():
+        print(f"  {name:<14} {nbytes / 1024 / 1024:8.1f} MB  {ms:9.1f} ms")
+    print(f"  Serial load:       {serial_ms:9.1f} ms  (sections sum {sum(ms for _, ms in sections.values()):.1f} ms)")
+    print(f"  Parallel load:     {parallel_ms:9.1f} ms  (largest section {largest:.1f} ms, "
+          f"{f'{plan} workers' if plan > 1 else 'serial fallback'})")
+    print(f"  Speed-up:          {serial_ms / parallel_ms:9.2f}x")
+    ok = parallel == serial and list(parallel) == list(serial)
+    print(f"  Check: {'✅ identical capture' if ok else '❌ MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: loading captures straight from zip / tar.gz bundles
+
+Builds N device bundles: before/ holds a bugreport, after/ holds the
+individual dumps. Half are zips and half are tar.gz. Each bundle is then
+loaded two ways:
+
+    extract   unpack to a temp folder, then load_capture_dir() on each half
+    stream    load_archive(): members decompressed straight into the parsers
+
+The streamed captures must equal the extracted ones. The benchmark also
+reports how many bytes each way wrote to disk and the streaming peak heap.
+
+Usage:
+    python3 benchmarks/bench_capture_archive.py [devices] [log_lines_per_bugreport]
+"""
+
+import os
+import shutil
+import sys
+import tarfile
+import tempfile
+import time
+import tracemalloc
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from capture_loader import load_archive, load_capture_dir  # noqa: E402
+from recorded_captures import RECORDED_CAPTURES  # noqa: E402
+from synthetic_dumps import bugreport_lines, write_capture_dir, write_lines  # noqa: E402
+
+
+def build_bundles(out_dir, devices, log_lines):
+    """Write `devices` bundles to out_dir; returns their paths."""
+    staging = os.path.join(out_dir, 'staging')
+    paths = []
+    for i in range(devices):
+        device = f'device-{i:04d}'
+        root = os.path.join(staging, device)
+        os.makedirs(os.path.join(root, 'before'))
+        write_lines(os.path.join(root, 'before', 'bugreport.txt'), bugreport_lines(log_lines, seed=i))
+        write_capture_dir(os.path.join(root, 'after'), RECORDED_CAPTURES['after'], seed=i)
+        if i % 2:
+            path = os.path.join(out_dir, f'{device}.tar.gz')
+            with tarfile.open(path, 'w:gz') as archive:
+                archive.add(root, arcname=device)
+        else:
+            path = os.path.join(out_dir, f'{device}.zip')
+            with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as archive:
+                for folder, _, files in os.walk(root):
+                    for name in files:
+                        full = os.path.join(folder, name)
+                        archive.write(full, os.path.relpath(full, staging))
+        shutil.rmtree(root)
+        paths.append(path)
+    shutil.rmtree(staging)
+    return paths
+
+
+def load_extracted(path, scratch):
+    """The old workflow: unpack everything, then parse the folders."""
+    target = tempfile.mkdtemp(dir=scratch)
+    if path.endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            archive.extractall(target)
+    else:
+        with tarfile.open(path) as archive:
+            archive.extractall(target, filter='data')
+    written = sum(os.path.getsize(os.path.join(folder, name))
+                  for folder, _, files in os.walk(target) for name in files)
+    (device,) = os.listdir(target)
+    captures = {f'{device}/{role}': load_capture_dir(os.path.join(target, device, role))
+                for role in ('after', 'before')}
+    shutil.rmtree(target)
+    return captures, written
+
+
+def main():
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    log_lines = int(sys.argv[2]) if len(sys.argv) > 2 else 20_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        bundles = build_bundles(tmp, devices, log_lines)
+        archive_bytes = sum(os.path.getsize(path) for path in bundles)
+        scratch = os.path.join(tmp, 'scratch')
+        os.makedirs(scratch)
+
+        # Alternate the two ways bundle by bundle so both see the same cache state
+        extracted, streamed = [], []
+        written = extract_s = stream_s = 0
+        before_files = set(os.listdir(tmp))
+        for path in bundles:
+            start = time.perf_counter()
+            captures, nbytes = load_extracted(path, scratch)
+            extract_s += time.perf_counter() - start
+            extracted.append(captures)
+            written += nbytes
+
+            start = time.perf_counter()
+            streamed.append(load_archive(path))
+            stream_s += time.perf_counter() - start
+        # Only the extract scratch folder may have appeared
+        stream_written = len(set(os.listdir(tmp)) ^ before_files) + len(os.listdir(scratch))
+
+        tracemalloc.start()
+        load_archive(bundles[0])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    print("="*80)
+    print(f"📦 CAPTURE ARCHIVES: {devices:,} bundles, {archive_bytes / 1024 / 1024:,.1f} MB compressed")
+    print("="*80)
+    print(f"  Extract + load:   {extract_s:7.2f} s  ({written / 1024 / 1024:,.1f} MB written to disk)")
+    print(f"  Stream + load:    {stream_s:7.2f} s  ({stream_written} files written)")
+    print(f"  Speed-up:         {extract_s / stream_s:7.2f}x")
+    print(f"  Stream peak heap: {peak / 1024 / 1024:7.1f} MB per bundle")
+    ok = streamed == extracted and not stream_written
+    print(f"  Check: {'✅ identical captures, nothing extracted' if ok else '❌ MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: a month of per-minute captures in the chromosome time series
+
+Appends one capture per minute for 30 days to a fresh SnapshotStore, one
+append() call at a time as a capture loop would, then reads the six
+chromosomes back, computes hourly min/max/mean/p95 and a 1,000-point plot
+envelope. Hourly aggregates are checked against a per-hour NumPy loop.
+
+Usage:
+    python3 benchmarks/bench_chromosome_series.py [days]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from chromosome_series import HOUR_MS, chromosome_series, downsample, window_aggregates  # noqa: E402
+from genetic_score import CHROMOSOMES  # noqa: E402
+from recorded_captures import RECORDED_CAPTURES, RECORDED_DEVICE  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+
+START_MS = 1_760_832_000_000     # 2025-10-19 00:00 UTC
+
+
+def minute_captures(days, seed=0):
+    rng = random.Random(seed)
+    base = RECORDED_CAPTURES['before']
+    for minute in range(days * 24 * 60):
+        capture = {key: int(base[key] * rng.uniform(0.8, 1.2)) for _, key, _ in CHROMOSOMES}
+        capture['captured_at_ms'] = START_MS + minute * 60_000
+        yield capture
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SnapshotStore(os.path.join(tmp, 'store'))
+        append_us = []
+        start = time.perf_counter()
+        for capture in minute_captures(days):
+            t = time.perf_counter()
+            store.append(capture, RECORDED_DEVICE)
+            append_us.append((time.perf_counter() - t) * 1e6)
+        append_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        store = SnapshotStore(os.path.join(tmp, 'store'))
+        times, series = chromosome_series(store)
+        load_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        hourly = {key: window_aggregates(times, values) for key, values in series.items()}
+        aggregate_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        envelopes = {key: downsample(times, values, 1000) for key, values in series.items()}
+        downsample_ms = (time.perf_counter() - start) * 1000
+
+        key = CHROMOSOMES[1][1]
+        stats = hourly[key]
+        for i in range(0, len(stats['count']), 97):
+            hour = series[key][(times >= stats['window_start_ms'][i])
+                               & (times < stats['window_start_ms'][i] + HOUR_MS)]
+            assert stats['min'][i] == hour.min() and stats['max'][i] == hour.max()
+            assert np.isclose(stats['mean'][i], hour.mean())
+            assert np.isclose(stats['p95'][i], np.percentile(hour, 95))
+        assert all(len(t) <= 1000 for t, _ in envelopes.values())
+
+    p99 = sorted(append_us)[int(len(append_us) * 0.99)]
+    print("="*80)
+    print("⏱️  CHROMOSOME SERIES BENCHMARK")
+    print("="*80)
+    print(f"  Captures:      {len(times):,} ({days} days, one per minute)")
+    print(f"  Append:        {append_s / len(times) * 1e6:.0f} us mean, {p99:.0f} us p99, "
+          f"{max(append_us) / 1000:.1f} ms worst (capacity doublings)")
+    print(f"  Load series:   {load_ms:.1f} ms (6 chromosomes, memory-mapped)")
+    print(f"  Hourly stats:  {aggregate_ms:.1f} ms ({len(stats['count']):,} hours x 6, checked)")
+    print(f"  Downsample:    {downsample_ms:.1f} ms (6 x 1,000-point envelopes)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: vendor classification of a million process names
+
+Draws process names (with `:service` suffixes, as `ps -A` prints them)
+from a pool of distinct package names and classifies them all with one
+BloatClassifier. The cold run labels every distinct name through the trie
+once; the warm run is all memo hits, as for the next capture of a fleet.
+First checks the rule matching on CASES: bare prefixes, `:process`
+suffixes, near misses and tab-separated rule files.
+
+Usage:
+    python3 benchmarks/bench_classifier.py [n_names] [distinct_names]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bloat_classifier import UNMATCHED, BloatClassifier, parse_rules  # noqa: E402
+from synthetic_dumps import package_name  # noqa: E402
+
+SUFFIXES = ('', '', '', ':remote', ':service', ':push', ':ui')
+
+# (name, label) pairs the built-in rules must produce
+CASES = (
+    ('com.google.android.gms', 'Google Play Services'),
+    ('com.google.android.gms:persistent', 'Google Play Services'),
+    ('com.google.android.gms.unstable', 'Google Play Services'),
+    ('com.google.android.gmsx', 'Google'),
+    ('com.samsung.android.knox', 'Samsung Knox'),
+    ('com.samsung.android.knox.attestation:remote', 'Samsung Knox'),
+    ('com.samsung', 'Samsung'),
+    ('com.whatsapp:push', 'Meta'),
+    ('com.whatsapp.w4b', UNMATCHED),
+    ('android', 'Android'),
+    ('org.example.app', UNMATCHED),
+)
+RULE_LINES = ('com.example.*\tExample Vendor', 'org.sample.app  \t Sample  # comment', 'com.bare')
+RULES = [('com.example.*', 'Example Vendor'), ('org.sample.app', 'Sample'), ('com.bare', UNMATCHED)]
+
+
+def check_rules():
+    """Names in CASES that get the wrong label, plus a rule-file parse check."""
+    classifier = BloatClassifier()
+    wrong = [(name, classifier.classify(name), label) for name, label in CASES
+             if classifier.classify(name) != label]
+    if parse_rules(RULE_LINES) != RULES:
+        wrong.append(('rule file', parse_rules(RULE_LINES), RULES))
+    return wrong
+
+
+def main():
+    n_names = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    distinct = int(sys.argv[2]) if len(sys.argv) > 2 else 50_000
+
+    wrong = check_rules()
+    rng = random.Random(0)
+    pool = [package_name(rng, i) + rng.choice(SUFFIXES) for i in range(distinct)]
+    names = rng.choices(pool, k=n_names)
+
+    classifier = BloatClassifier()
+    start = time.perf_counter()
+    cold = classifier.counts(names)
+    cold_ms = (time.perf_counter() - start) * 1000
+
+    start = time.perf_counter()
+    warm = classifier.counts(names)
+    warm_ms = (time.perf_counter() - start) * 1000
+    assert cold == warm
+
+    print("="*80)
+    print("⏱️  BLOAT CLASSIFIER BENCHMARK")
+    print("="*80)
+    print(f"  Names:       {n_names:,} ({distinct:,} distinct)")
+    print(f"  Cold run:    {cold_ms:.0f} ms")
+    print(f"  Warm run:    {warm_ms:.0f} ms")
+    for label, count in cold.items():
+        print(f"    {label:<24} {count:>9,}")
+    if wrong:
+        print(f"  Check: ❌ wrong labels (name, got, expected): {wrong}")
+    else:
+        print(f"  Check: ✅ {len(CASES)} rule cases and a tab-separated rule file")
+    return 0 if not wrong else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
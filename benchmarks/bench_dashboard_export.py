@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: dashboard history export for a month of per-minute captures
+
+Fills a SnapshotStore with one capture per minute for 30 days, exports the
+dashboard history (dashboard_export.py) and reports, for a few chart
+windows, which resolution the dashboard would pick and how many bytes it
+would fetch, against shipping every capture as one JSON file.
+
+Resolution choice mirrors pickResolution() in react-app/src/historyLoader.js.
+
+Usage:
+    python3 benchmarks/bench_dashboard_export.py [days]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from dashboard_export import DAY_MS, device_history, export_history  # noqa: E402
+from chromosome_series import HOUR_MS  # noqa: E402
+from recorded_captures import RECORDED_CAPTURES, RECORDED_DEVICE  # noqa: E402
+from snapshot_store import SnapshotStore  # noqa: E402
+
+START_MS = 1_760_832_000_000     # 2025-10-19 00:00 UTC
+MAX_POINTS = 500
+
+
+def minute_captures(days, seed=0):
+    rng = random.Random(seed)
+    base = RECORDED_CAPTURES['before']
+    for minute in range(days * 24 * 60):
+        capture = {key: int(value * rng.uniform(0.9, 1.1)) for key, value in base.items()
+                   if key.endswith('_kb')}
+        capture.update(
+            captured_at_ms=START_MS + minute * 60_000,
+            total_ram_kb=base['total_ram_kb'],
+            swap_total_kb=12_582_908,
+            battery_level=100 - minute // 15 % 100,
+            battery_temp_c=round(rng.uniform(25, 40), 1),
+            total_packages=base['total_packages'],
+            system_apps=base['system_apps'],
+            running_processes=base['running_processes'] + rng.randint(-30, 30),
+        )
+        yield capture
+
+
+def visible_chunks(manifest, start_ms, end_ms):
+    """(resolution, chunks) the dashboard fetches for one window."""
+    def overlapping(resolution):
+        return [c for c in resolution['chunks'] if c['end_ms'] > start_ms and c['start_ms'] <= end_ms]
+
+    def rows(resolution):
+        return sum(c['rows'] * (min(c['end_ms'], end_ms + 1) - max(c['start_ms'], start_ms))
+                   / (c['end_ms'] - c['start_ms']) for c in overlapping(resolution))
+
+    for resolution in manifest['resolutions']:
+        if rows(resolution) <= MAX_POINTS:
+            return resolution['name'], overlapping(resolution)
+    resolution = manifest['resolutions'][-1]
+    return resolution['name'], overlapping(resolution)
+
+
+def main():
+    days = int(sys.argv[1]) if len(sys.argv) > 1 else 30
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = SnapshotStore(os.path.join(tmp, 'store'))
+        store.extend(minute_captures(days), RECORDED_DEVICE)
+
+        start = time.perf_counter()
+        times, fields = device_history(store)
+        metrics_ms = (time.perf_counter() - start) * 1000
+
+        out_dir = os.path.join(tmp, 'history')
+        start = time.perf_counter()
+        manifest = export_history(times, fields, out_dir)
+        export_ms = (time.perf_counter() - start) * 1000
+
+        def size(path):
+            return os.path.getsize(os.path.join(out_dir, path))
+
+        # Baseline: every capture in one row-oriented JSON file
+        flat = os.path.join(tmp, 'flat.json')
+        with open(flat, 'w') as f:
+            json.dump([{'t': int(t), **{name: round(float(values[i]), 1) for name, values in fields.items()}}
+                       for i, t in enumerate(times)], f)
+        flat_kb = os.path.getsize(flat) / 1024
+
+        end_ms = int(times[-1])
+        windows = (('last hour', HOUR_MS), ('last day', DAY_MS),
+                   ('last week', 7 * DAY_MS), (f'all {days} days', days * DAY_MS))
+
+        print("="*80)
+        print(f"📤 DASHBOARD EXPORT: {len(times):,} captures, {len(fields)} fields")
+        print("="*80)
+        print(f"  Metrics for every capture: {metrics_ms:8.1f} ms")
+        print(f"  Export (3 resolutions):    {export_ms:8.1f} ms")
+        for resolution in manifest['resolutions']:
+            kb = sum(size(c['path']) for c in resolution['chunks']) / 1024
+            print(f"    {resolution['name']:<4} {len(resolution['chunks']):>4} chunks {kb:>9,.1f} KB")
+        print(f"  Single JSON of all captures: {flat_kb:,.1f} KB\n")
+        print(f"  {'Window':<14} {'Resolution':>10} {'Chunks':>7} {'Fetched':>11} {'vs single file':>15}")
+        for label, span_ms in windows:
+            name, chunks = visible_chunks(manifest, end_ms - span_ms, end_ms)
+            kb = (sum(size(c['path']) for c in chunks) + size('manifest.json')) / 1024
+            print(f"  {label:<14} {name:>10} {len(chunks):>7} {kb:>8,.1f} KB {flat_kb / kb:>14,.0f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: dashboard scores for a million captures, with a JavaScript parity check
+
+Scores a million random captures with dashboard_metrics() in one
+vectorized pass. Then it runs calculateMetrics() from
+react-app/src/dashboardMetrics.js under Node on a sample of them, including
+the recorded liveData and values that sit on .x5 rounding boundaries, and
+requires every score to match bit for bit. The parity check is skipped
+when `node` is not on PATH.
+
+Also counts how many scores np.round() would have got wrong, which is why
+dashboard_metrics uses its own to_fixed1().
+
+Usage:
+    python3 benchmarks/bench_dashboard_metrics.py [captures] [parity_sample]
+"""
+
+import json
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from dashboard_metrics import METRICS, dashboard_metrics  # noqa: E402
+
+JS_METRICS = ROOT / 'react-app' / 'src' / 'dashboardMetrics.js'
+
+INPUTS = ('total', 'free', 'swapTotal', 'swapFree', 'temperature', 'level', 'bloatware')
+
+# calculateMetrics() over arrays of inputs, one liveData object per capture
+NODE_SCRIPT = """
+import { calculateMetrics } from %s
+let text = ''
+for await (const chunk of process.stdin) text += chunk
+const c = JSON.parse(text)
+const out = []
+for (let i = 0; i < c.total.length; i++) {
+  out.push(calculateMetrics({
+    memory: { total: c.total[i], free: c.free[i], swapTotal: c.swapTotal[i], swapFree: c.swapFree[i] },
+    battery: { temperature: c.temperature[i], level: c.level[i] },
+    genetic: { current: { bloatware: c.bloatware[i] } },
+  }))
+}
+process.stdout.write(JSON.stringify(out))
+"""
+
+# liveData from Dashboard.jsx
+LIVE_DATA = {'total': 11381328, 'free': 325720, 'swapTotal': 12582908, 'swapFree': 5912920,
+             'temperature': 28.1, 'level': 74, 'bloatware': 21.5}
+
+
+def random_captures(n, seed=0):
+    rng = np.random.default_rng(seed)
+    total = rng.integers(4, 17, n) * 1024 * 1024 - rng.integers(0, 600_000, n)
+    swap_total = rng.integers(2, 17, n) * 1024 * 1024 - rng.integers(0, 100, n)
+    captures = {
+        'total': total,
+        'free': (total * rng.uniform(0.01, 0.6, n)).astype(np.int64),
+        'swapTotal': swap_total,
+        'swapFree': (swap_total * rng.uniform(0, 1, n)).astype(np.int64),
+        # Sensors report tenths, classifiers any float: mix both
+        'temperature': np.where(rng.random(n) < 0.5, rng.integers(150, 480, n) / 10,
+                                rng.uniform(15, 48, n)),
+        'level': rng.integers(0, 101, n),
+        'bloatware': np.where(rng.random(n) < 0.5, rng.integers(0, 1000, n) / 10,
+                              rng.uniform(0, 100, n)),
+    }
+    for name, value in LIVE_DATA.items():
+        captures[name][0] = value
+    return captures
+
+
+def score(captures):
+    return dashboard_metrics(*(captures[name] for name in INPUTS))
+
+
+def naive_rounding_errors(captures, metrics):
+    """Scores np.round() would have rounded differently from toFixed(1)."""
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ram = np.round((captures['total'] - captures['free']) / captures['total'] * 100, 1)
+        swap = np.round((captures['swapTotal'] - captures['swapFree']) / captures['swapTotal'] * 100, 1)
+    metabolic = np.round((100 - captures['temperature']) * 0.7 + captures['level'] * 0.3, 1)
+    genetic = np.round(100 - captures['bloatware'], 1)
+    return int((ram != metrics['ramUsagePercent']).sum() + (swap != metrics['swapUsagePercent']).sum()
+               + (metabolic != metrics['metabolicEfficiency']).sum()
+               + (genetic != metrics['geneticIntegrity']).sum())
+
+
+def node_metrics(captures):
+    script = NODE_SCRIPT % json.dumps(JS_METRICS.as_uri())
+    payload = json.dumps({name: values.tolist() for name, values in captures.items()})
+    result = subprocess.run(['node', '--input-type=module', '-e', script], input=payload,
+                            capture_output=True, text=True, check=True)
+    rows = json.loads(result.stdout)
+    return {name: np.array([float(row[name]) for row in rows]) for name in METRICS}
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    sample = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+
+    captures = random_captures(n)
+    score(random_captures(10))      # warm-up
+    start = time.perf_counter()
+    metrics = score(captures)
+    score_ms = (time.perf_counter() - start) * 1000
+
+    print("="*80)
+    print(f"🩺 DASHBOARD METRICS: {n:,} captures")
+    print("="*80)
+    print(f"  One vectorized pass:  {score_ms:8.1f} ms ({n / score_ms * 1000:,.0f} captures/s)")
+    print(f"  np.round() would differ from toFixed(1) on {naive_rounding_errors(captures, metrics):,} scores")
+    live = {name: values[0] for name, values in metrics.items()}
+    print(f"  liveData: overall {live['overallHealth']}%, genetic {live['geneticIntegrity']}%, "
+          f"metabolic {live['metabolicEfficiency']}%, cellular {live['cellularHealth']}%")
+
+    if shutil.which('node') is None:
+        print("\n  ⚠️  node not found: JavaScript parity check skipped")
+        return 0
+
+    subset = {name: values[:sample] for name, values in captures.items()}
+    start = time.perf_counter()
+    expected = node_metrics(subset)
+    node_s = time.perf_counter() - start
+    mismatches = {name: int((~((expected[name] == metrics[name][:sample])
+                                | (np.isnan(expected[name]) & np.isnan(metrics[name][:sample])))).sum())
+                  for name in METRICS}
+    print(f"\n  Parity vs calculateMetrics() under Node ({min(n, sample):,} captures, {node_s:.1f} s):")
+    for name, count in mismatches.items():
+        print(f"    {name:<20} {'✅ identical' if not count else f'❌ {count:,} differ'}")
+    return 1 if any(mismatches.values()) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
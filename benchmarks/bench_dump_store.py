@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: deduplicated dump store vs. one gzip per dump
+
+Builds successive bugreports for N devices: each device starts from its
+own report, and every later capture rotates the system log, takes a new
+meminfo and edits a few scattered lines. All of them are added to a
+DumpStore and, for comparison, gzipped one file each. Reports:
+
+    storage       raw bytes, gzip bytes and store bytes
+    per capture   new bytes stored for each later capture vs. the raw
+                  size of the lines that changed
+    section read  meminfo of the last capture: store.section() vs.
+                  decompressing its whole .gz up to the section
+
+Every dump is read back whole and checked against its SHA-256. Two
+edge cases are checked in a scratch store first: an add that fails
+halfway and is then retried, and a binary member without newlines.
+
+Usage:
+    python3 benchmarks/bench_dump_store.py [devices] [captures_per_device] [log_lines]
+"""
+
+import gzip
+import hashlib
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bugreport_index import scan_sections  # noqa: E402
+from dump_store import MAX_CHUNK, DumpStore  # noqa: E402
+from synthetic_dumps import bugreport_lines, logcat_lines, meminfo_lines  # noqa: E402
+
+NEW_LOG_LINES = 2_000
+EDITED_LINES = 50
+
+
+def next_capture(lines, rng, seed):
+    """The next capture of a device; returns its lines and the raw size of what changed.
+
+    The system log rotates (oldest NEW_LOG_LINES out, as many new ones
+    in), meminfo is taken afresh and EDITED_LINES scattered lines change.
+    """
+    log_end = lines.index("------ 2.104s was the duration of 'SYSTEM LOG' ------\n")
+    mem_start = lines.index("DUMP OF SERVICE meminfo:\n") + 1
+    mem_end = next(i for i in range(mem_start, len(lines)) if lines[i].startswith('---'))
+    new_log = list(logcat_lines(NEW_LOG_LINES, seed=seed))
+    meminfo = list(meminfo_lines(seed=seed))
+    lines = (lines[:4] + lines[4 + NEW_LOG_LINES:log_end] + new_log + lines[log_end:mem_start]
+             + meminfo + lines[mem_end:])
+    changed = sum(len(line) for line in new_log + meminfo)
+    for i in rng.sample(range(len(lines)), EDITED_LINES):
+        if not lines[i].startswith(('-', '=', 'DUMP OF SERVICE')):
+            lines[i] = lines[i].rstrip('\n') + f' v{seed}\n'
+            changed += len(lines[i])
+    return lines, changed
+
+
+def failing(lines, after):
+    """Yield `after` lines, then fail like a dropped connection would."""
+    for line in lines[:after]:
+        yield line
+    raise OSError('connection reset')
+
+
+def edge_cases(path):
+    """A failed add followed by a retry, and a newline-free binary member."""
+    store = DumpStore(path)
+    first = [line.encode() for line in bugreport_lines(5_000, seed=100)]
+    second = [line.encode() for line in bugreport_lines(5_000, seed=101)]
+    store.add_stream(iter(first), 'first')
+    try:
+        store.add_stream(failing(second, len(second) // 2), 'second')
+    except OSError:
+        pass
+    retried = store.add_stream(iter(second), 'second')
+    ok = store.read(retried) == b''.join(second)
+
+    blob = random.Random(1).randbytes(5 * MAX_CHUNK // 2).replace(b'\n', b' ')
+    binary = store.add_stream(iter([blob]), 'blob.bin')
+    start, count = store.dump(binary)['recipe']
+    ok &= store.read(binary) == blob and count == 3
+    ok &= int(store.chunks['length'].max()) <= MAX_CHUNK
+    return ok and DumpStore(path).read(retried) == b''.join(second)
+
+
+def main():
+    devices = int(sys.argv[1]) if len(sys.argv) > 1 else 4
+    captures = int(sys.argv[2]) if len(sys.argv) > 2 else 6
+    log_lines = int(sys.argv[3]) if len(sys.argv) > 3 else 100_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        edge_ok = edge_cases(os.path.join(tmp, 'edge'))
+        store = DumpStore(os.path.join(tmp, 'store'))
+        rng = random.Random(0)
+        raw_bytes = gzip_bytes = changed_bytes = later_stored = 0
+        add_s = 0.0
+        expected = []
+        for device in range(devices):
+            lines = list(bugreport_lines(log_lines, seed=device))
+            for capture in range(captures):
+                if capture:
+                    lines, changed = next_capture(lines, rng, seed=device * 1000 + capture)
+                    changed_bytes += changed
+                data = ''.join(lines).encode()
+                raw_bytes += len(data)
+                gz_path = os.path.join(tmp, f'{device}-{capture}.txt.gz')
+                with gzip.open(gz_path, 'wb', compresslevel=6) as f:
+                    f.write(data)
+                gzip_bytes += os.path.getsize(gz_path)
+
+                dump_path = os.path.join(tmp, f'{device}-{capture}.txt')
+                with open(dump_path, 'wb') as f:
+                    f.write(data)
+                start = time.perf_counter()
+                (dump_id,) = store.add(dump_path, device=f'device-{device}')
+                add_s += time.perf_counter() - start
+                os.remove(dump_path)
+                if capture:
+                    later_stored += store.dump(dump_id)['stored_bytes']
+                expected.append(hashlib.sha256(data).hexdigest())
+
+        # meminfo of the last capture, both ways (best of 5)
+        last = len(store) - 1
+        start, end = next((s, e) for name, _, s, e in store.dump(last)['sections'] if name == 'meminfo')
+        store_best = gz_best = float('inf')
+        for _ in range(5):
+            fresh = DumpStore(store.path)
+            t = time.perf_counter()
+            section = fresh.section(last, 'meminfo')
+            store_best = min(store_best, time.perf_counter() - t)
+            t = time.perf_counter()
+            with gzip.open(gz_path, 'rb') as f:
+                head = f.read(end)
+            gz_best = min(gz_best, time.perf_counter() - t)
+        ok = section == head[start:end] and any(name == 'meminfo' for name, *_ in scan_sections(head))
+
+        start = time.perf_counter()
+        ok &= all(hashlib.sha256(store.read(i)).hexdigest() == sha for i, sha in enumerate(expected))
+        read_s = time.perf_counter() - start
+        stats = store.stats()
+
+    later = devices * (captures - 1)
+    mb = 1024 * 1024
+    print("="*80)
+    print(f"🗄️  DUMP STORE: {devices} devices x {captures} captures, "
+          f"{raw_bytes / mb:,.0f} MB raw, {stats['chunks']:,} chunks in {stats['frames']:,} frames")
+    print("="*80)
+    print(f"  Gzip per dump:        {gzip_bytes / mb:9.1f} MB  ({raw_bytes / gzip_bytes:5.1f}x)")
+    print(f"  Dump store:           {stats['stored_bytes'] / mb:9.1f} MB  "
+          f"({raw_bytes / stats['stored_bytes']:5.1f}x)")
+    if later:
+        print(f"  Per later capture:    {later_stored / later / 1024:9.1f} KB stored  "
+              f"({changed_bytes / later / 1024:.1f} KB of lines changed)")
+    print(f"  Add:                  {add_s:9.2f} s   ({raw_bytes / mb / add_s:,.0f} MB/s)")
+    print(f"  Read back all:        {read_s:9.2f} s   ({raw_bytes / mb / read_s:,.0f} MB/s)")
+    print(f"  meminfo, store:       {store_best * 1000:9.2f} ms  ({len(section) / 1024:,.0f} KB section)")
+    print(f"  meminfo, gunzip:      {gz_best * 1000:9.2f} ms")
+    print(f"  Check: {'✅ every dump matches its SHA-256' if ok else '❌ MISMATCH'}")
+    print(f"  Check: {'✅ retry after a failed add, binary member' if edge_ok else '❌ EDGE CASES'}")
+    return 0 if ok and edge_ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: fleet analysis throughput, serial vs process pool
+
+Device 0 replays the recorded Oct 19 captures and must reproduce the
+numbers the single-device scripts print; the rest are perturbed copies.
+Its transformation score must equal meta_forensic_analysis.py's exactly,
+both for the recorded scans and for the same capture folders.
+
+Usage:
+    python3 benchmarks/bench_fleet.py [n_devices]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fleet_analysis import analyze_fleet  # noqa: E402
+from meta_forensic_analysis import compute_transformation, genetic_markers, load_captures  # noqa: E402
+from snapshot_store import RECORDED_CAPTURES  # noqa: E402
+from synthetic_dumps import perturb, write_capture_dir  # noqa: E402
+
+
+def main():
+    n_devices = int(sys.argv[1]) if len(sys.argv) > 1 else 64
+    cores = os.cpu_count() or 1
+
+    with tempfile.TemporaryDirectory() as fleet:
+        for i in range(n_devices):
+            device = os.path.join(fleet, f'device-{i:04d}')
+            before, after = RECORDED_CAPTURES['before'], RECORDED_CAPTURES['after']
+            if i:
+                before, after = perturb(before, 2 * i), perturb(after, 2 * i + 1)
+            write_capture_dir(os.path.join(device, 'before'), before, seed=2 * i)
+            write_capture_dir(os.path.join(device, 'after'), after, seed=2 * i + 1)
+
+        timings = {}
+        for workers in sorted({1, max(2, cores)}):
+            start = time.perf_counter()
+            rows = analyze_fleet(fleet, workers)
+            timings[workers] = time.perf_counter() - start
+
+        recorded_dirs = [os.path.join(fleet, 'device-0000', role) for role in ('before', 'after')]
+        meta_scores = (compute_transformation()[0],
+                       compute_transformation(genetic_markers(*load_captures(recorded_dirs)))[0])
+
+    recorded = rows[0]
+    assert f"{recorded['ram_freed_mb']:.1f}" == '762.9', recorded
+    assert f"{recorded['swap_freed_gb']:.2f}" == '2.85', recorded
+    assert recorded['packages_removed'] == 181, recorded
+    assert f"{recorded['transformation_score']:.1f}" == '28.5', recorded
+    assert all(score == recorded['transformation_score'] for score in meta_scores), meta_scores
+
+    print("="*80)
+    print("⏱️  FLEET BENCHMARK")
+    print("="*80)
+    for workers, elapsed in timings.items():
+        speedup = timings[1] / elapsed
+        print(f"  {workers:>3} worker(s): {elapsed:6.2f} s  {n_devices / elapsed:7.1f} devices/s  "
+              f"speedup {speedup:.2f}x (efficiency {speedup / workers * 100:.0f}%)")
+    print(f"  Meta report score: {recorded['transformation_score']!r} on both paths ✅")
+    print(f"  Recorded device: {recorded['ram_freed_mb']:.1f} MB freed, score "
+          f"{recorded['transformation_score']:.1f}% ✅")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
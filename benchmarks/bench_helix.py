@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: DNA helix rendering, per-segment ax.plot vs. LineCollection
+
+Draws both helix strands the old way (one Line2D per segment) and with
+draw_helix() (one LineCollection per strand) at the default resolution
+and at one base pair per package, then times the Agg draw of the whole
+DNA revelation figure.
+
+Usage:
+    python3 benchmarks/bench_helix.py [repeats]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from meta_forensic_analysis import (  # noqa: E402
+    BLOAT_POSITIONS, GENETIC_MARKERS, HEALTHY_POSITIONS, HELIX_POINTS,
+    compute_transformation, draw_helix, helix_strand, render_dna_revelation,
+)
+from plotting import pyplot  # noqa: E402
+
+RESOLUTIONS = (HELIX_POINTS, 573, 5000)
+
+
+def draw_helix_per_segment(ax, x_offset, n_points, cmap, marker_positions, **marker_style):
+    """The original rendering: one ax.plot call per segment."""
+    import numpy as np
+
+    x, y = helix_strand(x_offset, np.linspace(0, 1, n_points))
+    colors = cmap(np.linspace(0.4, 0.9, n_points))
+    for i in range(n_points - 1):
+        ax.plot([x[i], x[i+1]], [y[i], y[i+1]], color=colors[i], linewidth=3, alpha=0.7)
+    for mx, my in zip(*helix_strand(x_offset, marker_positions)):
+        ax.scatter(mx, my, **marker_style)
+
+
+def time_helix(draw, n_points, repeats):
+    """Best build + Agg draw time (ms) for both strands on one axes."""
+    plt = pyplot()
+    best = float('inf')
+    for _ in range(repeats):
+        fig = plt.figure(figsize=(20, 4))
+        ax = fig.add_subplot(1, 1, 1)
+        ax.set_xlim(-2, 12)
+        ax.set_ylim(-1, 11)
+        start = time.perf_counter()
+        draw(ax, 0, n_points, plt.cm.Reds, BLOAT_POSITIONS, s=150, c='red', marker='X')
+        draw(ax, 8, n_points, plt.cm.Greens, HEALTHY_POSITIONS, s=150, c='#00ff41', marker='o')
+        fig.canvas.draw()
+        best = min(best, (time.perf_counter() - start) * 1000)
+        artists = len(ax.get_children())
+        plt.close(fig)
+    return best, artists
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print("="*80)
+    print("⏱️  DNA HELIX RENDER BENCHMARK")
+    print("="*80)
+    print(f"  {'points':>7} {'per-segment ms':>15} {'artists':>8} {'collection ms':>14} {'artists':>8} {'speedup':>8}")
+    for n_points in RESOLUTIONS:
+        old_ms, old_artists = time_helix(draw_helix_per_segment, n_points, repeats)
+        new_ms, new_artists = time_helix(draw_helix, n_points, repeats)
+        print(f"  {n_points:>7,} {old_ms:>15.1f} {old_artists:>8,} {new_ms:>14.1f} {new_artists:>8,} "
+              f"{old_ms / new_ms:>7.1f}x")
+
+    score, grade, _ = compute_transformation()
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_points in (HELIX_POINTS, 573):
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                render_dna_revelation(GENETIC_MARKERS, score, grade,
+                                      path=os.path.join(tmp, 'dna.png'), helix_points=n_points)
+                best = min(best, (time.perf_counter() - start) * 1000)
+            print(f"  Full dna_revelation.png at {n_points} points: {best:.0f} ms (best of {repeats})")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
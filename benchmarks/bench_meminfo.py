@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: streaming meminfo parser on a multi-megabyte dump
+
+Also reports the parser's working memory (peak heap above the parsed
+result, tracemalloc): one batch of raw lines plus the numeric columns,
+well under the size of the dump. Checks that a dump missing its
+"Free RAM:" line leaves those keys out instead of reporting zeros.
+
+Usage:
+    python3 benchmarks/bench_meminfo.py [n_processes]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from meminfo_parser import MEMINFO_LINES, missing_lines, parse_meminfo, parse_meminfo_file  # noqa: E402
+from synthetic_dumps import BEFORE_MEMINFO, meminfo_lines, write_lines  # noqa: E402
+
+BUDGET_MS = 100.0
+REPEATS = 5
+
+
+def main():
+    n_processes = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, 'meminfo.txt')
+        size = write_lines(path, meminfo_lines(n_processes))
+
+        timings = []
+        for _ in range(REPEATS):
+            start = time.perf_counter()
+            snapshot = parse_meminfo_file(path)
+            timings.append((time.perf_counter() - start) * 1000)
+
+        tracemalloc.start()
+        snapshot = parse_meminfo_file(path)
+        kept, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    lines = [line for line in meminfo_lines(100) if not line.lstrip().startswith('Free RAM:')]
+    partial = parse_meminfo(lines)
+    missing_ok = (missing_lines(partial) == ['Free RAM:']
+                  and not any(key in partial for key, line in MEMINFO_LINES.items() if line == 'Free RAM:'))
+
+    for key, value in BEFORE_MEMINFO.items():
+        assert snapshot[key] == value, key
+    assert len(snapshot['processes']) == n_processes
+
+    best = min(timings)
+    print("="*80)
+    print("⏱️  MEMINFO PARSER BENCHMARK")
+    print("="*80)
+    print(f"  Dump size:   {size / 1024 / 1024:.2f} MB ({n_processes:,} processes)")
+    print(f"  Best:        {best:.1f} ms")
+    print(f"  Median:      {sorted(timings)[len(timings) // 2]:.1f} ms")
+    print(f"  Throughput:  {size / 1024 / 1024 / (best / 1000):.1f} MB/s")
+    print(f"  Working set: {(peak - kept) / 1024 / 1024:.1f} MB above the {kept / 1024 / 1024:.1f} MB result")
+    print(f"  Check:       {'✅ missing lines leave their keys out' if missing_ok else '❌ MISSING KEYS'}")
+    print(f"  Budget:      {BUDGET_MS:.0f} ms -> {'✅ PASS' if best < BUDGET_MS else '❌ FAIL'}")
+    return 0 if best < BUDGET_MS and missing_ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: top-K memory hogs and per-package freed memory for big dumps
+
+Builds a before dump with N processes spread over packages (some with
+`:service` sub-processes) and an after dump in which a third of the
+packages are gone and the rest have shrunk or grown. Then it times:
+
+    parse      parse_meminfo() of both dumps
+    top-K      top_hogs() with the bounded heap vs. sorting every process,
+               over the processes in shuffled order
+    join       freed_by_package() hash join of the two process tables
+
+The join is checked against the known removed set, down to the KB.
+
+Usage:
+    python3 benchmarks/bench_memory_hogs.py [processes] [k]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from meminfo_parser import parse_meminfo  # noqa: E402
+from memory_hogs import freed_by_package, summarize_freed, top_hogs  # noqa: E402
+from synthetic_dumps import meminfo_lines  # noqa: E402
+
+
+def process_tables(n_processes, seed=0):
+    """(before_rows, after_rows, removed_packages) as (pss_kb, name, pid) rows."""
+    rng = random.Random(seed)
+    before, after, removed = [], [], set()
+    pid = 1000
+    package_id = 0
+    while len(before) < n_processes:
+        package = f'com.vendor{package_id % 40}.app{package_id}'
+        package_id += 1
+        gone = rng.random() < 1 / 3
+        if gone:
+            removed.add(package)
+        for suffix in ('', ':service', ':remote')[:rng.choice((1, 1, 2, 3))]:
+            pss = rng.randint(1_000, 600_000)
+            before.append((pss, package + suffix, pid))
+            if not gone:
+                after.append((max(1_000, int(pss * rng.uniform(0.6, 1.2))), package + suffix, pid + 500_000))
+            pid += 1
+    return before, after, removed
+
+
+def best_of(fn, repeats=5):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    k = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+
+    before_rows, after_rows, removed = process_tables(n)
+    before_lines = list(meminfo_lines(rows=before_rows))
+    after_lines = list(meminfo_lines(rows=after_rows, seed=1))
+
+    (before, after), parse_ms = best_of(lambda: (parse_meminfo(before_lines), parse_meminfo(after_lines)))
+    # Dumps list processes in PSS order; rank a shuffled stream, as when
+    # merging many dumps or ranking by RSS
+    processes = list(before['processes'])
+    random.Random(1).shuffle(processes)
+    heap, heap_ms = best_of(lambda: top_hogs(processes, k))
+    full, sort_ms = best_of(lambda: sorted(processes, key=lambda row: row['pss_kb'], reverse=True)[:k])
+    rows, join_ms = best_of(lambda: freed_by_package(before['processes'], after['processes']))
+    summary = summarize_freed(rows)
+
+    expected_removed_kb = sum(pss for pss, name, _ in before_rows if name.split(':')[0] in removed)
+    found = {row['package'] for row in rows if row['status'] == 'removed'}
+    same_top = [row['pss_kb'] for row in heap] == [row['pss_kb'] for row in full]
+
+    print("="*80)
+    print(f"🐷 MEMORY HOGS: {len(processes):,} -> {len(after['processes']):,} processes, "
+          f"{len(rows):,} packages")
+    print("="*80)
+    print(f"  Parse both dumps:        {parse_ms:8.1f} ms")
+    print(f"  Top {k} by heap:          {heap_ms:8.2f} ms  (full sort {sort_ms:.2f} ms)")
+    print(f"  Per-package hash join:   {join_ms:8.2f} ms")
+    print(f"  Removed packages:        {len(found):,} of {len(removed):,} expected")
+    print(f"  Freed by removed apps:   {summary['removed_kb']:,} KB (expected {expected_removed_kb:,} KB)")
+    print(f"  Net per-process freed:   {summary['net_kb'] / 1024:,.1f} MB")
+    ok = found == removed and summary['removed_kb'] == expected_removed_kb and same_top
+    print(f"  Check: {'✅ exact' if ok else '❌ MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: package inventory diffs across a fleet
+
+Builds N before/after pairs of large `pm list packages -f` dumps. Each
+"after" drops most user apps and some system apps, installs a few new
+ones and moves some system apps to /data. Then each pair is parsed and
+diffed, and the results are checked against the counts.
+
+Usage:
+    python3 benchmarks/bench_package_diff.py [pairs] [packages_per_inventory]
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from package_diff import PackageInventory, diff_inventories  # noqa: E402
+from synthetic_dumps import packages_lines  # noqa: E402
+
+
+def debloated(lines, seed):
+    """An "after" dump: removals, a few installs and system -> user moves."""
+    rng = random.Random(seed)
+    out = []
+    for line in lines:
+        roll = rng.random()
+        if line.startswith('package:/data/') and roll < 0.7:
+            continue
+        if line.startswith('package:/system/') and roll < 0.1:
+            continue
+        if line.startswith('package:/system/') and roll < 0.12:
+            line = line.replace('package:/system/priv-app/', 'package:/data/app/', 1)
+        out.append(line)
+    out.extend(f"package:/data/app/~~new{seed}_{i}==/org.example.new{i}-1/base.apk=org.example.new{i}\n"
+               for i in range(rng.randint(0, 20)))
+    return out
+
+
+def main():
+    pairs = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+
+    dumps = []
+    for seed in range(pairs):
+        before = list(packages_lines(n_system=size * 54 // 100, n_user=size - size * 54 // 100, seed=seed))
+        dumps.append((before, debloated(before, seed)))
+
+    parse_s = diff_s = 0.0
+    removed = 0
+    for before_lines, after_lines in dumps:
+        start = time.perf_counter()
+        before = PackageInventory().add_lines(before_lines)
+        after = PackageInventory().add_lines(after_lines)
+        parse_s += time.perf_counter() - start
+
+        start = time.perf_counter()
+        diff = diff_inventories(before, after)
+        diff_s += time.perf_counter() - start
+
+        counts = diff['improvements']
+        assert len(diff['removed']) - len(diff['added']) == counts['packages_removed']
+        assert (len(diff['removed_user']) - len(diff['moved_to_user'])
+                - sum(name not in before.system for name in diff['added'])) == counts['user_apps_removed']
+        removed += len(diff['removed'])
+
+    print("="*80)
+    print("⏱️  PACKAGE DIFF BENCHMARK")
+    print("="*80)
+    print(f"  Pairs:          {pairs:,} x {size:,} packages")
+    print(f"  Parse:          {parse_s / pairs * 1000:.2f} ms per pair")
+    print(f"  Diff:           {diff_s / pairs * 1000:.2f} ms per pair")
+    print(f"  Removed:        {removed / pairs:,.0f} packages per pair on average (counts verified)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: `ps -A` as a columnar process table vs. a list of dicts
+
+Concatenates the synthetic `ps -A` dumps of N phones (about 1,000
+processes each, so names repeat across the fleet), parses them both ways
+and times the questions the analysis scripts ask of the table:
+
+    parse         ProcessTable columns vs. one dict per row
+    Knox RSS      label mask + sum vs. classifying every row in a loop
+    per package   np.bincount rollup vs. accumulating into a dict
+    diff          diff_process_tables() against the fleet after a debloat
+
+Every answer is checked against the dict version, and the peak heap of
+each parse is reported (tracemalloc). capture_loader.count_processes()
+must count the same processes as parse_ps(), for `ps -A` and for
+`ps -A -o PID,PPID,RSS,NAME` output.
+
+Usage:
+    python3 benchmarks/bench_process_table.py [phones]
+"""
+
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from bloat_classifier import BloatClassifier, process_package  # noqa: E402
+from capture_loader import count_processes  # noqa: E402
+from ps_parser import diff_process_tables, parse_ps, uid_of  # noqa: E402
+from synthetic_dumps import ps_lines  # noqa: E402
+
+
+def fleet_lines(phones, per_phone, seed):
+    """One `ps -A` header, then the rows of every phone."""
+    yield next(ps_lines(0))
+    for phone in range(phones):
+        yield from list(ps_lines(per_phone, seed=seed + phone))[1:]
+
+
+def parse_dicts(lines):
+    """The straightforward reader: one dict per `ps -A` row."""
+    rows = []
+    for line in lines:
+        fields = line.split()
+        if not fields or fields[0] == 'USER':
+            continue
+        rows.append({'user': fields[0], 'uid': uid_of(fields[0]), 'pid': int(fields[1]),
+                     'ppid': int(fields[2]), 'rss_kb': int(fields[4]), 'name': fields[-1]})
+    return rows
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - start) * 1000
+
+
+def peak_of(fn):
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak
+
+
+def main():
+    phones = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000
+    lines = list(fleet_lines(phones, 1070, seed=0))
+    after_lines = list(fleet_lines(phones, 1063, seed=phones))
+    classifier = BloatClassifier()
+
+    rows, dicts_ms = timed(lambda: parse_dicts(lines))
+    table, table_ms = timed(lambda: parse_ps(lines))
+    dicts_peak = peak_of(lambda: parse_dicts(lines))
+    table_peak = peak_of(lambda: parse_ps(lines))
+
+    knox_dicts, knox_dicts_ms = timed(lambda: sum(
+        row['rss_kb'] for row in rows if classifier.classify(row['name']) == 'Samsung Knox'))
+    knox_table, knox_table_ms = timed(lambda: int(
+        table.columns()[3][table.label_mask('Samsung Knox', classifier)].sum()))
+
+    def package_dicts():
+        totals = {}
+        for row in rows:
+            package = process_package(row['name'])
+            count, rss_kb = totals.get(package, (0, 0))
+            totals[package] = (count + 1, rss_kb + row['rss_kb'])
+        return totals
+
+    per_package_dicts, package_dicts_ms = timed(package_dicts)
+    per_package_table, package_table_ms = timed(table.by_package)
+
+    after = parse_ps(after_lines)
+    diff, diff_ms = timed(lambda: diff_process_tables(table, after, classifier))
+
+    ok = (len(table) == len(rows) and knox_table == knox_dicts
+          and {p: (c, r) for p, c, r in per_package_table} == per_package_dicts
+          and diff['processes']['killed'] == len(table) - len(after))
+    o_lines = ['  PID  PPID   RSS NAME\n'] + [
+        f"{row['pid']:>5} {row['ppid']:>5} {row['rss_kb']:>5} {row['name']}\n" for row in rows[:1000]]
+    ok &= (count_processes(lines)['running_processes'] == len(table)
+           and count_processes(o_lines)['running_processes'] == len(parse_ps(o_lines)) == len(o_lines) - 1)
+    mb = 1024 * 1024
+    print("="*80)
+    print(f"⚙️  PROCESS TABLE: {phones:,} phones, {len(table):,} processes, "
+          f"{len(table.names):,} distinct names")
+    print("="*80)
+    print(f"  {'':<14} {'dicts':>12} {'columns':>12}")
+    print(f"  {'Parse':<14} {dicts_ms:>9,.1f} ms {table_ms:>9,.1f} ms")
+    print(f"  {'Peak heap':<14} {dicts_peak / mb:>9,.1f} MB {table_peak / mb:>9,.1f} MB")
+    print(f"  {'Knox RSS':<14} {knox_dicts_ms:>9,.1f} ms {knox_table_ms:>9,.1f} ms")
+    print(f"  {'Per package':<14} {package_dicts_ms:>9,.1f} ms {package_table_ms:>9,.1f} ms")
+    print(f"  Diff vs. {len(after):,} processes: {diff_ms:,.1f} ms "
+          f"({len(diff['stopped']):,} stopped, {len(diff['started']):,} started)")
+    print(f"  Check: {'✅ same answers as the dicts' if ok else '❌ MISMATCH'}")
+    return 0 if ok else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
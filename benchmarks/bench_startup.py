@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK: CLI startup cost of the analysis scripts per output mode
+
+Runs each script as a fresh interpreter in a scratch directory, once per
+mode (full report + figure, the same from a warm render cache, --text,
+--json), and reports the best wall time, the cumulative import time from
+`python -X importtime`, and whether matplotlib / NumPy were loaded at all.
+Every run uses a render cache in the scratch directory, never the user's:
+the full mode renders with --no-cache and must import matplotlib; the
+cached, text and JSON modes must not.
+
+Usage:
+    python3 benchmarks/bench_startup.py [repeats]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+SCRIPTS = ('ram_analysis.py', 'analyze_debloat.py', 'meta_forensic_analysis.py')
+MODES = (('full', ['--no-cache']), ('cached', []), ('text', ['--text']), ('json', ['--json']))
+
+
+def run(script, flags, cwd, importtime=False):
+    cmd = [sys.executable]
+    if importtime:
+        cmd += ['-X', 'importtime']
+    cmd += [str(ROOT / script)] + flags
+    env = dict(os.environ, MPLBACKEND='Agg', PHONEDNA_RENDER_CACHE=os.path.join(cwd, 'render-cache'))
+    start = time.perf_counter()
+    proc = subprocess.run(cmd, cwd=cwd, env=env, capture_output=True, text=True)
+    elapsed = (time.perf_counter() - start) * 1000
+    if proc.returncode:
+        raise RuntimeError(f'{script} {" ".join(flags)} failed:\n{proc.stderr}')
+    return elapsed, proc.stderr
+
+
+def import_profile(stderr):
+    """Total import time (ms) and the set of top-level packages imported."""
+    total_us = 0
+    packages = set()
+    for line in stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        head, _, name = line.split('|')
+        total_us += int(head.split(':')[1])
+        packages.add(name.strip().split('.')[0])
+    return total_us / 1000, packages
+
+
+def main():
+    repeats = int(sys.argv[1]) if len(sys.argv) > 1 else 3
+
+    print("="*80)
+    print("⏱️  CLI STARTUP BENCHMARK")
+    print("="*80)
+    print(f"  {'script':<28} {'mode':<6} {'wall ms':>9} {'import ms':>10}  matplotlib  numpy")
+
+    with tempfile.TemporaryDirectory() as cwd:
+        for script in SCRIPTS:
+            for mode, flags in MODES:
+                if mode == 'cached':
+                    run(script, flags, cwd)         # fill the scratch cache
+                wall = min(run(script, flags, cwd)[0] for _ in range(repeats))
+                _, stderr = run(script, flags, cwd, importtime=True)
+                import_ms, packages = import_profile(stderr)
+                mpl = 'matplotlib' in packages
+                assert mpl == (mode == 'full'), \
+                    f"{script} {mode}: matplotlib {'imported' if mpl else 'never imported'}"
+                print(f"  {script:<28} {mode:<6} {wall:>9.0f} {import_ms:>10.0f}  "
+                      f"{'yes' if mpl else 'no':<10}  {'yes' if 'numpy' in packages else 'no'}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,374 @@
+#!/usr/bin/env python3
+"""
+BENCHMARK SUITE: parsing, scoring and rendering for every analysis script
+
+Generates a synthetic before/after capture at 1x, 10x and 100x the
+203,089 lines of the original forensic dumps and times each stage of the
+three analysis scripts on it:
+
+    ram_analysis            parse meminfo, score (improvements + per-package hogs), render
+    analyze_debloat         parse packages/ps/df, score (inventory diff + improvement), render
+    meta_forensic_analysis  parse captures + battery history + usage stats, score
+                            (transformation, worst drain, top apps), render
+
+Every stage reports wall time (best of 3 below 10x), throughput over the
+lines it reads and peak Python heap (tracemalloc, measured in a separate
+run so tracing does not distort the timing). Figures do not depend on the dump size, so the
+renders are measured once, at the first scale. They call the renderers
+directly, and the render cache is pointed at the scratch directory, so
+a render is never served from (or written to) the user's cache.
+
+Each run is appended to benchmarks/history.json with the git commit, and
+compared with the previous run of the same stage so regressions between
+commits stand out.
+
+A full run takes about half an hour on one core, almost all of it at 100x
+(20 million lines, 2.4 GB of dumps, ~1.2 GB peak heap); `--scales 1 10`
+is the quick check.
+
+Usage:
+    python3 benchmarks/bench_suite.py [--scales 1 10 100] [--no-render] [--history PATH]
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from recorded_captures import RECORDED_CAPTURES  # noqa: E402
+from synthetic_dumps import (  # noqa: E402
+    batterystats_lines, df_lines, meminfo_lines, packages_lines, ps_lines, usagestats_lines, write_lines,
+)
+
+README_LINES = 203_089
+DEFAULT_HISTORY = ROOT / 'benchmarks' / 'history.json'
+REGRESSION_PCT = 10
+
+# Share of the total line count per dump: (file, share, before/after/device)
+DUMP_SHARES = (
+    ('batterystats.txt', 0.40, None),
+    ('usagestats.txt', 0.30, None),
+    ('meminfo.txt', 0.08, 'before'),
+    ('meminfo.txt', 0.06, 'after'),
+    ('ps.txt', 0.06, 'before'),
+    ('ps.txt', 0.05, 'after'),
+    ('packages.txt', 0.03, 'before'),
+    ('packages.txt', 0.02, 'after'),
+)
+
+# usagestats_lines() holds its events in memory; larger dumps are written
+# as several daily blocks
+USAGE_BLOCK_EVENTS = 200_000
+
+
+# ============================================================================
+# SYNTHETIC CAPTURE
+# ============================================================================
+def _lines_per_unit(generate):
+    """Marginal lines per unit (process, event, ...), ignoring fixed headers."""
+    return (sum(1 for _ in generate(2_000)) - sum(1 for _ in generate(1_000))) / 1_000
+
+
+def _dump_lines(name, units, side):
+    snapshot = RECORDED_CAPTURES[side] if side else None
+    if name == 'meminfo.txt':
+        kb = {key: value for key, value in snapshot.items() if key.endswith('_kb')}
+        return meminfo_lines(units, seed=side == 'after', snapshot=kb)
+    if name == 'ps.txt':
+        return ps_lines(units, seed=side == 'after')
+    if name == 'packages.txt':
+        system = round(units * snapshot['system_apps'] / snapshot['total_packages'])
+        return packages_lines(system, units - system)
+    if name == 'batterystats.txt':
+        return batterystats_lines(units)
+    return _usage_blocks(units)
+
+
+def _usage_blocks(n_events):
+    start = datetime(2025, 10, 13)
+    for block, first in enumerate(range(0, n_events, USAGE_BLOCK_EVENTS)):
+        count = min(USAGE_BLOCK_EVENTS, n_events - first)
+        yield from usagestats_lines(count, seed=block, start=start + timedelta(days=400 * block))
+
+
+_UNIT_PROBES = {
+    'meminfo.txt': lambda n: meminfo_lines(n),
+    'ps.txt': lambda n: ps_lines(n),
+    'packages.txt': lambda n: packages_lines(n // 2, n - n // 2),
+    'batterystats.txt': lambda n: batterystats_lines(n),
+    'usagestats.txt': lambda n: usagestats_lines(n),
+}
+
+
+def write_capture(path, scale):
+    """Write device/, before/ and after/ dumps totalling scale x 203,089 lines.
+
+    Returns {relative path: (lines, bytes)}.
+    """
+    per_unit = {name: _lines_per_unit(probe) for name, probe in _UNIT_PROBES.items()}
+    files = {}
+    for name, share, side in DUMP_SHARES:
+        folder = os.path.join(path, side or 'device')
+        os.makedirs(folder, exist_ok=True)
+        units = max(10, round(README_LINES * scale * share / per_unit[name]))
+        dump = os.path.join(folder, name)
+        size = write_lines(dump, _dump_lines(name, units, side))
+        with open(dump, 'rb') as f:
+            lines = sum(chunk.count(b'\n') for chunk in iter(lambda: f.read(1 << 20), b''))
+        files[os.path.relpath(dump, path)] = (lines, size)
+    for side in ('before', 'after'):
+        capture = RECORDED_CAPTURES[side]
+        files[f'{side}/df.txt'] = (2, write_lines(os.path.join(path, side, 'df.txt'),
+                                                  df_lines(capture['storage_free_gb'],
+                                                           capture['storage_total_gb'])))
+    return files
+
+
+# ============================================================================
+# STAGES
+# ============================================================================
+def ram_stages(data, out_dir):
+    import ram_analysis
+    from meminfo_parser import parse_meminfo_file
+
+    state = {}
+
+    def parse():
+        state['before'] = parse_meminfo_file(os.path.join(data, 'before', 'meminfo.txt'))
+        state['after'] = parse_meminfo_file(os.path.join(data, 'after', 'meminfo.txt'))
+
+    def score():
+        state['improvements'] = ram_analysis.compute_improvements(state['before'], state['after'])
+        state['hogs'] = ram_analysis.measured_hogs(state['before'], state['after'])
+
+    def render():
+        ram_analysis.render_ram_comparison(state['before'], state['after'], state['improvements'],
+                                           path=os.path.join(out_dir, 'ram_comparison.png'))
+
+    reads = ('before/meminfo.txt', 'after/meminfo.txt')
+    return [('parse', parse, reads), ('score', score, reads), ('render', render, ())]
+
+
+def debloat_stages(data, out_dir):
+    import analyze_debloat
+    from capture_loader import count_processes, parse_df
+    from package_diff import diff_inventories, load_inventory
+
+    state = {}
+
+    def parse():
+        for side in ('before', 'after'):
+            folder = os.path.join(data, side)
+            capture = {}
+            with open(os.path.join(folder, 'ps.txt'), encoding='utf-8') as f:
+                capture.update(count_processes(f))
+            with open(os.path.join(folder, 'df.txt'), encoding='utf-8') as f:
+                capture.update(parse_df(f))
+            state[side] = capture
+            state[f'{side}_inventory'] = load_inventory(folder)
+
+    def score():
+        for side in ('before', 'after'):
+            state[side].update(state[f'{side}_inventory'].counts())
+        state['diff'] = diff_inventories(state['before_inventory'], state['after_inventory'])
+        state['improvements'] = analyze_debloat.compute_improvements(state['before'], state['after'])
+        state['score'] = analyze_debloat.improvement_score(state['before'], state['improvements'])
+
+    def render():
+        analyze_debloat.render_debloat_comparison(
+            state['before'], state['after'], state['improvements'],
+            path=os.path.join(out_dir, 'debloat_comparison.png'))
+
+    reads = tuple(f'{side}/{name}' for side in ('before', 'after')
+                  for name in ('packages.txt', 'ps.txt', 'df.txt'))
+    return [('parse', parse, reads), ('score', score, reads), ('render', render, ())]
+
+
+def meta_stages(data, out_dir):
+    import meta_forensic_analysis as meta
+    from batterystats_parser import BatteryHistory, worst_drain
+    from capture_loader import load_capture_dir
+    from genetic_score import transformation_score
+    from usagestats_parser import parse_usagestats_file
+
+    state = {}
+
+    def parse():
+        state['before'] = load_capture_dir(os.path.join(data, 'before'))
+        state['after'] = load_capture_dir(os.path.join(data, 'after'))
+        state['battery'] = BatteryHistory()
+        state['battery'].update(os.path.join(data, 'device', 'batterystats.txt'))
+        state['usage'] = parse_usagestats_file(os.path.join(data, 'device', 'usagestats.txt'))
+
+    def score():
+        state['transformation'] = transformation_score(state['before'], state['after'])
+        state['grade'] = meta.compute_transformation()
+        state['drain'] = worst_drain(state['battery'].timeline())
+        state['top_apps'] = state['usage'].top_apps()
+
+    def render():
+        score, grade, _ = state['grade']
+        meta.render_dna_revelation(meta.GENETIC_MARKERS, score, grade,
+                                   path=os.path.join(out_dir, 'dna_revelation.png'))
+
+    reads = tuple(f'{side}/{name}' for side in ('before', 'after')
+                  for name in ('meminfo.txt', 'packages.txt', 'ps.txt', 'df.txt')) + (
+        'device/batterystats.txt', 'device/usagestats.txt')
+    return [('parse', parse, reads), ('score', score, reads), ('render', render, ())]
+
+
+SCRIPTS = {
+    'ram_analysis': ram_stages,
+    'analyze_debloat': debloat_stages,
+    'meta_forensic_analysis': meta_stages,
+}
+
+
+def measure(fn, repeats=1):
+    """(best seconds, peak heap bytes) of fn(), from untraced runs and a traced one."""
+    seconds = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        seconds = min(seconds, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return seconds, peak
+
+
+def run_scale(scale, render, out_dir):
+    results = []
+    with tempfile.TemporaryDirectory() as data:
+        start = time.perf_counter()
+        files = write_capture(data, scale)
+        total_lines = sum(lines for lines, _ in files.values())
+        total_mb = sum(size for _, size in files.values()) / 1024 / 1024
+        print(f"\n📦 {scale}x: {total_lines:,} lines (target {README_LINES * scale:,}), {total_mb:,.1f} MB "
+              f"(generated in {time.perf_counter() - start:.1f} s)")
+        print(f"  {'Script':<24} {'Stage':<7} {'Time':>10} {'Lines/s':>12} {'MB/s':>8} {'Peak heap':>11}")
+
+        for script, stages in SCRIPTS.items():
+            for stage, fn, reads in stages(data, out_dir):
+                if stage == 'render' and not render:
+                    continue
+                # Small runs are repeated: the first call can pay lazy imports
+                seconds, peak = measure(fn, repeats=3 if scale < 10 else 1)
+                lines = sum(files[path][0] for path in reads)
+                size = sum(files[path][1] for path in reads)
+                result = {
+                    'scale': scale, 'script': script, 'stage': stage,
+                    'seconds': seconds, 'peak_mb': peak / 1024 / 1024,
+                    'lines': lines, 'bytes': size,
+                    'lines_per_s': lines / seconds if lines else None,
+                    'mb_per_s': size / 1024 / 1024 / seconds if size else None,
+                }
+                results.append(result)
+                rate = f"{result['lines_per_s']:>12,.0f} {result['mb_per_s']:>8,.1f}" if lines else f"{'-':>12} {'-':>8}"
+                print(f"  {script:<24} {stage:<7} {seconds * 1000:>8,.1f}ms {rate} "
+                      f"{result['peak_mb']:>8,.1f} MB")
+    return results
+
+
+# ============================================================================
+# HISTORY
+# ============================================================================
+def git_commit():
+    try:
+        commit = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT,
+                                capture_output=True, text=True, check=True).stdout.strip()
+        dirty = bool(subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=ROOT,
+                                    capture_output=True, text=True, check=True).stdout.strip())
+    except (OSError, subprocess.CalledProcessError):
+        return None, False
+    return commit, dirty
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def previous_results(history):
+    """Latest recorded result per (scale, script, stage)."""
+    latest = {}
+    for run in history:
+        for result in run['results']:
+            latest[(result['scale'], result['script'], result['stage'])] = (run, result)
+    return latest
+
+
+def print_comparison(results, history):
+    previous = previous_results(history)
+    rows = []
+    for result in results:
+        key = (result['scale'], result['script'], result['stage'])
+        if key not in previous:
+            continue
+        run, old = previous[key]
+        change = (result['seconds'] / old['seconds'] - 1) * 100
+        rows.append((key, old['seconds'], result['seconds'], change, run.get('commit') or '?'))
+    if not rows:
+        print("\n  No earlier runs to compare with.")
+        return
+    print(f"\n📊 vs. previous run ({REGRESSION_PCT}% threshold):")
+    for (scale, script, stage), old, new, change, commit in rows:
+        flag = '⚠️  slower' if change > REGRESSION_PCT else '✅ faster' if change < -REGRESSION_PCT else ''
+        print(f"  {scale:>4}x {script:<24} {stage:<7} {old * 1000:>9,.1f} -> {new * 1000:>9,.1f} ms "
+              f"({change:+6.1f}% vs {commit}) {flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark every analysis script stage by stage.')
+    parser.add_argument('--scales', type=int, nargs='+', default=[1, 10, 100],
+                        help='multiples of the 203,089-line capture (default: 1 10 100)')
+    parser.add_argument('--no-render', action='store_true', help='skip the figure renders')
+    parser.add_argument('--history', default=str(DEFAULT_HISTORY), help='JSON history file')
+    args = parser.parse_args(argv)
+    warnings.simplefilter('ignore', UserWarning)     # missing emoji glyphs in the figures
+
+    commit, dirty = git_commit()
+    print("="*80)
+    print(f"⏱️  BENCHMARK SUITE: {commit or 'no git'}{' (dirty)' if dirty else ''}")
+    print("="*80)
+
+    results = []
+    with tempfile.TemporaryDirectory() as out_dir:
+        os.environ['PHONEDNA_RENDER_CACHE'] = os.path.join(out_dir, 'render-cache')
+        for i, scale in enumerate(args.scales):
+            results += run_scale(scale, render=not args.no_render and i == 0, out_dir=out_dir)
+
+    history = load_history(args.history)
+    print_comparison(results, history)
+    history.append({
+        'commit': commit,
+        'dirty': dirty,
+        'timestamp': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'machine': f'{platform.system()} {platform.machine()}, {os.cpu_count()} CPUs',
+        'results': results,
+    })
+    with open(args.history, 'w') as f:
+        json.dump(history, f, indent=1)
+    print(f"\n  Saved to {args.history} ({len(history)} runs)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
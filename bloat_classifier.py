@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+"""
+BLOAT CLASSIFIER - Label packages and processes by vendor family
+
+Rules are package-name prefixes (`com.samsung.android.knox.*`) or exact
+names (`com.facebook.katana`), each mapped to a vendor label. They are
+compiled into a trie keyed by dot-separated name segments, and a name gets
+the label of the longest rule that matches it, so Knox packages are not
+counted as plain Samsung. A prefix rule also covers the bare prefix:
+`com.google.android.gms.*` matches `com.google.android.gms` itself as
+well as `com.google.android.gms.unstable` and `com.google.android.gms:persistent`.
+
+Process names are reduced to their package first (`com.foo:remote` ->
+`com.foo`). Names repeat heavily across a fleet, so results are memoised
+per name; a million process names classify in well under a second.
+
+Rule file format, one rule per line (`#` starts a comment; pattern and
+label are separated by any run of spaces or tabs):
+    com.samsung.android.knox.*    Samsung Knox
+    com.facebook.katana           Meta
+
+Usage:
+    python3 bloat_classifier.py DUMP [DUMP ...] [--rules RULES_FILE]
+        DUMP is `pm list packages [-f]` or `ps -A` output
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+UNMATCHED = 'Other'
+# Labels that are not bloat: the platform itself, and apps no rule claims (the user's own)
+NOT_BLOAT = frozenset({'Android', UNMATCHED})
+
+DEFAULT_RULES = """
+# Samsung
+com.samsung.*                   Samsung
+com.sec.*                       Samsung
+com.samsung.android.knox.*      Samsung Knox
+com.samsung.klmsagent           Samsung Knox
+com.knox.*                      Samsung Knox
+com.samsung.android.bixby.*     Samsung Bixby
+com.samsung.android.game.*      Samsung Game Tools
+# Google
+com.google.*                    Google
+com.android.vending             Google
+com.android.chrome              Google
+com.google.android.gms.*        Google Play Services
+com.google.android.adservices.* Google AdServices
+# Meta
+com.facebook.*                  Meta
+com.instagram.*                 Meta
+com.whatsapp                    Meta
+com.meta.*                      Meta
+# Carriers and preloads
+com.verizon.*                   Verizon
+com.vzw.*                       Verizon
+com.tmobile.*                   T-Mobile
+com.att.*                       AT&T
+com.microsoft.*                 Microsoft
+com.spotify.music               Spotify
+com.netflix.*                   Netflix
+com.amazon.*                    Amazon
+# Platform
+android                         Android
+com.android.*                   Android
+"""
+
+_LABEL = None   # trie key for "a rule ends here"; never a name segment
+
+
+def parse_rules(lines):
+    """[(pattern, label), ...] from rule-file lines."""
+    rules = []
+    for line in lines:
+        line = line.split('#', 1)[0].strip()
+        if not line:
+            continue
+        pattern, *label = line.split(None, 1)
+        rules.append((pattern, label[0] if label else UNMATCHED))
+    return rules
+
+
+def load_rules(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return parse_rules(f)
+
+
+def process_package(name):
+    """'com.foo.bar:remote' -> 'com.foo.bar'; native processes stay as they are."""
+    colon = name.find(':')
+    return name if colon < 0 else name[:colon]
+
+
+class BloatClassifier:
+    """Prefix trie over dot-separated package segments, with a per-name memo."""
+
+    def __init__(self, rules=None):
+        self.trie = {}
+        self.exact = {}
+        self._memo = {}
+        for pattern, label in parse_rules(DEFAULT_RULES.splitlines()) if rules is None else rules:
+            self.add_rule(pattern, label)
+
+    def add_rule(self, pattern, label):
+        if not pattern.endswith('.*'):
+            self.exact[pattern] = label
+        else:
+            node = self.trie
+            for segment in pattern[:-2].split('.'):
+                node = node.setdefault(segment, {})
+            node[_LABEL] = label
+        self._memo.clear()
+
+    def _lookup(self, package):
+        label = self.exact.get(package)
+        if label is not None:
+            return label
+        label = UNMATCHED
+        node = self.trie
+        segments = package.split('.')
+        # A prefix rule covers the bare prefix as well as every name below it
+        for segment in segments:
+            node = node.get(segment)
+            if node is None:
+                break
+            label = node.get(_LABEL, label)
+        return label
+
+    def classify(self, name):
+        """Vendor label for one package or process name."""
+        label = self._memo.get(name)
+        if label is None:
+            label = self._memo[name] = self._lookup(process_package(name))
+        return label
+
+    def classify_all(self, names):
+        """Labels for many names, in order."""
+        memo = self._memo
+        lookup = self._lookup
+        labels = []
+        for name in names:
+            label = memo.get(name)
+            if label is None:
+                label = memo[name] = lookup(process_package(name))
+            labels.append(label)
+        return labels
+
+    def counts(self, names):
+        """{label: count} over many names, most common first.
+
+        Names are tallied first (Counter runs in C), so each distinct name
+        is classified once however often it repeats.
+        """
+        totals = {}
+        for name, count in Counter(names).items():
+            label = self.classify(name)
+            totals[label] = totals.get(label, 0) + count
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def bloat_count(self, names):
+        """How many of `names` carry a vendor label (anything outside NOT_BLOAT)."""
+        return sum(count for label, count in self.counts(names).items() if label not in NOT_BLOAT)
+
+
+def dump_names(lines):
+    """Package names from `pm list packages [-f]` lines, or process names from `ps -A`."""
+    for line in lines:
+        if line.startswith('package:'):
+            yield line[8:].rstrip().rpartition('=')[2]
+        elif line.strip() and not line.startswith('USER'):
+            yield line.split()[-1]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Per-vendor package/process counts.')
+    parser.add_argument('dumps', nargs='+', metavar='DUMP')
+    parser.add_argument('--rules', help='rule file (default: built-in rules)')
+    args = parser.parse_args(argv)
+
+    classifier = BloatClassifier(load_rules(args.rules) if args.rules else None)
+    for dump in args.dumps:
+        with open(dump, 'r', encoding='utf-8', errors='replace') as f:
+            counts = classifier.counts(dump_names(f))
+        total = sum(counts.values())
+
+        print("="*80)
+        print(f"🏷️  VENDOR BREAKDOWN: {dump}")
+        print("="*80)
+        for label, count in counts.items():
+            print(f"  {label:<24} {count:>7,}  ({count / total * 100:5.1f}%)")
+        print(f"  {'Total':<24} {total:>7,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,333 @@
+#!/usr/bin/env python3
+"""
+BUGREPORT INDEX - Byte offsets of every section in a full bugreport
+
+A full `adb bugreport` (or one long `adb shell dumpsys` capture) holds the
+meminfo, batterystats, usagestats and package dumps one after another,
+between headers like:
+
+    ------ SYSTEM LOG (logcat -v threadtime -d *:v) ------
+    DUMP OF SERVICE meminfo:
+    DUMP OF SERVICE HIGH batterystats:
+
+The first open scans the file once for those headers (mmap.find, no line
+splitting) and writes the byte range of each section to a sidecar next to
+the file:
+
+    bugreport.txt.idx.json    size/mtime of the indexed file, then
+                              [name, kind, start, end] per section
+
+Every later open loads the sidecar and maps the file, so pulling meminfo
+out of a 500 MB bugreport reads only meminfo's pages. The sidecar is
+rebuilt whenever the file's size or mtime changes, and skipped (index kept
+in memory) when the directory is read-only.
+
+Services are named as dumpsys names them ('meminfo', 'batterystats',
+'usagestats', 'package'); other sections by their title ('SYSTEM LOG').
+A name can occur more than once (CRITICAL/HIGH/NORMAL passes); section()
+returns the first non-empty one.
+
+A bugreport that cannot be mapped (still compressed inside a zip) is read
+front to back with iter_sections() instead, one section at a time.
+
+Usage:
+    python3 bugreport_index.py bugreport.txt            # list sections
+    python3 bugreport_index.py bugreport.txt meminfo    # print one section
+"""
+
+import io
+import itertools
+import json
+import mmap
+import os
+import sys
+
+_SERVICE = b'\nDUMP OF SERVICE '
+_SECTION = b'\n------ '
+_HEADER_PREFIXES = (_SERVICE[1:], _SECTION[1:])
+_PRIORITIES = ('CRITICAL', 'HIGH', 'NORMAL')
+_INDEX_VERSION = 1
+
+
+def sidecar_path(path):
+    return f'{path}.idx.json'
+
+
+def _header_name(line):
+    """(name, kind) for a header line, or None if it is not one.
+
+    "------ 0.2s was the duration of 'X' ------" closes a section; it comes
+    back as (None, 'end').
+    """
+    if line.startswith(_SERVICE[1:]):
+        words = line[len(_SERVICE) - 1:].decode('utf-8', 'replace').rstrip().rstrip(':').split()
+        if words and words[0] in _PRIORITIES:
+            words = words[1:]
+        return (words[0], 'service') if words else None
+    if line.startswith(_SECTION[1:]) and line.rstrip().endswith(b' ------'):
+        title = line.decode('utf-8', 'replace').strip().strip('-').strip()
+        if ' was the duration of ' in title:
+            return None, 'end'
+        # "SYSTEM LOG (logcat -v threadtime -d *:v)" -> "SYSTEM LOG"
+        return title.split(' (')[0], 'section'
+    return None
+
+
+def _trim_footer(data, start, end):
+    """Drop the separator/duration lines dumpsys prints after a service."""
+    while end > start:
+        line_start = data.rfind(b'\n', start, end - 1) + 1 or start
+        line = data[max(line_start, start):end]
+        if line.strip() and not line.startswith(b'---'):
+            break
+        end = max(line_start, start)
+    return end
+
+
+def scan_sections(data):
+    """[(name, kind, start, end)] for the sections of a mapped bugreport.
+
+    `start` is the first byte after the header line, `end` the start of
+    the next header (less any dumpsys footer). Headers are located with
+    find() on the two marker strings, so the scan runs at memory speed.
+    """
+    headers = []
+    size = len(data)
+    for marker in (_SERVICE, _SECTION):
+        if data[:len(marker) - 1] == marker[1:]:
+            headers.append(0)
+        pos = data.find(marker)
+        while pos != -1:
+            headers.append(pos + 1)
+            pos = data.find(marker, pos + 1)
+    headers.sort()
+
+    found = []
+    for line_start in headers:
+        line_end = data.find(b'\n', line_start)
+        line_end = size if line_end == -1 else line_end + 1
+        header = _header_name(data[line_start:line_end])
+        if header is not None:
+            found.append((line_start, line_end, header))
+
+    sections = []
+    for i, (_, body_start, (name, kind)) in enumerate(found):
+        if name is None:
+            continue
+        body_end = found[i + 1][0] if i + 1 < len(found) else size
+        sections.append((name, kind, body_start, _trim_footer(data, body_start, body_end)))
+    return sections
+
+
+class SectionTracker:
+    """scan_sections() for a file seen one line at a time, e.g. while it
+    is copied from a stream; `sections` matches what a scan would find."""
+
+    def __init__(self):
+        self.sections = []
+        self.offset = 0
+        self._open = None           # (name, kind, body start) of the current section
+        self._content_end = 0       # end of its last line that is not footer
+
+    def feed(self, line):
+        self.offset += len(line)
+        if line.startswith(_HEADER_PREFIXES):
+            header = _header_name(line)
+            if header is not None:
+                self._close()
+                name, kind = header
+                self._open = (name, kind, self.offset) if name is not None else None
+                self._content_end = self.offset
+                return
+        if line.strip() and not line.startswith(b'---'):
+            self._content_end = self.offset
+
+    def _close(self):
+        if self._open is not None:
+            self.sections.append(self._open + (self._content_end,))
+            self._open = None
+
+    def finish(self):
+        """Close the last section; returns `sections`."""
+        self._close()
+        return self.sections
+
+
+def _section_body(lines, next_header):
+    """Lines of one section, up to the next header (stored in next_header).
+
+    Trailing blank and dashed lines are held back and dropped at the end
+    of the section, as _trim_footer() does for mapped files.
+    """
+    held = []
+    for line in lines:
+        if line.startswith(_HEADER_PREFIXES):
+            header = _header_name(line)
+            if header is not None:
+                next_header.append(header)
+                return
+        if not line.strip() or line.startswith(b'---'):
+            held.append(line)
+            continue
+        if held:
+            yield from held
+            held.clear()
+        yield line
+
+
+def _next_header(lines):
+    """Skip to the next header line; its (name, kind), or None at the end."""
+    for line in lines:
+        if line.startswith(_HEADER_PREFIXES):
+            header = _header_name(line)
+            if header is not None:
+                return header
+    return None
+
+
+def iter_sections(raw_lines):
+    """(name, kind, lines) for each non-empty section, reading front to back.
+
+    For bugreports that cannot be mapped, e.g. a member streamed out of a
+    zip. `raw_lines` is any iterable of binary lines; each section's
+    `lines` must be used before asking for the next section. Whatever is
+    left unread is skipped with a bare prefix check per line.
+    """
+    lines = iter(raw_lines)
+    header = _next_header(lines)
+    while header is not None:
+        name, kind = header
+        next_header = []
+        body = _section_body(lines, next_header)
+        first = next(body, None)
+        if name is not None and first is not None:
+            yield name, kind, itertools.chain((first,), body)
+        if next_header:
+            header = next_header[0]
+        elif first is None:
+            header = None           # the body ran to the end of the file
+        else:
+            header = _next_header(lines)
+
+
+class BugreportIndex:
+    """Memory-mapped bugreport with random access to its sections."""
+
+    def __init__(self, path, sidecar=True):
+        self.path = path
+        self._file = open(path, 'rb')
+        stat = os.fstat(self._file.fileno())
+        self._stamp = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+        # mmap refuses empty files; an empty bugreport has no sections anyway
+        self._data = (mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+                      if stat.st_size else b'')
+        self.rebuilt = False
+        self.sections = self._load(sidecar) if sidecar else None
+        if self.sections is None:
+            self.sections = scan_sections(self._data)
+            self.rebuilt = True
+            if sidecar:
+                self._save()
+
+    def _load(self, sidecar):
+        try:
+            with open(sidecar_path(self.path)) as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if index.get('version') != _INDEX_VERSION or index.get('file') != self._stamp:
+            return None
+        return [tuple(section) for section in index['sections']]
+
+    def _save(self):
+        index = {'version': _INDEX_VERSION, 'file': self._stamp, 'sections': self.sections}
+        target = sidecar_path(self.path)
+        tmp = f'{target}.tmp'
+        try:
+            with open(tmp, 'w') as f:
+                json.dump(index, f, separators=(',', ':'))
+            os.replace(tmp, target)
+        except OSError:
+            # Read-only capture folder: keep the index for this process only
+            pass
+
+    def close(self):
+        if isinstance(self._data, mmap.mmap):
+            self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+    def names(self):
+        """Section names in file order, each once."""
+        return list(dict.fromkeys(name for name, _, _, _ in self.sections))
+
+    def find(self, name):
+        """(start, end) of the first non-empty section called `name`, or None."""
+        fallback = None
+        for section_name, _, start, end in self.sections:
+            if section_name == name:
+                if end > start:
+                    return start, end
+                fallback = fallback or (start, end)
+        return fallback
+
+    def section(self, name):
+        """The raw bytes of section `name` (KeyError if absent)."""
+        span = self.find(name)
+        if span is None:
+            raise KeyError(f'{self.path} has no {name!r} section')
+        return self._data[span[0]:span[1]]
+
+    def lines(self, name):
+        """Section `name` as a text stream, for the line-based parsers."""
+        return text_lines(self.section(name))
+
+
+def text_lines(data):
+    """Bytes of a section as a text stream, decoded like the dump files."""
+    return io.TextIOWrapper(io.BytesIO(data), encoding='utf-8', errors='replace')
+
+
+def read_range(path, start, end):
+    """Bytes [start, end) of `path` through a read-only map of the file.
+
+    Worker processes use this with offsets from the parent's index: every
+    process maps the same file, so the pages are shared through the page
+    cache rather than copied or pickled.
+    """
+    if end <= start:
+        return b''
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        return data[start:end]
+
+
+def is_bugreport(path):
+    """Whether `path` is a file with a bugreport/dumpsys section header near the top."""
+    if not os.path.isfile(path):
+        return False
+    with open(path, 'rb') as f:
+        head = b'\n' + f.read(64 * 1024)
+    return _SERVICE in head or (_SECTION in head and b'------\n' in head)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print(__doc__.strip())
+        sys.exit(1)
+
+    with BugreportIndex(sys.argv[1]) as index:
+        if len(sys.argv) == 3:
+            sys.stdout.buffer.write(index.section(sys.argv[2]))
+            sys.exit(0)
+        print("="*80)
+        print(f"📑 BUGREPORT INDEX: {sys.argv[1]} "
+              f"({'scanned' if index.rebuilt else 'from ' + sidecar_path(sys.argv[1])})")
+        print("="*80)
+        for name, kind, start, end in index.sections:
+            print(f"  {kind:8s} {name:40s} {start:>14,}  {(end - start) / 1024:>12,.1f} KB")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+CAPTURE ARCHIVE - Stream capture dumps straight out of zip and tar bundles
+
+Devices hand over captures as bugreport zips, and fleets ship them as
+tarballs of capture folders. iter_members() opens each regular file of
+such an archive as a binary stream that decompresses as it is read, so
+the parsers consume the dumps without anything being extracted:
+
+    zip                 zipfile, one member stream at a time
+    tar, tar.gz/bz2/xz  tarfile in stream mode ('r|*'), one forward pass
+
+Nothing is written to disk, and memory stays at one decompression buffer
+plus whatever the parser keeps, however many archives are processed.
+capture_loader.load_archive() turns an archive into capture dicts.
+
+Usage:
+    python3 capture_archive.py ARCHIVE          # list the members it would stream
+"""
+
+import io
+import sys
+import tarfile
+import zipfile
+
+_BUFFER = 1 << 20
+ARCHIVE_SUFFIXES = ('.zip', '.tar', '.tar.gz', '.tgz', '.tar.bz2', '.tbz2', '.tar.xz', '.txz')
+
+
+def is_archive(path):
+    """Whether `path` names a zip or tar archive (by its suffix)."""
+    return str(path).lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def archive_stem(path):
+    """'pixel-9-07.tar.gz' -> 'pixel-9-07'."""
+    name = str(path)
+    for suffix in sorted(ARCHIVE_SUFFIXES, key=len, reverse=True):
+        if name.lower().endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def iter_members(path):
+    """(member name, binary stream) for each regular file, in archive order.
+
+    Each stream is only valid until the next member is requested: tar
+    archives are read in a single forward pass.
+    """
+    if str(path).lower().endswith('.zip'):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if info.is_dir():
+                    continue
+                # ZipExtFile splits lines in Python; a BufferedReader does it in C
+                with io.BufferedReader(archive.open(info), _BUFFER) as raw:
+                    yield info.filename, raw
+        return
+
+    with tarfile.open(path, 'r|*') as archive:
+        for member in archive:
+            if not member.isfile():
+                continue
+            raw = archive.extractfile(member)
+            yield member.name, raw
+            raw.close()
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    for name, raw in iter_members(sys.argv[1]):
+        size = 0
+        while True:
+            chunk = raw.read(1 << 20)
+            if not chunk:
+                break
+            size += len(chunk)
+        print(f"  {size:>14,}  {name}")
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+CAPTURE LOADER - Turn one capture folder of raw dumps into a capture dict
+
+A capture folder holds whatever of these the device gave us:
+    meminfo.txt     adb shell dumpsys meminfo
+    packages.txt    adb shell pm list packages -f
+    ps.txt          adb shell ps -A
+    df.txt          adb shell df -k /data
+    batterystats.txt    adb shell dumpsys batterystats
+    usagestats.txt      adb shell dumpsys usagestats
+
+A full bugreport (bugreport.txt) can stand in for the dumpsys files: any
+of meminfo.txt / batterystats.txt / usagestats.txt / packages.txt that
+is missing is read from the bugreport's indexed section instead
+(bugreport_index.py). Passing a bugreport file instead of a folder loads
+its meminfo, batterystats, usagestats and package sections, optionally
+one worker process per section (-j): each worker maps the same file and
+parses only its byte range, and the merged capture is the same as a
+serial load. The pool is skipped when it cannot win: on one core, for a
+small report, or when one section is most of the work (plan_workers).
+
+Zip and tar bundles of capture folders or bugreports are read member by
+member without extracting (load_archive, capture_archive.py).
+
+The result uses the snapshot_store.COLUMNS keys, so it can go straight into
+a SnapshotStore or into the before/after dicts of the analysis scripts.
+Keys whose dump is missing are simply left out.
+
+Usage:
+    python3 capture_loader.py CAPTURE_DIR
+    python3 capture_loader.py bugreport.txt [-j WORKERS]
+    python3 capture_loader.py bugreport-device-2025-10-19.zip
+"""
+
+import argparse
+import io
+import os
+import posixpath
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from batterystats_parser import BatteryHistory
+from bugreport_index import BugreportIndex, iter_sections, read_range
+from capture_archive import is_archive, iter_members
+from meminfo_parser import MEMINFO_KEYS, parse_meminfo
+from ps_parser import parse_ps
+from usagestats_parser import parse_usagestats
+
+# Install locations that mean "came with the firmware"
+SYSTEM_PREFIXES = (
+    'package:/system/',
+    'package:/system_ext/',
+    'package:/product/',
+    'package:/vendor/',
+    'package:/odm/',
+    'package:/apex/',
+)
+
+
+def count_packages(lines):
+    """Count `pm list packages -f` lines into total/system/user apps."""
+    total = system = 0
+    for line in lines:
+        if not line.startswith('package:'):
+            continue
+        total += 1
+        if line.startswith(SYSTEM_PREFIXES):
+            system += 1
+    return {'total_packages': total, 'system_apps': system, 'user_apps': total - system}
+
+
+def count_dumpsys_packages(lines):
+    """Count the `Packages:` block of `dumpsys package` into total/system/user apps.
+
+    Uses each package's codePath= with the same install locations as
+    count_packages(). The `Hidden system packages:` block that follows
+    lists updated system apps a second time and is skipped.
+    """
+    system_dirs = tuple(prefix[len('package:'):] for prefix in SYSTEM_PREFIXES)
+    total = system = 0
+    in_packages = False
+    for line in lines:
+        if not line.startswith(' '):
+            if line.strip():
+                in_packages = line.startswith('Packages:')
+            continue
+        if not in_packages:
+            continue
+        stripped = line.lstrip()
+        if stripped.startswith('codePath='):
+            total += 1
+            if stripped[9:].startswith(system_dirs):
+                system += 1
+    return {'total_packages': total, 'system_apps': system, 'user_apps': total - system}
+
+
+def count_processes(lines):
+    """Count the processes of `ps -A [-o ...]` output, as ps_parser.parse_ps() reads them."""
+    return {'running_processes': len(parse_ps(lines))}
+
+
+def parse_df(lines, mount='/data'):
+    """Free/total GB for one mount point from `df -k` output."""
+    for line in lines:
+        fields = line.split()
+        if len(fields) >= 6 and fields[-1] == mount and fields[1].isdigit():
+            return {
+                'storage_total_gb': int(fields[1]) / (1024 * 1024),
+                'storage_free_gb': int(fields[3]) / (1024 * 1024),
+            }
+    return {}
+
+
+def _decoded(raw_lines):
+    return (line.decode('utf-8', 'replace') for line in raw_lines)
+
+
+def _meminfo_keys(snapshot):
+    keys = ('total_ram_kb', 'swap_total_kb') + tuple(key for key in MEMINFO_KEYS if key.endswith('_kb'))
+    return {key: snapshot[key] for key in keys if key in snapshot}
+
+
+def _battery_keys(raw_lines):
+    history = BatteryHistory()
+    history.update_stream(raw_lines)
+    capture = {}
+    if history.state['level'] >= 0:
+        capture['battery_level'] = history.state['level']
+    if history.state['temp'] >= 0:
+        capture['battery_temp_c'] = history.state['temp'] / 10
+    return capture
+
+
+def _usage_keys(events):
+    return {'foreground_hours': int(events.foreground_ms().sum()) / 3_600_000} if len(events) else {}
+
+
+def _package_keys(lines):
+    counts = count_dumpsys_packages(lines)
+    return counts if counts['total_packages'] else {}
+
+
+# Capture folder dump -> parser of its binary lines into capture keys, in
+# merge order, with the bugreport section that can stand in for the dump
+CAPTURE_FILES = {
+    'meminfo.txt': (lambda raw: _meminfo_keys(parse_meminfo(_decoded(raw))), 'meminfo'),
+    'batterystats.txt': (_battery_keys, 'batterystats'),
+    'usagestats.txt': (lambda raw: _usage_keys(parse_usagestats(_decoded(raw))), 'usagestats'),
+    'packages.txt': (lambda raw: count_packages(_decoded(raw)), 'package'),
+    'ps.txt': (lambda raw: count_processes(_decoded(raw)), None),
+    'df.txt': (lambda raw: parse_df(_decoded(raw)), None),
+}
+
+# Bugreport section -> parser of its binary lines into capture keys
+BUGREPORT_SECTIONS = {
+    'meminfo': CAPTURE_FILES['meminfo.txt'][0],
+    'batterystats': _battery_keys,
+    'usagestats': CAPTURE_FILES['usagestats.txt'][0],
+    'package': lambda raw: _package_keys(_decoded(raw)),
+}
+
+
+def assemble_capture(dumps, sections):
+    """One capture from parsed dumps ({file name: keys}) and bugreport
+    sections ({section: keys}); a section only fills in for a missing dump."""
+    capture = {}
+    for name, (_, section) in CAPTURE_FILES.items():
+        if name in dumps:
+            capture.update(dumps[name])
+        elif section in sections:
+            capture.update(sections[section])
+    return capture
+
+
+# Relative parse cost per byte of each section, from
+# benchmarks/bench_bugreport_parallel.py (usagestats = 1)
+SECTION_COST = {'meminfo': 2, 'batterystats': 8, 'usagestats': 1, 'package': 1}
+
+# A pool only pays for its start-up on at least this much weighted work,
+# and only when no single section is more than this share of it
+PARALLEL_MIN_COST = 16 * 1024 * 1024
+PARALLEL_MAX_SHARE = 0.75
+
+
+def plan_workers(spans, workers=None):
+    """Worker processes worth starting for these {section: (start, end)} spans.
+
+    1 means parse serially: a pool cannot beat that on one core, on a
+    small report, or when one section dominates the wall time anyway.
+    """
+    cores = os.cpu_count() or 1
+    workers = min(workers or cores, cores, len(spans))
+    costs = [(end - start) * SECTION_COST.get(name, 1) for name, (start, end) in spans.items()]
+    total = sum(costs)
+    if workers < 2 or total < PARALLEL_MIN_COST or max(costs) > PARALLEL_MAX_SHARE * total:
+        return 1
+    return workers
+
+
+def _parse_section(path, name, start, end):
+    """Parse one section of a bugreport (runs in a worker)."""
+    return BUGREPORT_SECTIONS[name](io.BytesIO(read_range(path, start, end)))
+
+
+def bugreport_sections(path, sections=tuple(BUGREPORT_SECTIONS), workers=1):
+    """{section: capture keys} for the known sections of a bugreport file.
+
+    With workers other than 1 each section is parsed in its own process
+    (workers=None: up to one per core), largest section first, so the
+    wall time approaches that of the largest section; plan_workers()
+    falls back to a serial parse where the pool cannot help.
+    """
+    with BugreportIndex(path) as index:
+        spans = {name: index.find(name) for name in BUGREPORT_SECTIONS if name in sections}
+        spans = {name: span for name, span in spans.items() if span}
+        workers = plan_workers(spans, workers) if workers != 1 else 1
+        if workers == 1:
+            return {name: BUGREPORT_SECTIONS[name](io.BytesIO(index.section(name))) for name in spans}
+
+    # Offsets, not bytes, go to the workers: each maps the file itself
+    jobs = sorted(spans, key=lambda name: spans[name][0] - spans[name][1])
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {name: pool.submit(_parse_section, path, name, *spans[name]) for name in jobs}
+        return {name: futures[name].result() for name in spans}
+
+
+def stream_bugreport_sections(raw_lines, sections=tuple(BUGREPORT_SECTIONS)):
+    """bugreport_sections() for binary lines read front to back (an archive member)."""
+    parts = {}
+    for name, _, lines in iter_sections(raw_lines):
+        if name in sections and name not in parts:
+            parts[name] = BUGREPORT_SECTIONS[name](lines)
+    return parts
+
+
+def load_bugreport(path, sections=tuple(BUGREPORT_SECTIONS), workers=1):
+    """Capture keys from the known sections of a bugreport file.
+
+    Serial and parallel loads (see bugreport_sections) give the same capture.
+    """
+    return assemble_capture({}, bugreport_sections(path, sections, workers))
+
+
+def _is_bugreport_name(name):
+    return name.startswith('bugreport') and name.endswith('.txt')
+
+
+def load_archive(path):
+    """{folder: capture} for every capture folder inside a zip or tar archive.
+
+    Members are decompressed as they are parsed and never written to disk.
+    A folder is any directory holding capture dumps or a bugreport*.txt
+    ('' for the archive root), so a device bundle with before/ and after/
+    gives two captures and a bugreport zip gives one.
+    """
+    dumps, sections = {}, {}
+    for name, raw in iter_members(path):
+        folder, base = posixpath.split(name)
+        if base in CAPTURE_FILES:
+            dumps.setdefault(folder, {})[base] = CAPTURE_FILES[base][0](raw)
+        elif _is_bugreport_name(base) and folder not in sections:
+            sections[folder] = stream_bugreport_sections(raw)
+    return {folder: assemble_capture(dumps.get(folder, {}), sections.get(folder, {}))
+            for folder in sorted(dumps.keys() | sections.keys())}
+
+
+def load_capture_dir(path, workers=1):
+    """Parse every known dump in a capture folder into one flat dict.
+
+    `path` may also be a bugreport file (see load_bugreport) or an archive
+    holding a single capture (see load_archive).
+    """
+    if is_archive(path):
+        captures = load_archive(path)
+        if len(captures) != 1:
+            raise ValueError(f'{path} holds {len(captures)} captures: {", ".join(captures) or "none"}')
+        return next(iter(captures.values()))
+    if os.path.isfile(path):
+        return load_bugreport(path, workers=workers)
+
+    dumps = {}
+    for name, (parse, _) in CAPTURE_FILES.items():
+        dump = os.path.join(path, name)
+        if os.path.exists(dump):
+            with open(dump, 'rb') as raw:
+                dumps[name] = parse(raw)
+
+    sections = {}
+    missing = [section for name, (_, section) in CAPTURE_FILES.items()
+               if section and name not in dumps]
+    bugreport = os.path.join(path, 'bugreport.txt')
+    if missing and os.path.exists(bugreport):
+        sections = bugreport_sections(bugreport, missing, workers)
+    return assemble_capture(dumps, sections)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Parse a capture folder or bugreport.')
+    parser.add_argument('path', help='capture folder, bugreport file or single-capture archive')
+    parser.add_argument('-j', '--workers', type=int, default=1,
+                        help='bugreport sections to parse in parallel (0: one per core)')
+    args = parser.parse_args(argv)
+
+    for key, value in load_capture_dir(args.path, args.workers or None).items():
+        print(f"  {key:18s} {value:,}" if isinstance(value, int) else f"  {key:18s} {value:.2f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+CHROMOSOME SERIES - Every chromosome over time, not just before/after
+
+A device captured every few minutes is a row per capture in a
+SnapshotStore: append-only, one memory-mapped column per metric, with
+geometric growth so appends are O(1) amortised. This module reads the six
+chromosome columns of one device back as time series and summarises them:
+
+    window_aggregates()   min / max / mean / p95 / count per window (default 1 h)
+    window_means()        per-window means of many columns at once
+    downsample()          min/max envelope with at most N points, for plotting
+
+Both are a sort plus a few ufunc.reduceat calls, so a month of per-minute
+captures (43,200 rows) is queried in milliseconds.
+
+Usage:
+    python3 chromosome_series.py STORE_DIR [--device NAME] [--window-minutes 60]
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+from genetic_score import CHROMOSOMES
+from recorded_captures import RECORDED_DEVICE
+from snapshot_store import SnapshotStore
+
+HOUR_MS = 3_600_000
+
+
+def chromosome_series(store, device=RECORDED_DEVICE, keys=None):
+    """(times_ms, {key: values}) for one device, sorted by capture time.
+
+    Values are float64 with missing captures (-1 / NaN in the store) as NaN.
+    """
+    rows = store.device_rows(device)
+    times = np.asarray(store.column('captured_at_ms')[rows])
+    order = np.argsort(times, kind='stable')
+    series = {}
+    for key in keys or [key for _, key, _ in CHROMOSOMES]:
+        values = np.asarray(store.column(key)[rows], dtype=np.float64)[order]
+        values[values < 0] = np.nan
+        series[key] = values
+    return times[order], series
+
+
+def _windows(times, window_ms):
+    """Window index per sample and the start offset of every window run."""
+    bucket = times // window_ms
+    starts = np.flatnonzero(np.r_[True, bucket[1:] != bucket[:-1]])
+    return bucket, starts
+
+
+def window_aggregates(times, values, window_ms=HOUR_MS, percentile=95):
+    """Per-window statistics of one series (`times` sorted, NaN = missing).
+
+    Returns a dict of equal-length arrays: window_start_ms, count, min, max,
+    mean and p<percentile> (linear interpolation, as np.percentile).
+    """
+    keep = ~np.isnan(values)
+    times, values = times[keep], values[keep]
+    if not len(values):
+        empty = np.empty(0)
+        return {'window_start_ms': empty.astype(np.int64), 'count': empty.astype(np.int64),
+                'min': empty, 'max': empty, 'mean': empty, f'p{percentile}': empty}
+
+    bucket, starts = _windows(times, window_ms)
+    counts = np.diff(np.r_[starts, len(values)])
+
+    # Sort values inside each window, then read the percentile per window
+    ordered = values[np.lexsort((values, bucket))]
+    position = starts + (counts - 1) * (percentile / 100)
+    low = np.floor(position).astype(np.int64)
+    high = np.ceil(position).astype(np.int64)
+    pct = ordered[low] + (ordered[high] - ordered[low]) * (position - low)
+
+    return {
+        'window_start_ms': bucket[starts] * window_ms,
+        'count': counts,
+        'min': np.minimum.reduceat(values, starts),
+        'max': np.maximum.reduceat(values, starts),
+        'mean': np.add.reduceat(values, starts) / counts,
+        f'p{percentile}': pct,
+    }
+
+
+def window_means(times, columns, window_ms=HOUR_MS):
+    """Mean of several columns per window, ignoring NaN.
+
+    `times` must be sorted. Returns (window_start_ms, {name: means}); a
+    window where a column has no values gets NaN for it.
+    """
+    if not len(times):
+        return np.empty(0, dtype=np.int64), {name: np.empty(0) for name in columns}
+    bucket, starts = _windows(times, window_ms)
+    means = {}
+    for name, values in columns.items():
+        values = np.asarray(values, dtype=np.float64)
+        present = ~np.isnan(values)
+        sums = np.add.reduceat(np.where(present, values, 0.0), starts)
+        counts = np.add.reduceat(present.astype(np.int64), starts)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means[name] = sums / counts
+    return bucket[starts] * window_ms, means
+
+
+def downsample(times, values, max_points=1000):
+    """Min/max envelope of a series in at most `max_points` points.
+
+    The span is cut into max_points // 2 equal windows and each keeps its
+    lowest and highest sample, in time order, so spikes survive plotting.
+    """
+    keep = ~np.isnan(values)
+    times, values = times[keep], values[keep]
+    if len(values) <= max_points:
+        return times, values
+
+    span = int(times[-1] - times[0]) + 1
+    window_ms = -(-span // max(1, max_points // 2))
+    bucket, starts = _windows(times - times[0], window_ms)
+
+    # Positions of each window's min and max: sort by (window, value)
+    by_value = np.lexsort((values, bucket))
+    ends = np.r_[starts[1:], len(values)] - 1
+    picks = np.unique(np.r_[by_value[starts], by_value[ends]])
+    return times[picks], values[picks]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Chromosome time series of one device.')
+    parser.add_argument('store_dir')
+    parser.add_argument('--device', default=RECORDED_DEVICE)
+    parser.add_argument('--window-minutes', type=int, default=60)
+    args = parser.parse_args(argv)
+
+    store = SnapshotStore(args.store_dir)
+    times, series = chromosome_series(store, args.device)
+
+    print("="*80)
+    print(f"📈 CHROMOSOME SERIES: {args.device}")
+    print("="*80)
+    print(f"  Captures: {len(times):,}")
+    if not len(times):
+        return 1
+    for chromosome, key, _ in CHROMOSOMES:
+        stats = window_aggregates(times, series[key], args.window_minutes * 60_000)
+        if not len(stats['count']):
+            continue
+        print(f"\n  {chromosome} ({key}) - {len(stats['count']):,} windows, last window:")
+        print(f"    min {stats['min'][-1]:,.0f}  max {stats['max'][-1]:,.0f}  "
+              f"mean {stats['mean'][-1]:,.0f}  p95 {stats['p95'][-1]:,.0f}  "
+              f"({stats['count'][-1]} captures)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
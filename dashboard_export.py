@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+DASHBOARD EXPORT - Chunked history files for the React dashboard
+
+Precomputes the dashboard scores (dashboard_metrics.py) for every capture
+of one device in a SnapshotStore and writes them as small time-chunked
+files at three resolutions, so the dashboard fetches only the chunks that
+cover the visible window at a resolution that fits the chart:
+
+    history/
+        manifest.json           fields, resolutions, chunk index, latest capture
+        raw/<start_ms>.json     every capture, one chunk per 6 hours
+        1h/<start_ms>.json      hourly means, one chunk per week
+        1d/<start_ms>.json      daily means, one chunk per year
+
+Chunks are columnar JSON: {"t": [ms, ...], "<field>": [value, ...], ...}
+with values rounded to one decimal exactly as JavaScript's toFixed(1)
+rounds them (dashboard_metrics.to_fixed1) and null for missing. With
+`--format arrow` they are Arrow IPC files instead (needs pyarrow).
+react-app/src/historyLoader.js reads the JSON layout.
+
+Usage:
+    python3 dashboard_export.py STORE_DIR [-o react-app/public/history] [--device NAME]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import sys
+
+import numpy as np
+
+from chromosome_series import HOUR_MS, window_means
+from dashboard_metrics import store_metrics, to_fixed1
+from recorded_captures import RECORDED_DEVICE
+from snapshot_store import SnapshotStore
+
+DAY_MS = 24 * HOUR_MS
+
+# (name, averaging window, chunk span): a few hundred rows per chunk
+RESOLUTIONS = (
+    ('raw', None, 6 * HOUR_MS),
+    ('1h', HOUR_MS, 7 * DAY_MS),
+    ('1d', DAY_MS, 365 * DAY_MS),
+)
+
+# Store columns exported next to the scores, with their scale
+RAW_FIELDS = {
+    'swap_used_gb': ('zram_swap_kb', 1 / 1024 / 1024),
+    'total_packages': ('total_packages', 1),
+    'running_processes': ('running_processes', 1),
+    'battery_level': ('battery_level', 1),
+    'battery_temp_c': ('battery_temp_c', 1),
+    'total_ram_gb': ('total_ram_kb', 1 / 1024 / 1024),
+}
+
+
+def device_history(store, device=RECORDED_DEVICE):
+    """(times_ms, {field: float64 values}) for one device, in time order."""
+    rows = store.device_rows(device)
+    times = np.asarray(store.column('captured_at_ms')[rows])
+    order = np.argsort(times, kind='stable')
+    rows, times = rows[order], times[order]
+
+    fields = store_metrics(store, rows)
+    for field, (column, scale) in RAW_FIELDS.items():
+        values = np.asarray(store.column(column)[rows], dtype=np.float64)
+        values[values < 0] = np.nan
+        fields[field] = values * scale
+    return times, fields
+
+
+def _json_values(values):
+    rounded = to_fixed1(values).tolist()
+    for i in np.flatnonzero(np.isnan(values)).tolist():
+        rounded[i] = None
+    return rounded
+
+
+def _write_json(path, times, fields):
+    chunk = {'t': times.tolist()}
+    chunk.update((name, _json_values(values)) for name, values in fields.items())
+    with open(path, 'w') as f:
+        json.dump(chunk, f, separators=(',', ':'), allow_nan=False)
+
+
+def _pyarrow():
+    try:
+        import pyarrow as pa
+        import pyarrow.ipc  # noqa: F401
+    except ImportError:
+        raise ImportError('Arrow export needs pyarrow (pip install pyarrow)') from None
+    return pa
+
+
+def _write_arrow(path, times, fields):
+    pa = _pyarrow()
+    table = pa.table({'t': pa.array(times, pa.int64()),
+                      **{name: pa.array(values, pa.float64(), from_pandas=True)
+                         for name, values in fields.items()}})
+    with pa.OSFile(path, 'wb') as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def export_history(times, fields, out_dir, device=RECORDED_DEVICE, fmt='json'):
+    """Write every resolution's chunks plus manifest.json; returns the manifest."""
+    if fmt == 'arrow':
+        _pyarrow()      # fail before touching out_dir
+    write = _write_arrow if fmt == 'arrow' else _write_json
+    tmp_dir = out_dir.rstrip(os.sep) + '.tmp'
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    manifest = {
+        'device': device,
+        'format': fmt,
+        'fields': list(fields),
+        'start_ms': int(times[0]) if len(times) else None,
+        'end_ms': int(times[-1]) if len(times) else None,
+        'resolutions': [],
+        'latest': ({'t': int(times[-1]), **{name: _json_values(values[-1:])[0]
+                                             for name, values in fields.items()}}
+                   if len(times) else None),
+    }
+
+    for name, window_ms, chunk_ms in RESOLUTIONS:
+        if window_ms is None:
+            res_times, res_fields = times, fields
+        else:
+            res_times, res_fields = window_means(times, fields, window_ms)
+        os.makedirs(os.path.join(tmp_dir, name))
+
+        chunks = []
+        if len(res_times):
+            chunk_ids = res_times // chunk_ms
+            bounds = np.flatnonzero(np.r_[True, chunk_ids[1:] != chunk_ids[:-1], True])
+            for lo, hi in zip(bounds[:-1], bounds[1:]):
+                start_ms = int(chunk_ids[lo] * chunk_ms)
+                path = f'{name}/{start_ms}.{fmt}'
+                write(os.path.join(tmp_dir, path), res_times[lo:hi],
+                      {field: values[lo:hi] for field, values in res_fields.items()})
+                chunks.append({'start_ms': start_ms, 'end_ms': start_ms + chunk_ms,
+                               'rows': int(hi - lo), 'path': path})
+        manifest['resolutions'].append({'name': name, 'window_ms': window_ms,
+                                        'chunk_ms': chunk_ms, 'chunks': chunks})
+
+    with open(os.path.join(tmp_dir, 'manifest.json'), 'w') as f:
+        json.dump(manifest, f, separators=(',', ':'))
+
+    # Swap the whole directory in, so the dashboard never sees half an export
+    old_dir = out_dir.rstrip(os.sep) + '.old'
+    shutil.rmtree(old_dir, ignore_errors=True)
+    if os.path.exists(out_dir):
+        os.replace(out_dir, old_dir)
+    os.replace(tmp_dir, out_dir)
+    shutil.rmtree(old_dir, ignore_errors=True)
+    return manifest
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Export dashboard history chunks.')
+    parser.add_argument('store_dir')
+    parser.add_argument('-o', '--out-dir', default=os.path.join('react-app', 'public', 'history'))
+    parser.add_argument('--device', default=RECORDED_DEVICE)
+    parser.add_argument('--format', choices=('json', 'arrow'), default='json')
+    args = parser.parse_args(argv)
+
+    times, fields = device_history(SnapshotStore(args.store_dir), args.device)
+    try:
+        manifest = export_history(times, fields, args.out_dir, args.device, args.format)
+    except ImportError as e:
+        parser.error(str(e))
+
+    print("="*80)
+    print(f"📤 DASHBOARD EXPORT: {args.out_dir}")
+    print("="*80)
+    print(f"  Captures: {len(times):,}  Fields: {len(fields)}  Format: {args.format}")
+    for resolution in manifest['resolutions']:
+        rows = sum(chunk['rows'] for chunk in resolution['chunks'])
+        print(f"  {resolution['name']:<4} {len(resolution['chunks']):>5,} chunks {rows:>9,} rows")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
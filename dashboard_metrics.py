@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+DASHBOARD METRICS - The PhoneDNA Pro dashboard scores, computed in Python
+
+Port of calculateMetrics() in react-app/src/Dashboard.jsx, over arrays so
+that every capture of a device (or a fleet) is scored at once:
+
+    ramUsedGB            (total - free) KB in GB
+    ramUsagePercent      (total - free) / total * 100
+    swapUsagePercent     (swapTotal - swapFree) / swapTotal * 100
+    geneticIntegrity     100 - bloatware %
+    metabolicEfficiency  (100 - battery temperature) * 0.7 + battery level * 0.3
+    cellularHealth       100 - ramUsagePercent * 0.6 - swapUsagePercent * 0.4
+    overallHealth        mean of geneticIntegrity, metabolicEfficiency, cellularHealth
+
+Like the dashboard, each score is rounded to one decimal before the next
+one uses it, and the rounding is JavaScript's: parseFloat(x.toFixed(1))
+picks the nearest tenth to the exact binary value of x, ties away from
+zero. np.round() rounds x * 10 instead, which disagrees for values such as
+0.15 (0.1499999... in binary, "0.1" in JS, 0.2 in NumPy), so to_fixed1()
+decides each rounding exactly. The results match calculateMetrics() in
+react-app/src/dashboardMetrics.js bit for bit
+(benchmarks/bench_dashboard_metrics.py checks this against Node).
+
+Usage:
+    python3 dashboard_metrics.py STORE_DIR      # latest scores of every device
+"""
+
+import argparse
+import sys
+
+import numpy as np
+
+METRICS = (
+    'ramUsedGB',
+    'ramUsagePercent',
+    'swapUsagePercent',
+    'geneticIntegrity',
+    'metabolicEfficiency',
+    'parasiticLoad',
+    'cellularHealth',
+    'overallHealth',
+)
+
+
+_SPLIT = 2.0 ** 27 + 1   # Veltkamp splitter for float64
+
+
+def to_fixed1(values):
+    """parseFloat(value.toFixed(1)) of JavaScript, elementwise.
+
+    For |x| the candidate tenth n = floor(x * 10) is rounded up when x is
+    at or above the midpoint (2n + 1) / 20. That comparison is made exact
+    by splitting x into two halves whose products with 20 are exact.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    x = np.abs(values)
+    with np.errstate(invalid='ignore', over='ignore'):
+        n = np.floor(x * 10)
+        scaled = x * _SPLIT
+        high = scaled - (scaled - x)
+        low = x - high
+        # sign of 20x - (2n + 1), exact: both partial products are exact and
+        # the first difference is exact whenever it is small enough to matter
+        above = (high * 20 - (2 * n + 1)) + low * 20 >= 0
+    return np.copysign(np.where(above, n + 1, n) / 10, values)
+
+
+def dashboard_metrics(total_kb, free_kb, swap_total_kb, swap_free_kb,
+                      temperature_c, battery_level, bloatware_pct):
+    """Every dashboard score for arrays of captures (NaN in, NaN out)."""
+    total_kb, free_kb, swap_total_kb, swap_free_kb, temperature_c, battery_level, bloatware_pct = (
+        np.asarray(v, dtype=np.float64) for v in
+        (total_kb, free_kb, swap_total_kb, swap_free_kb, temperature_c, battery_level, bloatware_pct)
+    )
+    with np.errstate(invalid='ignore', divide='ignore'):
+        ram = to_fixed1((total_kb - free_kb) / total_kb * 100)
+        swap = to_fixed1((swap_total_kb - swap_free_kb) / swap_total_kb * 100)
+    genetic = to_fixed1(100 - bloatware_pct)
+    metabolic = to_fixed1((100 - temperature_c) * 0.7 + battery_level * 0.3)
+    cellular = to_fixed1(100 - ram * 0.6 - swap * 0.4)
+    return {
+        'ramUsedGB': (total_kb - free_kb) / 1024 / 1024,
+        'ramUsagePercent': ram,
+        'swapUsagePercent': swap,
+        'geneticIntegrity': genetic,
+        'metabolicEfficiency': metabolic,
+        'parasiticLoad': bloatware_pct,
+        'cellularHealth': cellular,
+        'overallHealth': to_fixed1((genetic + metabolic + cellular) / 3),
+    }
+
+
+def _column(store, name, rows):
+    """One store column as float64 for `rows`, with missing (-1) as NaN."""
+    values = np.asarray(store.column(name)[rows], dtype=np.float64)
+    values[values < 0] = np.nan
+    return values
+
+
+def store_metrics(store, rows=None, bloatware_pct=None):
+    """Dashboard scores for SnapshotStore rows (all rows by default).
+
+    Free RAM is the `K free` part of meminfo's Free RAM line and swap free
+    is total swap minus the ZRAM swap in use, as on the dashboard. The
+    bloatware share defaults to system apps / all packages (54.3% for the
+    recorded before scan); pass `bloatware_pct` to use a classifier's figure.
+    """
+    rows = np.arange(len(store)) if rows is None else rows
+    swap_total = _column(store, 'swap_total_kb', rows)
+    if bloatware_pct is None:
+        with np.errstate(invalid='ignore', divide='ignore'):
+            bloatware_pct = _column(store, 'system_apps', rows) / _column(store, 'total_packages', rows) * 100
+    return dashboard_metrics(
+        _column(store, 'total_ram_kb', rows),
+        _column(store, 'free_memory_kb', rows),
+        swap_total,
+        swap_total - _column(store, 'zram_swap_kb', rows),
+        _column(store, 'battery_temp_c', rows),
+        _column(store, 'battery_level', rows),
+        bloatware_pct,
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Dashboard scores for every device in a store.')
+    parser.add_argument('store_dir')
+    args = parser.parse_args(argv)
+
+    from snapshot_store import SnapshotStore
+    store = SnapshotStore(args.store_dir)
+    metrics = store_metrics(store)
+    device_ids = np.asarray(store.column('device_id')[:len(store)])
+    times = np.asarray(store.column('captured_at_ms')[:len(store)])
+
+    print("="*80)
+    print(f"🩺 DASHBOARD METRICS: {len(store):,} captures")
+    print("="*80)
+    print(f"  {'Device':<32} {'Overall':>8} {'Genetic':>8} {'Metabolic':>10} {'Cellular':>9}")
+    for device_id, device in enumerate(store.manifest['devices']):
+        rows = np.flatnonzero(device_ids == device_id)
+        if not len(rows):
+            continue
+        latest = rows[np.argmax(times[rows])]
+        print(f"  {device[:32]:<32} {metrics['overallHealth'][latest]:>8.1f} "
+              f"{metrics['geneticIntegrity'][latest]:>8.1f} "
+              f"{metrics['metabolicEfficiency'][latest]:>10.1f} "
+              f"{metrics['cellularHealth'][latest]:>9.1f}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
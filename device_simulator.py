@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+DEVICE SIMULATOR - Stand-in phones for the live ingest service
+
+SimulatedTransport answers the same shell() calls as AdbTransport in
+live_ingest.py, but from replayed dumps instead of hardware. Every device
+walks through the same list of frames (one dict of command -> output per
+capture) at `speed` times real time, starting at its own fixed offset, so
+a run is deterministic for a given clock and a single box can host
+hundreds of phones.
+
+Frames come from recorded capture folders (load_frames) or are generated:
+synthetic_frames() morphs the recorded before scan into the after scan
+while the battery history keeps growing, as on a phone being debloated.
+
+Usage:
+    python3 device_simulator.py [n_frames]     # print a summary of the synthetic frames
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+from live_ingest import COMMANDS
+from recorded_captures import RECORDED_CAPTURES
+from synthetic_dumps import batterystats_lines, meminfo_lines, ps_lines
+
+# Capture folder file for each command (see capture_loader.py)
+FRAME_FILES = {
+    'meminfo': 'meminfo.txt',
+    'battery': 'batterystats.txt',
+    'ps': 'ps.txt',
+}
+
+
+def load_frames(capture_dirs):
+    """One frame per capture folder, in order; missing dumps are left out."""
+    frames = []
+    for path in capture_dirs:
+        frame = {}
+        for name, filename in FRAME_FILES.items():
+            dump = os.path.join(path, filename)
+            if os.path.exists(dump):
+                with open(dump, 'rb') as f:
+                    frame[COMMANDS[name]] = f.read()
+        frames.append(frame)
+    return frames
+
+
+def batterystats_dump(history, frame):
+    """A whole `dumpsys batterystats` output around the history lines.
+
+    As on a phone, the header's usage figures and the sections after the
+    history (Per-PID Stats, Statistics since last charge) change size
+    from one capture to the next.
+    """
+    used = 5980 + 120 * frame
+    lines = [f"Battery History ({used * 100 // 262144}% used, {used} used of 256KB, "
+             f"{45 + frame} strings using {2562 + 37 * frame}):\n"]
+    lines += history[1:]
+    lines.append("\n")
+    lines.append("Per-PID Stats:\n")
+    for pid in range(1000, 1000 + 8 * (1 + frame % 5), 8):
+        lines.append(f"  PID {pid} wake time: +{(pid * (frame + 1)) % 60_000}ms\n")
+    lines.append("\n")
+    lines.append("Statistics since last charge:\n")
+    lines.append(f"  System starts: {frame + 1}, currently on battery: true\n")
+    lines.append(f"  Time on battery: {frame}m 0s 0ms ({frame * 60_000}ms) realtime\n")
+    return ''.join(lines).encode()
+
+
+def synthetic_frames(n_frames=60, seed=0, processes=200, history_per_frame=10):
+    """Frames that move from the recorded before scan to the after scan.
+
+    Each frame's battery history is the previous one plus
+    `history_per_frame` events, about what a phone logs per minute.
+    """
+    before, after = RECORDED_CAPTURES['before'], RECORDED_CAPTURES['after']
+    # batterystats_lines() ends the block with a blank line; the dump adds its own
+    history = list(batterystats_lines(n_events=n_frames * history_per_frame + 3, seed=seed))[:-1]
+    frames = []
+    for i in range(n_frames):
+        progress = i / max(1, n_frames - 1)
+        snapshot = {
+            key: round(before[key] + (after[key] - before[key]) * progress)
+            for key in before if key.endswith('_kb')
+        }
+        running = round(before['running_processes']
+                        + (after['running_processes'] - before['running_processes']) * progress)
+        frames.append({
+            COMMANDS['meminfo']: ''.join(meminfo_lines(processes, seed + i, snapshot)).encode(),
+            COMMANDS['battery']: batterystats_dump(history[:3 + history_per_frame * (i + 1)], i),
+            COMMANDS['ps']: ''.join(ps_lines(running, seed + i)).encode(),
+        })
+    return frames
+
+
+class SimulatedTransport:
+    """ADB-compatible transport backed by replayed frames."""
+
+    def __init__(self, n_devices, frames, speed=1.0, frame_interval_s=60.0,
+                 latency_s=0.0, clock=time.monotonic):
+        self.serials = [f'sim-{i:04d}' for i in range(n_devices)]
+        self.frames = frames
+        self.speed = speed
+        self.frame_interval_s = frame_interval_s
+        self.latency_s = latency_s
+        self.clock = clock
+        self._start = clock()
+        # Spread devices over the frame list so they are not in lockstep
+        self._offsets = {serial: (i * 7) % len(frames) for i, serial in enumerate(self.serials)}
+
+    async def devices(self):
+        return list(self.serials)
+
+    def frame_index(self, serial):
+        elapsed = (self.clock() - self._start) * self.speed
+        step = int(elapsed // self.frame_interval_s)
+        return (self._offsets[serial] + step) % len(self.frames)
+
+    async def shell(self, serial, command):
+        if serial not in self._offsets:
+            raise OSError(f'device {serial} not found')
+        if self.latency_s:
+            await asyncio.sleep(self.latency_s)
+        try:
+            return self.frames[self.frame_index(serial)][command]
+        except KeyError:
+            raise OSError(f'{serial}: {command}: not found') from None
+
+
+if __name__ == '__main__':
+    n_frames = int(sys.argv[1]) if len(sys.argv) > 1 else 60
+    frames = synthetic_frames(n_frames)
+    sizes = {command: sum(len(frame[command]) for frame in frames) for command in COMMANDS.values()}
+
+    print("="*80)
+    print("📲 SIMULATED DEVICE FRAMES")
+    print("="*80)
+    print(f"  Frames: {len(frames)}")
+    for command, size in sizes.items():
+        print(f"  {command:<22} {size / len(frames) / 1024:8.1f} KB per frame")
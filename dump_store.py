@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+DUMP STORE - Deduplicated, compressed archive of every raw dump we keep
+
+Successive captures of the same phone repeat most of their text: the
+package list, most of the Battery History, whole logcat stretches. Each
+dump added here is cut into content-defined chunks. A chunk ends after a
+line whose CRC32 has its low bits clear, once the chunk holds MIN_CHUNK
+bytes; an inserted or changed line therefore only moves the boundaries
+around it. No chunk is longer than MAX_CHUNK; a longer line (a binary
+member without newlines) is cut at that size. Chunks are keyed by a
+128-bit BLAKE2b digest and stored once across all captures and devices.
+New chunks are packed into zlib frames of about FRAME_SIZE bytes, each
+compressed on its own, so any byte range of any dump comes back by
+decompressing only the frames it touches.
+
+Store directory layout:
+    manifest.json   dumps (name, device, size, sha256, recipe range,
+                    bugreport sections) and the committed length of each file
+    frames.bin      zlib frames back to back
+    frames.idx      <QII per frame: offset in frames.bin, stored size, raw size
+    chunks.idx      <16sIII per unique chunk: digest, frame, offset in frame, length
+    recipes.bin     uint32 chunk ids, dump after dump
+
+Files are appended first and manifest.json is replaced last; bytes past
+the lengths it records (from an interrupted add) are cut off on the
+next add.
+
+Usage:
+    python3 dump_store.py STORE add DUMP... [--device NAME]   # files or zip/tar bundles
+    python3 dump_store.py STORE list
+    python3 dump_store.py STORE cat DUMP_ID [SECTION]
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import zlib
+from array import array
+from collections import OrderedDict
+
+import numpy as np
+
+from bugreport_index import SectionTracker
+from capture_archive import is_archive, iter_members
+
+# Average chunk is MIN_CHUNK plus 64 lines (~7 KB of dump text)
+MIN_CHUNK = 2 * 1024
+MAX_CHUNK = 64 * 1024
+_BOUNDARY_MASK = (1 << 6) - 1
+FRAME_SIZE = 256 * 1024
+_FRAME_CACHE = 8
+
+_FRAME_DTYPE = np.dtype([('offset', '<u8'), ('stored', '<u4'), ('raw', '<u4')])
+_CHUNK_DTYPE = np.dtype([('digest', 'V16'), ('frame', '<u4'), ('offset', '<u4'), ('length', '<u4')])
+
+
+def _initial_manifest():
+    return {
+        'version': 1,
+        'lengths': {'frames_bytes': 0, 'frames': 0, 'chunks': 0, 'recipes': 0},
+        'dumps': [],
+    }
+
+
+class DumpStore:
+    """Append-only store of raw dumps, deduplicated by content-defined chunks."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        manifest_path = os.path.join(path, 'manifest.json')
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = _initial_manifest()
+        lengths = self.manifest['lengths']
+
+        self.frames = self._table('frames.idx', _FRAME_DTYPE, lengths['frames'])
+        self.chunks = self._table('chunks.idx', _CHUNK_DTYPE, lengths['chunks'])
+        self._chunk_ids = None          # digest -> chunk id, built on the first add
+        self._frame_cache = OrderedDict()
+
+    def _file(self, name):
+        return os.path.join(self.path, name)
+
+    def _table(self, name, dtype, rows):
+        if not rows:
+            return np.zeros(0, dtype=dtype)
+        return np.fromfile(self._file(name), dtype=dtype, count=rows)
+
+    def __len__(self):
+        return len(self.manifest['dumps'])
+
+    # ------------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------------
+    def add(self, path, device=None, name=None):
+        """Add a dump file, or every member of a zip/tar bundle. Returns dump ids."""
+        if is_archive(path):
+            base = name or os.path.basename(path)
+            return [self.add_stream(raw, f'{base}/{member}', device)
+                    for member, raw in iter_members(path)]
+        with open(path, 'rb') as raw:
+            return [self.add_stream(raw, name or os.path.basename(path), device)]
+
+    def add_stream(self, raw_lines, name, device=None):
+        """Add one dump read from binary lines; returns its dump id."""
+        writer = _ChunkWriter(self)
+        tracker = SectionTracker()
+        digest = hashlib.sha256()
+        pending, pending_size = [], 0
+        for line in raw_lines:
+            tracker.feed(line)
+            digest.update(line)
+            # A line longer than a whole chunk (a newline-free binary
+            # member) is cut at MAX_CHUNK instead of waiting for its end
+            while pending_size + len(line) > MAX_CHUNK:
+                take = MAX_CHUNK - pending_size
+                pending.append(line[:take])
+                writer.chunk(b''.join(pending))
+                pending, pending_size = [], 0
+                line = line[take:]
+            pending.append(line)
+            pending_size += len(line)
+            if pending_size >= MAX_CHUNK or (
+                    pending_size >= MIN_CHUNK and not zlib.crc32(line) & _BOUNDARY_MASK):
+                writer.chunk(b''.join(pending))
+                pending, pending_size = [], 0
+        if pending:
+            writer.chunk(b''.join(pending))
+        recipe = writer.commit()
+
+        lengths = self.manifest['lengths']
+        self.manifest['dumps'].append({
+            'name': name,
+            'device': device,
+            'size': tracker.offset,
+            'sha256': digest.hexdigest(),
+            'recipe': [lengths['recipes'] - len(recipe), len(recipe)],
+            'stored_bytes': writer.stored_bytes,
+            'sections': tracker.finish(),
+        })
+        self._save_manifest()
+        return len(self.manifest['dumps']) - 1
+
+    def _save_manifest(self):
+        tmp = self._file('manifest.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.manifest, f, separators=(',', ':'))
+        os.replace(tmp, self._file('manifest.json'))
+
+    def _digests(self):
+        if self._chunk_ids is None:
+            self._chunk_ids = {bytes(d): i for i, d in enumerate(self.chunks['digest'])}
+        return self._chunk_ids
+
+    # ------------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------------
+    def dump(self, dump_id):
+        return self.manifest['dumps'][dump_id]
+
+    def _recipe(self, dump_id):
+        start, count = self.dump(dump_id)['recipe']
+        recipe = np.fromfile(self._file('recipes.bin'), dtype='<u4', count=count, offset=start * 4)
+        return recipe.astype(np.int64)
+
+    def _frame(self, frame_id):
+        data = self._frame_cache.get(frame_id)
+        if data is not None:
+            self._frame_cache.move_to_end(frame_id)
+            return data
+        frame = self.frames[frame_id]
+        with open(self._file('frames.bin'), 'rb') as f:
+            f.seek(int(frame['offset']))
+            data = zlib.decompress(f.read(int(frame['stored'])))
+        self._frame_cache[frame_id] = data
+        if len(self._frame_cache) > _FRAME_CACHE:
+            self._frame_cache.popitem(last=False)
+        return data
+
+    def read(self, dump_id, start=0, end=None):
+        """Bytes [start, end) of a dump, decompressing only the frames they touch."""
+        size = self.dump(dump_id)['size']
+        end = size if end is None else min(end, size)
+        if end <= start:
+            return b''
+        recipe = self._recipe(dump_id)
+        chunks = self.chunks[recipe]
+        bounds = np.concatenate(([0], np.cumsum(chunks['length'], dtype=np.int64)))
+        first = int(np.searchsorted(bounds, start, side='right')) - 1
+        last = int(np.searchsorted(bounds, end, side='left'))
+        parts = []
+        for chunk in chunks[first:last]:
+            offset = int(chunk['offset'])
+            parts.append(self._frame(int(chunk['frame']))[offset:offset + int(chunk['length'])])
+        data = b''.join(parts)
+        skip = start - int(bounds[first])
+        return data[skip:skip + end - start]
+
+    def section(self, dump_id, name):
+        """One bugreport section of a dump (the first non-empty one), like BugreportIndex.section()."""
+        spans = [(start, end) for section, _, start, end in self.dump(dump_id)['sections']
+                 if section == name]
+        if not spans:
+            raise KeyError(f"dump {dump_id} has no {name!r} section")
+        start, end = next((span for span in spans if span[1] > span[0]), spans[0])
+        return self.read(dump_id, start, end)
+
+    def stats(self):
+        """Raw bytes added, bytes stored, unique chunks and frames."""
+        lengths = self.manifest['lengths']
+        return {
+            'dumps': len(self),
+            'raw_bytes': sum(dump['size'] for dump in self.manifest['dumps']),
+            'stored_bytes': lengths['frames_bytes'],
+            'chunks': lengths['chunks'],
+            'frames': lengths['frames'],
+        }
+
+
+class _ChunkWriter:
+    """Collects one dump's chunks; new ones are packed into zlib frames."""
+
+    def __init__(self, store):
+        self.store = store
+        self.ids = store._digests()
+        self.new_ids = {}               # this dump's new chunks; merged into ids on commit
+        self.recipe = array('I')
+        self.new_chunks = bytearray()
+        self.new_frames = bytearray()
+        self.frame = []                 # raw chunks of the open frame
+        self.frame_size = 0
+        self.frame_id = store.manifest['lengths']['frames']
+        self.next_id = store.manifest['lengths']['chunks']
+        self.frames_bytes = store.manifest['lengths']['frames_bytes']
+        self.stored_bytes = 0
+        self.compressed = []
+
+    def chunk(self, data):
+        digest = hashlib.blake2b(data, digest_size=16).digest()
+        chunk_id = self.ids.get(digest)
+        if chunk_id is None:
+            chunk_id = self.new_ids.get(digest)
+        if chunk_id is None:
+            chunk_id = self.new_ids[digest] = self.next_id
+            self.next_id += 1
+            self.new_chunks += struct.pack('<16sIII', digest, self.frame_id, self.frame_size, len(data))
+            self.frame.append(data)
+            self.frame_size += len(data)
+            if self.frame_size >= FRAME_SIZE:
+                self._close_frame()
+        self.recipe.append(chunk_id)
+
+    def _close_frame(self):
+        if not self.frame:
+            return
+        stored = zlib.compress(b''.join(self.frame), 6)
+        self.new_frames += struct.pack('<QII', self.frames_bytes, len(stored), self.frame_size)
+        self.compressed.append(stored)
+        self.frames_bytes += len(stored)
+        self.stored_bytes += len(stored)
+        self.frame_id += 1
+        self.frame, self.frame_size = [], 0
+
+    def commit(self):
+        """Append frames, chunk records and the recipe; update the manifest lengths."""
+        self._close_frame()
+        store = self.store
+        lengths = store.manifest['lengths']
+        writes = (
+            ('frames.bin', lengths['frames_bytes'], b''.join(self.compressed)),
+            ('frames.idx', lengths['frames'] * _FRAME_DTYPE.itemsize, bytes(self.new_frames)),
+            ('chunks.idx', lengths['chunks'] * _CHUNK_DTYPE.itemsize, bytes(self.new_chunks)),
+            ('recipes.bin', lengths['recipes'] * 4, self.recipe.tobytes()),
+        )
+        for name, committed, data in writes:
+            with open(store._file(name), 'ab') as f:
+                # Drop whatever an interrupted add left past the committed length
+                f.truncate(committed)
+                f.write(data)
+
+        store.frames = np.concatenate((store.frames, np.frombuffer(bytes(self.new_frames), _FRAME_DTYPE)))
+        store.chunks = np.concatenate((store.chunks, np.frombuffer(bytes(self.new_chunks), _CHUNK_DTYPE)))
+        lengths['frames'] = self.frame_id
+        lengths['frames_bytes'] = self.frames_bytes
+        lengths['chunks'] = self.next_id
+        lengths['recipes'] += len(self.recipe)
+        # Only now can later adds refer to this dump's chunks; a failed add
+        # never reaches here and leaves the digest index as it was
+        self.ids.update(self.new_ids)
+        return self.recipe
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Deduplicated archive of raw dumps.')
+    parser.add_argument('store', help='store directory')
+    commands = parser.add_subparsers(dest='command', required=True)
+    add = commands.add_parser('add', help='add dump files or zip/tar bundles')
+    add.add_argument('dumps', nargs='+', metavar='DUMP')
+    add.add_argument('--device', help='device the dumps came from')
+    commands.add_parser('list', help='list stored dumps')
+    cat = commands.add_parser('cat', help='write a dump (or one section of it) to stdout')
+    cat.add_argument('dump_id', type=int)
+    cat.add_argument('section', nargs='?')
+    args = parser.parse_args(argv)
+
+    store = DumpStore(args.store)
+    if args.command == 'cat':
+        if not 0 <= args.dump_id < len(store):
+            parser.error(f'no dump {args.dump_id} (store holds {len(store)})')
+        try:
+            data = store.section(args.dump_id, args.section) if args.section else store.read(args.dump_id)
+        except KeyError as e:
+            parser.error(e.args[0])
+        sys.stdout.buffer.write(data)
+        return 0
+
+    if args.command == 'add':
+        for path in args.dumps:
+            for dump_id in store.add(path, args.device):
+                dump = store.dump(dump_id)
+                print(f"  #{dump_id:<5} {dump['name']:<48} {dump['size'] / 1024:>10,.1f} KB "
+                      f"-> {dump['stored_bytes'] / 1024:>9,.1f} KB new")
+
+    stats = store.stats()
+    if args.command == 'list':
+        for dump_id, dump in enumerate(store.manifest['dumps']):
+            sections = len(dump['sections'])
+            print(f"  #{dump_id:<5} {dump['device'] or '-':<16} {dump['name']:<48} "
+                  f"{dump['size'] / 1024:>10,.1f} KB" + (f"  {sections} sections" if sections else ''))
+    print("="*80)
+    print(f"🗄️  DUMP STORE: {stats['dumps']:,} dumps, {stats['raw_bytes'] / 1024 / 1024:,.1f} MB raw "
+          f"-> {stats['stored_bytes'] / 1024 / 1024:,.1f} MB stored "
+          f"({stats['raw_bytes'] / max(stats['stored_bytes'], 1):,.1f}x), "
+          f"{stats['chunks']:,} chunks in {stats['frames']:,} frames")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+FLEET ANALYSIS - Before/after debloat analysis for many devices at once
+
+Expects one folder per device, each with a `before/` and `after/` capture
+folder (see capture_loader.py for the dump files it reads), or one zip /
+tar archive per device holding those two folders, read without
+extracting (capture_archive.py):
+
+    fleet/
+        galaxy-s25-01/before/meminfo.txt ...
+        galaxy-s25-01/after/meminfo.txt ...
+        pixel-9-07.tar.gz           (pixel-9-07/before/bugreport.txt ...)
+
+Each device is parsed and scored in its own worker process. Results are
+merged into one CSV with the same `improvements` and
+`transformation_score` values the single-device scripts print.
+
+Usage:
+    python3 fleet_analysis.py FLEET_DIR [-o fleet_results.csv] [-j WORKERS]
+"""
+
+import argparse
+import csv
+import os
+import posixpath
+import sys
+import tarfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+
+from analyze_debloat import compute_improvements as debloat_improvements
+from capture_archive import archive_stem, is_archive
+from capture_loader import load_archive, load_capture_dir
+from genetic_score import CHROMOSOMES, transformation_grade, transformation_score
+from ram_analysis import compute_improvements as ram_improvements
+
+# ============================================================================
+# PER-DEVICE TASK (runs in a worker process)
+# ============================================================================
+def load_device(device_path):
+    """(before, after) captures of a device folder or archive; None if missing."""
+    if is_archive(device_path):
+        by_role = {}
+        for folder, capture in load_archive(device_path).items():
+            by_role.setdefault(posixpath.basename(folder), capture)
+        return by_role.get('before'), by_role.get('after')
+    captures = []
+    for role in ('before', 'after'):
+        folder = os.path.join(device_path, role)
+        captures.append(load_capture_dir(folder) if os.path.isdir(folder) else None)
+    return tuple(captures)
+
+
+def analyze_device(device_path):
+    """Parse both captures of one device and score them. Never raises."""
+    row = {'device': archive_stem(os.path.basename(os.path.normpath(device_path)))}
+    try:
+        before, after = load_device(device_path)
+        if before is None or after is None:
+            row['error'] = f"missing {'before' if before is None else 'after'}/ capture"
+            return row
+        if {'used_ram_kb', 'zram_swap_kb'} <= before.keys() & after.keys():
+            row.update(ram_improvements(before, after))
+        if {'total_packages', 'running_processes', 'storage_free_gb'} <= before.keys() & after.keys():
+            row.update(debloat_improvements(before, after))
+        if all(key in before and key in after for _, key, _ in CHROMOSOMES):
+            score = transformation_score(before, after)
+            row['transformation_score'] = score
+            row['grade'] = transformation_grade(score)
+    except (OSError, ValueError, KeyError, ZeroDivisionError,
+            zipfile.BadZipFile, tarfile.TarError) as e:
+        row['error'] = f'{type(e).__name__}: {e}'
+    return row
+
+
+def find_devices(fleet_dir):
+    return sorted(
+        os.path.join(fleet_dir, name) for name in os.listdir(fleet_dir)
+        if os.path.isdir(os.path.join(fleet_dir, name, 'before'))
+        or (is_archive(name) and os.path.isfile(os.path.join(fleet_dir, name)))
+    )
+
+
+def analyze_fleet(fleet_dir, workers=None):
+    """Fan devices out over a process pool; returns rows in device order."""
+    devices = find_devices(fleet_dir)
+    if workers == 1:
+        return [analyze_device(d) for d in devices]
+    workers = workers or os.cpu_count() or 1
+    chunksize = max(1, len(devices) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_device, devices, chunksize=chunksize))
+
+
+def write_table(rows, path):
+    fields = ['device']
+    for row in rows:
+        fields.extend(key for key in row if key not in fields)
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.DictWriter(f, fieldnames=fields)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Before/after debloat analysis for a fleet.')
+    parser.add_argument('fleet_dir')
+    parser.add_argument('-o', '--output', default='fleet_results.csv')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='worker processes (default: all cores)')
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    rows = analyze_fleet(args.fleet_dir, args.workers)
+    elapsed = time.perf_counter() - start
+    write_table(rows, args.output)
+
+    failed = [row for row in rows if 'error' in row]
+    print("="*80)
+    print("🛰️  FLEET ANALYSIS COMPLETE")
+    print("="*80)
+    print(f"  Devices:     {len(rows):,} ({len(failed)} failed)")
+    print(f"  Wall time:   {elapsed:.2f} s ({len(rows) / elapsed if elapsed else 0:.1f} devices/s)")
+    print(f"  Results:     {args.output}")
+    for row in failed[:10]:
+        print(f"  ❌ {row['device']}: {row['error']}")
+    return 0 if not failed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
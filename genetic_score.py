@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+GENETIC SCORE - Genetic Transformation Score, one device or a whole fleet
+
+The scalar functions reproduce meta_forensic_analysis.py for one device.
+score_matrix() does the same arithmetic on a (devices x chromosomes)
+matrix in a handful of NumPy operations, and its results are bit-for-bit
+equal to the scalar path: both round with half-to-even on x * 10 and both
+sum the six weighted terms left to right.
+
+NumPy is imported inside the vectorized functions only, so the scalar
+path stays cheap to import for text-only reports.
+"""
+
+# ============================================================================
+# CHROMOSOMES AND WEIGHTS
+# ============================================================================
+# (chromosome, capture key, weight key)
+CHROMOSOMES = (
+    ('CHROMOSOME 1: Package Count', 'total_packages', 'packages'),
+    ('CHROMOSOME 2: Active RAM', 'used_ram_kb', 'ram'),
+    ('CHROMOSOME 3: Swap Memory', 'zram_swap_kb', 'swap'),
+    ('CHROMOSOME 4: ZRAM Compression', 'zram_physical_kb', 'zram'),
+    ('CHROMOSOME 5: Running Processes', 'running_processes', 'processes'),
+    ('CHROMOSOME 6: App Memory (PSS)', 'used_pss_kb', 'pss'),
+)
+
+WEIGHTS = {
+    'packages': 0.25,
+    'ram': 0.20,
+    'swap': 0.25,
+    'zram': 0.15,
+    'processes': 0.10,
+    'pss': 0.05,
+}
+
+MUTATION_TYPES = (
+    "STABLE (minimal mutation)",
+    "MODERATE EVOLUTION",
+    "RADICAL TRANSFORMATION ⚡",
+)
+MUTATION_THRESHOLDS = (5, 20)
+
+GRADES = (
+    ("STABLE GENOME", "Minimal genetic variation"),
+    ("MODERATE EVOLUTION ⚡", "Measurable genetic drift"),
+    ("SIGNIFICANT MUTATION ⚡⚡", "Notable genetic changes observed"),
+    ("RADICAL EVOLUTION ⚡⚡⚡", "Organism has undergone fundamental transformation"),
+)
+GRADE_THRESHOLDS = (10, 20, 30)
+
+
+# ============================================================================
+# SCALAR PATH (one device)
+# ============================================================================
+def pct_change(before, after):
+    """Percent change rounded to one decimal, as in the genetic_markers table."""
+    return round((after - before) / before * 100 * 10) / 10
+
+
+def classify_mutation(pct):
+    if abs(pct) < MUTATION_THRESHOLDS[0]:
+        return MUTATION_TYPES[0]
+    elif abs(pct) < MUTATION_THRESHOLDS[1]:
+        return MUTATION_TYPES[1]
+    return MUTATION_TYPES[2]
+
+
+def weighted_score(pct_changes):
+    """Weighted sum of |pct_change| over the six chromosomes, in order."""
+    score = 0
+    for pct, (_, _, weight) in zip(pct_changes, CHROMOSOMES):
+        score += abs(pct) * WEIGHTS[weight]
+    return score
+
+
+def transformation_score(before, after):
+    """Score two capture dicts (snapshot_store keys)."""
+    return weighted_score([pct_change(before[key], after[key]) for _, key, _ in CHROMOSOMES])
+
+
+def grade_index(score):
+    if score > GRADE_THRESHOLDS[2]:
+        return 3
+    elif score > GRADE_THRESHOLDS[1]:
+        return 2
+    elif score > GRADE_THRESHOLDS[0]:
+        return 1
+    return 0
+
+
+def transformation_grade(score):
+    return GRADES[grade_index(score)][0]
+
+
+# ============================================================================
+# VECTORIZED PATH (many devices)
+# ============================================================================
+def capture_matrix(captures):
+    """Stack capture dicts into a (devices x chromosomes) float64 matrix."""
+    import numpy as np
+
+    return np.array([[c[key] for _, key, _ in CHROMOSOMES] for c in captures], dtype=np.float64)
+
+
+def store_matrix(store, rows=None):
+    """Chromosome matrix straight from SnapshotStore columns (no dicts)."""
+    import numpy as np
+
+    columns = [np.asarray(store.column(key), dtype=np.float64) for _, key, _ in CHROMOSOMES]
+    matrix = np.column_stack(columns)
+    return matrix if rows is None else matrix[rows]
+
+
+def score_matrix(before, after):
+    """Score every device at once.
+
+    `before` and `after` are (devices x 6) arrays in CHROMOSOMES order.
+    Returns a dict with:
+        pct_change   (devices x 6) float64, rounded to one decimal
+        mutation     (devices x 6) int8 index into MUTATION_TYPES
+        score        (devices,)    float64
+        grade        (devices,)    int8 index into GRADES
+    A zero `before` value gives NaN/inf where the scalar path would raise.
+    """
+    import numpy as np
+
+    before = np.asarray(before, dtype=np.float64)
+    after = np.asarray(after, dtype=np.float64)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        pct = np.rint((after - before) / before * 100 * 10) / 10
+    magnitude = np.abs(pct)
+
+    mutation = np.searchsorted(MUTATION_THRESHOLDS, magnitude, side='right').astype(np.int8)
+
+    # Column by column so the additions happen in the same order as the
+    # scalar loop; a row-wise .sum() may pair terms differently.
+    terms = magnitude * np.array([WEIGHTS[w] for _, _, w in CHROMOSOMES])
+    score = np.zeros(len(terms))
+    for column in range(terms.shape[1]):
+        score += terms[:, column]
+
+    grade = np.searchsorted(GRADE_THRESHOLDS, score, side='left').astype(np.int8)
+    return {'pct_change': pct, 'mutation': mutation, 'score': score, 'grade': grade}
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+LIVE INGEST - Poll many devices concurrently and stream metric deltas
+
+One asyncio task per device polls `dumpsys meminfo`, `dumpsys batterystats`
+and `ps -A` every `interval` seconds over an ADB-compatible transport
+(anything with async devices() and shell(serial, command) -> bytes).
+The outputs are parsed into live metrics, and only the metrics that
+changed since the previous poll are pushed to subscribers as a delta.
+
+meminfo and ps are point-in-time snapshots and are parsed whole. The
+Battery History block only grows, so each poll finds it in the dump and
+parses just the events past the last one seen (BatteryHistory.update_bytes).
+A device that fails to answer, or sends a dump that fails to parse, costs
+only that poll; its loop and every other device keep going.
+
+Subscribers get an asyncio.Queue of events:
+    {'serial': ..., 'time': unix seconds, 'metrics': {name: value, ...}}
+    {'serial': ..., 'time': unix seconds, 'error': message}
+A subscriber that falls behind loses its oldest events, never blocks ingest.
+
+Usage:
+    python3 live_ingest.py [SERIAL ...] [--interval 5] [--duration 60] [--print]
+    python3 live_ingest.py --simulate 500 [--speed 60] [--duration 30]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from collections import deque
+
+from batterystats_parser import BatteryHistory
+from capture_loader import count_processes
+from meminfo_parser import parse_meminfo
+
+COMMANDS = {
+    'meminfo': 'dumpsys meminfo',
+    'battery': 'dumpsys batterystats',
+    'ps': 'ps -A',
+}
+
+MEMINFO_METRICS = ('used_ram_kb', 'free_ram_kb', 'used_pss_kb', 'zram_physical_kb', 'zram_swap_kb')
+# Poll times kept for the p50/p99 report; older ones are dropped
+POLL_SAMPLES = 10_000
+
+
+# ============================================================================
+# TRANSPORT
+# ============================================================================
+class AdbTransport:
+    """Real devices through the `adb` binary (binary-safe exec-out)."""
+
+    def __init__(self, adb='adb'):
+        self.adb = adb
+
+    async def _run(self, *args):
+        proc = await asyncio.create_subprocess_exec(
+            self.adb, *args, stdout=asyncio.subprocess.PIPE, stderr=asyncio.subprocess.PIPE)
+        out, err = await proc.communicate()
+        if proc.returncode:
+            raise OSError(f"adb {' '.join(args)}: {err.decode(errors='replace').strip()}")
+        return out
+
+    async def devices(self):
+        out = await self._run('devices')
+        return [line.split('\t')[0] for line in out.decode().splitlines()[1:]
+                if line.endswith('\tdevice')]
+
+    async def shell(self, serial, command):
+        return await self._run('-s', serial, 'exec-out', *command.split())
+
+
+# ============================================================================
+# PER-DEVICE STATE
+# ============================================================================
+class DeviceState:
+    """Latest metrics of one device plus its incremental battery parser."""
+
+    def __init__(self, serial):
+        self.serial = serial
+        self.battery = BatteryHistory()
+        self.metrics = {}
+
+    def ingest(self, outputs):
+        """Parse one poll ({command: bytes}) and return the changed metrics."""
+        metrics = {}
+        meminfo = outputs.get(COMMANDS['meminfo'])
+        if meminfo is not None:
+            snapshot = parse_meminfo(meminfo.decode('utf-8', 'replace').splitlines())
+            metrics.update((key, snapshot[key]) for key in MEMINFO_METRICS if key in snapshot)
+        ps = outputs.get(COMMANDS['ps'])
+        if ps is not None:
+            metrics.update(count_processes(ps.decode('utf-8', 'replace').splitlines()))
+        battery = outputs.get(COMMANDS['battery'])
+        if battery is not None:
+            self.battery.update_bytes(battery)
+            if self.battery.state['level'] >= 0:
+                metrics['battery_level'] = self.battery.state['level']
+                metrics['charging'] = self.battery.state['charging']
+
+        delta = {key: value for key, value in metrics.items() if self.metrics.get(key) != value}
+        self.metrics.update(metrics)
+        return delta
+
+
+# ============================================================================
+# INGEST SERVICE
+# ============================================================================
+class IngestService:
+    """Concurrent pollers for many devices, publishing deltas to subscribers."""
+
+    def __init__(self, transport, interval_s=5.0, max_shells=64):
+        self.transport = transport
+        self.interval_s = interval_s
+        self.devices = {}
+        self._subscribers = []
+        self._shells = asyncio.Semaphore(max_shells)
+        self.stats = {'polls': 0, 'deltas': 0, 'errors': 0, 'bytes': 0, 'late': 0,
+                      'poll_ms': deque(maxlen=POLL_SAMPLES)}
+
+    def subscribe(self, maxsize=10_000):
+        queue = asyncio.Queue(maxsize)
+        self._subscribers.append(queue)
+        return queue
+
+    def unsubscribe(self, queue):
+        self._subscribers.remove(queue)
+
+    def publish(self, event):
+        for queue in self._subscribers:
+            if queue.full():
+                queue.get_nowait()      # drop the oldest event for a slow reader
+            queue.put_nowait(event)
+
+    async def _shell(self, serial, command):
+        async with self._shells:
+            return await self.transport.shell(serial, command)
+
+    async def poll(self, serial):
+        """Poll one device once; publishes and returns the delta (or None)."""
+        state = self.devices.setdefault(serial, DeviceState(serial))
+        commands = list(COMMANDS.values())
+        start = time.perf_counter()
+        try:
+            results = await asyncio.gather(*(self._shell(serial, c) for c in commands))
+            delta = state.ingest(dict(zip(commands, results)))
+        except Exception as e:
+            # Any failure ends this poll of this device only
+            self.stats['errors'] += 1
+            self.publish({'serial': serial, 'time': time.time(),
+                          'error': str(e) or type(e).__name__})
+            return None
+
+        self.stats['polls'] += 1
+        self.stats['bytes'] += sum(len(out) for out in results)
+        self.stats['poll_ms'].append((time.perf_counter() - start) * 1000)
+        if delta:
+            self.stats['deltas'] += 1
+            self.publish({'serial': serial, 'time': time.time(), 'metrics': delta})
+        return delta
+
+    async def _device_loop(self, serial, deadline, phase_s=0.0):
+        loop = asyncio.get_running_loop()
+        await asyncio.sleep(phase_s)
+        next_poll = loop.time()
+        while deadline is None or loop.time() < deadline:
+            await self.poll(serial)
+            next_poll += self.interval_s
+            delay = next_poll - loop.time()
+            if delay < 0:
+                # Could not keep up: skip missed ticks instead of bursting
+                self.stats['late'] += 1
+                next_poll = loop.time()
+                delay = 0
+            if deadline is not None:
+                delay = min(delay, max(0, deadline - loop.time()))
+            await asyncio.sleep(delay)
+
+    async def run(self, serials=None, duration_s=None):
+        """Poll every device until `duration_s` elapses (forever if None).
+
+        Devices start at evenly spread phases of the interval, so polls
+        arrive as a steady stream instead of one burst per tick.
+        """
+        serials = serials or await self.transport.devices()
+        loop = asyncio.get_running_loop()
+        deadline = None if duration_s is None else loop.time() + duration_s
+        phase = self.interval_s / max(1, len(serials))
+        await asyncio.gather(*(self._device_loop(serial, deadline, i * phase)
+                               for i, serial in enumerate(serials)))
+
+
+async def _print_events(queue):
+    while True:
+        event = await queue.get()
+        if 'error' in event:
+            print(f"  ❌ {event['serial']}: {event['error']}")
+        else:
+            changes = ', '.join(f'{k}={v:,}' for k, v in event['metrics'].items())
+            print(f"  📡 {event['serial']}: {changes}")
+
+
+async def _main(args):
+    if args.simulate:
+        # The simulator replays synthetic dumps; real ingest never loads it
+        from device_simulator import SimulatedTransport, synthetic_frames
+
+        transport = SimulatedTransport(args.simulate, synthetic_frames(), speed=args.speed,
+                                       latency_s=args.latency)
+    else:
+        transport = AdbTransport(args.adb)
+    service = IngestService(transport, args.interval, args.max_shells)
+
+    printer = asyncio.create_task(_print_events(service.subscribe())) if args.print else None
+    start = time.perf_counter()
+    await service.run(args.serials or None, args.duration)
+    elapsed = time.perf_counter() - start
+    if printer:
+        printer.cancel()
+
+    stats = service.stats
+    poll_ms = sorted(stats['poll_ms']) or [0]
+    print("="*80)
+    print("📡 LIVE INGEST")
+    print("="*80)
+    print(f"  Devices:   {len(service.devices):,}")
+    print(f"  Polls:     {stats['polls']:,} in {elapsed:.1f} s ({stats['polls'] / elapsed:,.0f}/s), "
+          f"{stats['errors']} errors, {stats['late']} late ticks")
+    print(f"  Deltas:    {stats['deltas']:,} published")
+    print(f"  Ingested:  {stats['bytes'] / 1024 / 1024:,.1f} MB")
+    print(f"  Poll time: last {len(poll_ms):,} polls, p50 {statistics.median(poll_ms):.1f} ms, "
+          f"p99 {poll_ms[int(len(poll_ms) * 0.99)]:.1f} ms")
+    return 0 if not stats['errors'] else 1
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Stream live metrics from many devices.')
+    parser.add_argument('serials', nargs='*', help='device serials (default: every adb device)')
+    parser.add_argument('--interval', type=float, default=5.0, help='seconds between polls')
+    parser.add_argument('--duration', type=float, default=None, help='stop after N seconds')
+    parser.add_argument('--max-shells', type=int, default=64, help='concurrent shell commands')
+    parser.add_argument('--print', action='store_true', help='print every delta')
+    parser.add_argument('--adb', default='adb')
+    parser.add_argument('--simulate', type=int, metavar='N', help='use N simulated phones')
+    parser.add_argument('--speed', type=float, default=60.0,
+                        help='simulated time per real second (default: 60x)')
+    parser.add_argument('--latency', type=float, default=0.05,
+                        help='simulated shell round trip in seconds')
+    args = parser.parse_args(argv)
+    if args.simulate and args.duration is None:
+        args.duration = 30.0
+    return asyncio.run(_main(args))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
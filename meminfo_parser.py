@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+MEMINFO PARSER - Streaming reader for raw `dumpsys meminfo` output
+
+Fills the same keys that ram_analysis.py used to hardcode in its
+`before`/`after` dicts, plus the per-process PSS table, in a single pass
+over the lines. The per-process blocks, the bulk of every dump, are
+collected BATCH_LINES rows at a time and each batch is split in one go
+with NumPy over its bytes (field offsets and numbers for all rows at
+once), so no Python code runs per line beyond the collecting and only
+one batch of raw lines is held at any time. A key whose line is missing
+from the dump is left out of the result.
+
+Usage:
+    python3 meminfo_parser.py meminfo.txt
+    python3 meminfo_parser.py bugreport.txt     # its meminfo section
+"""
+
+import re
+import sys
+
+from bugreport_index import BugreportIndex, is_bugreport
+
+# ============================================================================
+# LINE PATTERNS
+# ============================================================================
+_TOTAL_RAM_RE = re.compile(r'\s*Total RAM:\s*([\d,]+)K')
+_FREE_RAM_RE = re.compile(
+    r'\s*Free RAM:\s*([\d,]+)K \(\s*([\d,]+)K cached pss \+\s*([\d,]+)K cached kernel'
+    r' \+\s*([\d,]+)K free'
+)
+_USED_RAM_RE = re.compile(
+    r'\s*Used RAM:\s*([\d,]+)K \(\s*([\d,]+)K used pss \+\s*([\d,]+)K kernel'
+)
+_ZRAM_RE = re.compile(
+    r'\s*ZRAM:\s*([\d,]+)K physical used for\s*([\d,]+)K in swap'
+    r'(?:\s*\(\s*([\d,]+)K total swap\))?'
+)
+
+# Sections whose per-process lines we keep
+_SECTION_PSS = 'Total PSS by process:'
+_SECTION_RSS = 'Total RSS by process:'
+
+# Keys ram_analysis.py expects in its before/after dicts
+MEMINFO_KEYS = (
+    'total_ram_gb',
+    'free_ram_kb',
+    'used_ram_kb',
+    'cached_pss_kb',
+    'cached_kernel_kb',
+    'free_memory_kb',
+    'used_pss_kb',
+    'kernel_kb',
+    'zram_physical_kb',
+    'zram_swap_kb',
+)
+
+# The summary line each key is read from
+MEMINFO_LINES = {
+    'total_ram_gb': 'Total RAM:',
+    'free_ram_kb': 'Free RAM:',
+    'used_ram_kb': 'Used RAM:',
+    'cached_pss_kb': 'Free RAM:',
+    'cached_kernel_kb': 'Free RAM:',
+    'free_memory_kb': 'Free RAM:',
+    'used_pss_kb': 'Used RAM:',
+    'kernel_kb': 'Used RAM:',
+    'zram_physical_kb': 'ZRAM:',
+    'zram_swap_kb': 'ZRAM:',
+}
+
+# Per-process rows parsed per NumPy batch
+BATCH_LINES = 4096
+
+
+_KB_SEP = b'K: '
+_PID_MARK = b' (pid '
+_SWAP_TAIL = b'K in swap)'
+_BLANKS = (32, 9, 13)
+_MAX_TRAILING_BLANKS = 8
+_MAX_NUMBER_WIDTH = 16
+
+
+def _kb(text):
+    return int(text.replace(',', ''))
+
+
+def _find_all(data, pattern):
+    """Start offsets of every occurrence of `pattern` in a uint8 array."""
+    import numpy as np
+
+    n = len(data) - len(pattern) + 1
+    if n <= 0:
+        return np.zeros(0, dtype=np.int64)
+    hit = data[:n] == pattern[0]
+    for k in range(1, len(pattern)):
+        hit &= data[k:k + n] == pattern[k]
+    return np.flatnonzero(hit)
+
+
+def _number_before(data, pos, floor):
+    """Per row, the number whose last digit is at pos - 1 (commas skipped)."""
+    import numpy as np
+
+    value = np.zeros(len(pos), dtype=np.int64)
+    scale = np.ones(len(pos), dtype=np.int64)
+    live = np.ones(len(pos), dtype=bool)
+    for k in range(1, _MAX_NUMBER_WIDTH + 1):
+        at = pos - k
+        live &= at >= floor
+        c = data[np.where(live, at, 0)].astype(np.int64)
+        digit = live & (c >= 48) & (c <= 57)
+        live &= digit | (c == 44)
+        value += np.where(digit, (c - 48) * scale, 0)
+        scale = np.where(digit, scale * 10, scale)
+        if not live.any():
+            break
+    return value
+
+
+def _number_after(data, pos, ceiling):
+    """Per row, the run of digits starting at pos."""
+    import numpy as np
+
+    value = np.zeros(len(pos), dtype=np.int64)
+    live = np.ones(len(pos), dtype=bool)
+    for k in range(_MAX_NUMBER_WIDTH):
+        at = pos + k
+        live &= at < ceiling
+        c = data[np.where(live, at, 0)].astype(np.int64)
+        live &= (c >= 48) & (c <= 57)
+        value = np.where(live, value * 10 + c - 48, value)
+        if not live.any():
+            break
+    return value
+
+
+def _parse_process_block(lines, names=True):
+    """Split "578,760K: name (pid 1234 / activities)    (57,876K in swap)" rows.
+
+    `lines` are rows of a per-process block, each holding "K: " and
+    " (pid ". Returns (kb, names, pids, swap_kb): int64 arrays and a list
+    of names, which is None when not asked for.
+    """
+    import numpy as np
+
+    newline = '' if lines[0].endswith('\n') else '\n'
+    text = newline.join(lines)
+    if not text.endswith('\n'):
+        text += '\n'
+    raw = text.encode('utf-8')
+    data = np.frombuffer(raw, dtype=np.uint8)
+
+    ends = np.flatnonzero(data == 10)
+    starts = np.empty_like(ends)
+    starts[0] = 0
+    starts[1:] = ends[:-1] + 1
+    # Line ends without trailing blanks / CR, as str.strip() would leave them
+    stops = ends.copy()
+    for _ in range(_MAX_TRAILING_BLANKS):
+        blank = (stops > starts) & np.isin(data[stops - 1], _BLANKS)
+        if not blank.any():
+            break
+        stops -= blank
+
+    kb_seps = _find_all(data, _KB_SEP)
+    seps = kb_seps[np.searchsorted(kb_seps, starts)]       # first "K: " of each row
+    pid_marks = _find_all(data, _PID_MARK)
+    pid_ats = pid_marks[np.searchsorted(pid_marks, stops) - 1]      # last " (pid " of each row
+
+    kb = _number_before(data, seps, starts)
+    pids = _number_after(data, pid_ats + len(_PID_MARK), stops)
+    tails = data[np.maximum(stops - len(_SWAP_TAIL), 0)[:, None] + np.arange(len(_SWAP_TAIL))]
+    swap_tail = np.frombuffer(_SWAP_TAIL, dtype=np.uint8)
+    has_swap = (stops - starts >= len(_SWAP_TAIL)) & (tails == swap_tail).all(axis=1)
+    swap = np.where(has_swap, _number_before(data, stops - len(_SWAP_TAIL), starts), 0)
+
+    row_names = None
+    if names:
+        first, last = (seps + len(_KB_SEP)).tolist(), pid_ats.tolist()
+        if len(raw) == len(text):           # ASCII: byte offsets are str offsets
+            row_names = [text[a:b] for a, b in zip(first, last)]
+        else:
+            row_names = [raw[a:b].decode('utf-8') for a, b in zip(first, last)]
+    return kb, row_names, pids, swap
+
+
+class _ProcessBlock:
+    """Columns of a per-process block, parsed BATCH_LINES rows at a time."""
+
+    def __init__(self, names=True):
+        self.pending = []
+        self.batches = []
+        self.names = [] if names else None
+
+    def append(self, line):
+        self.pending.append(line)
+        if len(self.pending) >= BATCH_LINES:
+            self.flush()
+
+    def flush(self):
+        if not self.pending:
+            return
+        kb, names, pids, swap = _parse_process_block(self.pending, self.names is not None)
+        self.batches.append((kb, pids, swap))
+        if names is not None:
+            self.names.extend(names)
+        self.pending = []
+
+    def columns(self):
+        """(kb, pids, swap_kb) int64 arrays over every row."""
+        import numpy as np
+
+        self.flush()
+        if not self.batches:
+            return tuple(np.zeros(0, dtype=np.int64) for _ in range(3))
+        return tuple(np.concatenate(column) for column in zip(*self.batches))
+
+
+def _rss_of(pids, rss_pids, rss_kb):
+    """RSS of each pid in `pids` (0 if not listed; the last row wins on repeats)."""
+    import numpy as np
+
+    if not len(rss_pids):
+        return np.zeros(len(pids), dtype=np.int64)
+    order = np.argsort(rss_pids, kind='stable')
+    sorted_pids = rss_pids[order]
+    at = np.searchsorted(sorted_pids, pids, side='right') - 1
+    found = (at >= 0) & (sorted_pids[np.maximum(at, 0)] == pids)
+    return np.where(found, rss_kb[order[np.maximum(at, 0)]], 0)
+
+
+def parse_meminfo(lines):
+    """Parse an iterable of `dumpsys meminfo` lines in one pass.
+
+    Returns a dict with 'processes', a list of {'name', 'pid', 'pss_kb',
+    'rss_kb', 'swap_kb'} rows in PSS order, and those of MEMINFO_KEYS,
+    'total_ram_kb' and 'swap_total_kb' whose line is in the dump.
+    """
+    result = {'processes': []}
+    pss_rows, rss_rows = _ProcessBlock(), _ProcessBlock(names=False)
+    block = None                    # the per-process block being read
+
+    for line in lines:
+        if block is not None:
+            if ' (pid ' in line and 'K: ' in line:
+                block.append(line)
+                continue
+            # Anything else ends the per-process block
+            block.flush()
+            block = None
+
+        stripped = line.strip()
+        if not stripped:
+            continue
+
+        if stripped.endswith(':') and stripped.startswith('Total '):
+            if stripped == _SECTION_PSS:
+                block = pss_rows
+            elif stripped == _SECTION_RSS:
+                block = rss_rows
+            continue
+
+        first = stripped[0]
+        if first == 'T' and stripped.startswith('Total RAM:'):
+            match = _TOTAL_RAM_RE.match(line)
+            if match:
+                result['total_ram_kb'] = _kb(match.group(1))
+                result['total_ram_gb'] = result['total_ram_kb'] / (1024 * 1024)
+        elif first == 'F' and stripped.startswith('Free RAM:'):
+            match = _FREE_RAM_RE.match(line)
+            if match:
+                result['free_ram_kb'] = _kb(match.group(1))
+                result['cached_pss_kb'] = _kb(match.group(2))
+                result['cached_kernel_kb'] = _kb(match.group(3))
+                result['free_memory_kb'] = _kb(match.group(4))
+        elif first == 'U' and stripped.startswith('Used RAM:'):
+            match = _USED_RAM_RE.match(line)
+            if match:
+                result['used_ram_kb'] = _kb(match.group(1))
+                result['used_pss_kb'] = _kb(match.group(2))
+                result['kernel_kb'] = _kb(match.group(3))
+        elif first == 'Z' and stripped.startswith('ZRAM:'):
+            match = _ZRAM_RE.match(line)
+            if match:
+                result['zram_physical_kb'] = _kb(match.group(1))
+                result['zram_swap_kb'] = _kb(match.group(2))
+                if match.group(3):
+                    result['swap_total_kb'] = _kb(match.group(3))
+
+    kb, pids, swap = pss_rows.columns()
+    rss_kb, rss_pids, _ = rss_rows.columns()
+    rss = _rss_of(pids, rss_pids, rss_kb)
+    processes = result['processes']
+    for start in range(0, len(kb), BATCH_LINES):
+        rows = slice(start, start + BATCH_LINES)
+        processes.extend(
+            {'name': name, 'pid': pid, 'pss_kb': pss, 'rss_kb': rss_kb, 'swap_kb': swap_kb}
+            for pss, name, pid, rss_kb, swap_kb in zip(kb[rows].tolist(), pss_rows.names[rows],
+                                                       pids[rows].tolist(), rss[rows].tolist(),
+                                                       swap[rows].tolist())
+        )
+    return result
+
+
+def missing_lines(snapshot):
+    """Summary lines ("Free RAM:", ...) that MEMINFO_KEYS missing from a parsed dump come from."""
+    return sorted({MEMINFO_LINES[key] for key in MEMINFO_KEYS if key not in snapshot})
+
+
+def parse_meminfo_file(path):
+    """Stream a meminfo dump from disk, line by line.
+
+    A full bugreport works too: only its indexed meminfo section is read.
+    """
+    if is_bugreport(path):
+        with BugreportIndex(path) as index:
+            return parse_meminfo(index.lines('meminfo'))
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return parse_meminfo(f)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 2:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    snapshot = parse_meminfo_file(sys.argv[1])
+    print("="*80)
+    print(f"🧠 MEMINFO: {sys.argv[1]}")
+    print("="*80)
+    for key in MEMINFO_KEYS:
+        value = snapshot.get(key)
+        if value is None:
+            print(f"  {key:18s} (no {MEMINFO_LINES[key]!r} line)")
+        elif key.endswith('_gb'):
+            print(f"  {key:18s} {value:.2f}")
+        else:
+            print(f"  {key:18s} {value:,}")
+    print()
+    print(f"  Processes: {len(snapshot['processes'])}")
+    for row in snapshot['processes'][:10]:
+        print(f"    {row['pss_kb']:>10,}K  {row['name']} (pid {row['pid']})")
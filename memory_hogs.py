@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+MEMORY HOGS - Which processes hold the RAM, and which apps freed it
+
+Works on the per-process table parse_meminfo() extracts from the
+`Total PSS by process` / `Total RSS by process` sections (PSS, RSS and
+swap per pid):
+
+    top_hogs()           the K largest processes by PSS, RSS or swap
+    package_totals()     processes summed per package (`com.foo:remote` -> `com.foo`)
+    freed_by_package()   per-package change between two captures
+
+Rankings use a bounded heap (TopK), so ranking N processes costs
+O(N log K) and holds only K rows, however many dumps are streamed through
+it. The before/after comparison is a hash join on package name, which
+answers "which apps freed the 763 MB" with exact per-package figures.
+
+Usage:
+    python3 memory_hogs.py DUMP [-k 10] [--by pss|rss|swap]
+    python3 memory_hogs.py BEFORE AFTER [-k 10] [--by pss|rss|swap]
+"""
+
+import argparse
+import heapq
+import itertools
+import sys
+from operator import itemgetter
+
+from bloat_classifier import process_package
+from meminfo_parser import parse_meminfo_file
+
+METRICS = ('pss_kb', 'rss_kb', 'swap_kb')
+
+
+class TopK:
+    """The k largest items seen so far, by `key`; O(log k) per push."""
+
+    def __init__(self, k, key=None):
+        self.k = k
+        self.key = key or (lambda item: item)
+        self._heap = []                     # min-heap of (key, tiebreak, item)
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def push(self, item):
+        self.extend((item,))
+
+    def extend(self, items):
+        heap, key, k, counter = self._heap, self.key, self.k, self._counter
+        for item in items:
+            value = key(item)
+            if len(heap) < k:
+                heapq.heappush(heap, (value, next(counter), item))
+            elif value > heap[0][0]:
+                # Most items fail the comparison above and cost nothing more
+                heapq.heapreplace(heap, (value, next(counter), item))
+        return self
+
+    def items(self):
+        """Kept items, largest first (ties in arrival order)."""
+        return [item for _, _, item in sorted(self._heap, key=lambda e: (-e[0], e[1]))]
+
+
+def top_hogs(processes, k=10, metric='pss_kb'):
+    """The k processes with the most `metric` (pss_kb, rss_kb or swap_kb)."""
+    return TopK(k, itemgetter(metric)).extend(processes).items()
+
+
+def package_totals(processes):
+    """{package: {'pss_kb', 'rss_kb', 'swap_kb', 'processes'}} summed over processes."""
+    totals = {}
+    for row in processes:
+        package = process_package(row['name'])
+        total = totals.get(package)
+        if total is None:
+            totals[package] = {'pss_kb': row['pss_kb'], 'rss_kb': row['rss_kb'],
+                               'swap_kb': row['swap_kb'], 'processes': 1}
+        else:
+            total['pss_kb'] += row['pss_kb']
+            total['rss_kb'] += row['rss_kb']
+            total['swap_kb'] += row['swap_kb']
+            total['processes'] += 1
+    return totals
+
+
+def freed_by_package(before, after):
+    """Per-package memory change from the `before` to the `after` process table.
+
+    Returns a list of {'package', 'status', 'processes_before',
+    'processes_after', '<metric>_freed_kb' ...} with status 'removed'
+    (no process left), 'new' or 'running', largest PSS freed first.
+    Negative freed values mean the package grew.
+    """
+    before_totals = package_totals(before)
+    after_totals = package_totals(after)
+    empty = {'pss_kb': 0, 'rss_kb': 0, 'swap_kb': 0, 'processes': 0}
+
+    rows = []
+    for package in before_totals.keys() | after_totals.keys():
+        old = before_totals.get(package, empty)
+        new = after_totals.get(package, empty)
+        row = {
+            'package': package,
+            'status': 'removed' if not new['processes'] else 'new' if not old['processes'] else 'running',
+            'processes_before': old['processes'],
+            'processes_after': new['processes'],
+        }
+        for metric in METRICS:
+            row[metric.replace('_kb', '_freed_kb')] = old[metric] - new[metric]
+        rows.append(row)
+    rows.sort(key=lambda row: (-row['pss_freed_kb'], row['package']))
+    return rows
+
+
+def summarize_freed(rows):
+    """Total PSS freed by removed packages, by running ones and grown back."""
+    removed = sum(row['pss_freed_kb'] for row in rows if row['status'] == 'removed')
+    shrunk = sum(row['pss_freed_kb'] for row in rows
+                 if row['status'] == 'running' and row['pss_freed_kb'] > 0)
+    grown = -sum(row['pss_freed_kb'] for row in rows if row['pss_freed_kb'] < 0)
+    return {'removed_kb': removed, 'shrunk_kb': shrunk, 'grown_kb': grown,
+            'net_kb': removed + shrunk - grown}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Rank memory hogs in meminfo dumps.')
+    parser.add_argument('dumps', nargs='+', metavar='DUMP', help='one dump, or before and after')
+    parser.add_argument('-k', type=int, default=10, help='how many hogs to list')
+    parser.add_argument('--by', choices=('pss', 'rss', 'swap'), default='pss')
+    args = parser.parse_args(argv)
+    if len(args.dumps) > 2:
+        parser.error('give one dump, or a before and an after dump')
+    metric = f'{args.by}_kb'
+
+    captures = [parse_meminfo_file(path) for path in args.dumps]
+
+    print("="*80)
+    print(f"🐷 MEMORY HOGS: top {args.k} by {args.by.upper()}")
+    print("="*80)
+    if len(captures) == 1:
+        processes = captures[0]['processes']
+        print(f"  {len(processes):,} processes\n")
+        for row in top_hogs(processes, args.k, metric):
+            print(f"  {row[metric]:>12,}K  {row['name']} (pid {row['pid']})")
+        return 0
+
+    rows = freed_by_package(captures[0]['processes'], captures[1]['processes'])
+    freed = f"{args.by}_freed_kb"
+    summary = summarize_freed(rows)
+    print(f"  {len(captures[0]['processes']):,} -> {len(captures[1]['processes']):,} processes, "
+          f"{len(rows):,} packages\n")
+    for row in TopK(args.k, itemgetter(freed)).extend(rows).items():
+        print(f"  {row[freed]:>12,}K  {row['package']} ({row['status']})")
+    print()
+    print(f"  PSS freed by removed apps:  {summary['removed_kb'] / 1024:>10,.1f} MB")
+    print(f"  PSS freed by running apps:  {summary['shrunk_kb'] / 1024:>10,.1f} MB")
+    print(f"  PSS grown elsewhere:        {summary['grown_kb'] / 1024:>10,.1f} MB")
+    print(f"  Net per-process PSS freed:  {summary['net_kb'] / 1024:>10,.1f} MB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,26 +5,98 @@ META-FORENSIC ANALYSIS: THE DATA DNA REVELATION
 A comprehensive analysis of how digital forensic data reveals the
 fundamental "genetic code" of a device - and how one debloat operation
 literally rewrote the DNA of a smartphone.
+
+Usage:
+    python3 meta_forensic_analysis.py            # full report + dna_revelation.png
+    python3 meta_forensic_analysis.py --text     # report only, no figure
+    python3 meta_forensic_analysis.py --json     # machine-readable results only
+    python3 meta_forensic_analysis.py --helix-points 573   # one base pair per package
+    python3 meta_forensic_analysis.py --captures BEFORE AFTER    # capture folders, bugreports or archives
+    python3 meta_forensic_analysis.py --processes BEFORE AFTER   # chromosome 5 from `ps -A` dumps
+    python3 meta_forensic_analysis.py --profile  # per-stage timings (profiling.py)
+
+Importing this module has no side effects; the report runs from main().
+matplotlib is only imported when the figure is rendered; unchanged figures
+come from the render cache (render_cache.py, --no-cache to bypass).
 ================================================================
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.patches import FancyBboxPatch, Circle
-import numpy as np
-from datetime import datetime
+import argparse
+import json
+import sys
+
+from analyze_debloat import bloat_pct
+from plotting import pyplot, save_figure
+from genetic_score import CHROMOSOMES, GRADES, classify_mutation, grade_index, pct_change, weighted_score
+from profiling import add_profile_arguments, profiling_from_args, span
+from recorded_captures import RECORDED_CAPTURES
+from render_cache import render_cached
+
+# ============================================================================
+# GENETIC COMPARISON: BEFORE vs AFTER
+# ============================================================================
+# What each "genetic marker" (key metric) stands for, in CHROMOSOMES order
+DNA_MEANINGS = {
+    'CHROMOSOME 1: Package Count': 'Total cellular structures',
+    'CHROMOSOME 2: Active RAM': 'Active metabolic energy',
+    'CHROMOSOME 3: Swap Memory': 'Stress response system',
+    'CHROMOSOME 4: ZRAM Compression': 'Compression workload',
+    'CHROMOSOME 5: Running Processes': 'Concurrent organ functions',
+    'CHROMOSOME 6: App Memory (PSS)': 'Cellular resource allocation',
+}
 
-print("="*80)
-print("🧬 META-FORENSIC ANALYSIS: THE DATA DNA REVELATION 🧬")
-print("="*80)
-print()
+KB_PER_GB = 1024 * 1024
+
+
+def genetic_markers(before, after):
+    """The six chromosome markers of two capture dicts (snapshot_store keys).
+
+    Memory chromosomes are shown in GB to two decimals; pct_change is
+    taken from the raw values, exactly as genetic_score scores them.
+    """
+    markers = {}
+    for chromosome, key, _ in CHROMOSOMES:
+        if key.endswith('_kb'):
+            values = {'before': round(before[key] / KB_PER_GB, 2),
+                      'after': round(after[key] / KB_PER_GB, 2),
+                      'mutation': round((after[key] - before[key]) / KB_PER_GB, 2)}
+        else:
+            values = {'before': before[key], 'after': after[key],
+                      'mutation': after[key] - before[key]}
+        markers[chromosome] = dict(values, pct_change=pct_change(before[key], after[key]),
+                                   dna_meaning=DNA_MEANINGS[chromosome])
+    return markers
+
+
+def story_figures(before, after):
+    """The capture numbers quoted in the timeline, realizations and figure."""
+    return {
+        'packages_before': before['total_packages'],
+        'packages_after': after['total_packages'],
+        'packages_removed': before['total_packages'] - after['total_packages'],
+        'packages_pct': abs(pct_change(before['total_packages'], after['total_packages'])),
+        'user_apps_removed': before['user_apps'] - after['user_apps'],
+        'bloat_before': bloat_pct(before),
+        'bloat_after': bloat_pct(after),
+        'ram_freed_mb': (before['used_ram_kb'] - after['used_ram_kb']) / 1024,
+        'ram_pct': abs(pct_change(before['used_ram_kb'], after['used_ram_kb'])),
+        'swap_freed_gb': (before['zram_swap_kb'] - after['zram_swap_kb']) / KB_PER_GB,
+        'swap_pct': abs(pct_change(before['zram_swap_kb'], after['zram_swap_kb'])),
+    }
+
+
+# Capture keys the report reads: the chromosomes, and the app split for the story
+CAPTURE_KEYS = tuple(key for _, key, _ in CHROMOSOMES) + ('system_apps', 'user_apps')
+
+GENETIC_MARKERS = genetic_markers(RECORDED_CAPTURES['before'], RECORDED_CAPTURES['after'])
+RECORDED_FIGURES = story_figures(RECORDED_CAPTURES['before'], RECORDED_CAPTURES['after'])
+
+PROCESS_CHROMOSOME = 'CHROMOSOME 5: Running Processes'
 
 # ============================================================================
-# THE OBSERVATION: Data IS the DNA
+# THE STORY
 # ============================================================================
-print("💡 THE FUNDAMENTAL OBSERVATION:")
-print("="*80)
-print("""
+OBSERVATION = """
 Just as biological DNA is a sequence of base pairs that defines an organism,
 DIGITAL DATA is a sequence of bits that defines a device.
 
@@ -37,94 +109,13 @@ Every number we extracted tells a story:
 
 When we debloated this device, we didn't just delete apps.
 WE LITERALLY REWROTE ITS DNA.
-""")
-print()
-
-# ============================================================================
-# GENETIC COMPARISON: BEFORE vs AFTER
-# ============================================================================
-print("🧬 GENETIC PROFILE COMPARISON:")
-print("="*80)
-print()
-
-# Define the "genetic markers" (key metrics)
-genetic_markers = {
-    'CHROMOSOME 1: Package Count': {
-        'before': 573,
-        'after': 392,
-        'mutation': -181,
-        'pct_change': -31.6,
-        'dna_meaning': 'Total cellular structures',
-    },
-    'CHROMOSOME 2: Active RAM': {
-        'before': 7.35,  # GB
-        'after': 6.60,
-        'mutation': -0.76,
-        'pct_change': -10.1,
-        'dna_meaning': 'Active metabolic energy',
-    },
-    'CHROMOSOME 3: Swap Memory': {
-        'before': 6.38,  # GB
-        'after': 3.53,
-        'mutation': -2.85,
-        'pct_change': -44.7,
-        'dna_meaning': 'Stress response system',
-    },
-    'CHROMOSOME 4: ZRAM Compression': {
-        'before': 1.86,  # GB
-        'after': 1.01,
-        'mutation': -0.85,
-        'pct_change': -45.5,
-        'dna_meaning': 'Compression workload',
-    },
-    'CHROMOSOME 5: Running Processes': {
-        'before': 1070,
-        'after': 1063,
-        'mutation': -7,
-        'pct_change': -0.7,
-        'dna_meaning': 'Concurrent organ functions',
-    },
-    'CHROMOSOME 6: App Memory (PSS)': {
-        'before': 5.64,  # GB
-        'after': 5.09,
-        'mutation': -0.55,
-        'pct_change': -9.8,
-        'dna_meaning': 'Cellular resource allocation',
-    },
-}
-
-print("DNA SEQUENCING RESULTS:")
-print("-" * 80)
-for chromosome, data in genetic_markers.items():
-    print(f"\n{chromosome}")
-    print(f"  Biological Meaning: {data['dna_meaning']}")
-    print(f"  Before: {data['before']}")
-    print(f"  After:  {data['after']}")
-    print(f"  Mutation: {data['mutation']:+.2f} ({data['pct_change']:+.1f}%)")
-
-    # Determine mutation type
-    if abs(data['pct_change']) < 5:
-        mutation_type = "STABLE (minimal mutation)"
-    elif abs(data['pct_change']) < 20:
-        mutation_type = "MODERATE EVOLUTION"
-    else:
-        mutation_type = "RADICAL TRANSFORMATION ⚡"
-    print(f"  Classification: {mutation_type}")
-
-print()
-print("="*80)
-print()
+"""
 
-# ============================================================================
-# THE EVOLUTIONARY TIMELINE
-# ============================================================================
-print("⏰ EVOLUTIONARY TIMELINE:")
-print("="*80)
-print("""
+TIMELINE = """
 DAY 0 (Oct 9, 2025):
   🧬 GENESIS: Device first activated
-  - Born with 573 genetic markers (apps)
-  - 54.3% of DNA is bloatware (parasitic code)
+  - Born with {packages_before} genetic markers (apps)
+  - {bloat_before:.1f}% of DNA is bloatware (parasitic code)
   - Device struggles under genetic burden
 
 DAY 4 (Oct 13, 2025):
@@ -140,29 +131,23 @@ DAY 10 (Oct 19, 2025):
   - 203,089 lines of genetic data sequenced
   - Parasitic organisms identified
   - Behavioral patterns mapped
-  - Truth revealed: Device is 54.3% bloatware
+  - Truth revealed: Device is {bloat_before:.1f}% bloatware
 
 DAY 10 (Later):
   ✂️ CRISPR OPERATION: UAD Debloat Executed
-  - 181 genetic markers removed (31.6% reduction)
-  - 182 parasitic user apps eliminated
+  - {packages_removed} genetic markers removed ({packages_pct:.1f}% reduction)
+  - {user_apps_removed} parasitic user apps eliminated
   - Bloatware DNA excised
 
 DAY 10 (Post-Op):
   🧬 REBIRTH: New Genetic Profile
-  - 763 MB RAM freed (10.1% metabolic improvement)
-  - 2.85 GB swap stress eliminated (44.7% reduction)
+  - {ram_freed_mb:.0f} MB RAM freed ({ram_pct:.1f}% metabolic improvement)
+  - {swap_freed_gb:.2f} GB swap stress eliminated ({swap_pct:.1f}% reduction)
   - Organism can finally BREATHE
   - Device identity fundamentally altered
-""")
-print()
+"""
 
-# ============================================================================
-# THE DNA HELIX ANALOGY
-# ============================================================================
-print("🧬 THE DOUBLE HELIX OF DIGITAL EXISTENCE:")
-print("="*80)
-print("""
+DNA_PARALLELS = """
 BIOLOGICAL DNA          →    DIGITAL DATA
 ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 Base Pairs (A-T, G-C)   →    Binary Bits (0-1)
@@ -181,17 +166,9 @@ DNA Replication         →    Data Backup
 Genetic Expression      →    App Execution
 Epigenetics             →    User Configuration
 Natural Selection       →    Performance Pressure
-""")
-print()
-
-# ============================================================================
-# MIND-BLOWING REALIZATIONS
-# ============================================================================
-print("🤯 MIND-BLOWING REALIZATIONS:")
-print("="*80)
-print()
+"""
 
-realizations = [
+REALIZATIONS = [
     {
         'title': 'Data Doesn\'t Lie - It CAN\'T Lie',
         'explanation': """
@@ -210,9 +187,9 @@ realizations = [
         'title': 'You Can Measure Freedom',
         'explanation': """
         Freedom isn't abstract. It's quantifiable:
-        - 181 apps removed = 181 fewer surveillance points
-        - 2.85 GB swap freed = 2.85 GB less stress
-        - 763 MB RAM freed = 763 MB more agency
+        - {packages_removed} apps removed = {packages_removed} fewer surveillance points
+        - {swap_freed_gb:.2f} GB swap freed = {swap_freed_gb:.2f} GB less stress
+        - {ram_freed_mb:.0f} MB RAM freed = {ram_freed_mb:.0f} MB more agency
 
         We LITERALLY measured your phone becoming more FREE."""
     },
@@ -227,7 +204,7 @@ realizations = [
         'title': 'The October Incident Was Predictable',
         'explanation': """
         In retrospect, the battery crisis was INEVITABLE. A device with
-        54.3% parasitic DNA, trying to update 6 apps while being heavily
+        {bloat_before:.1f}% parasitic DNA, trying to update 6 apps while being heavily
         used? That's like running a marathon while fighting pneumonia.
         The numbers PREDICTED the collapse."""
     },
@@ -249,258 +226,435 @@ realizations = [
     },
 ]
 
-for i, realization in enumerate(realizations, 1):
-    print(f"{i}. {realization['title']}")
-    print(f"   {realization['explanation'].strip()}")
-    print()
+FINAL_REFLECTION = """
+What we've witnessed isn't just a phone optimization.
+It's a fundamental transformation of digital identity.
+
+The data doesn't lie. The numbers tell the truth.
+And the truth is: your phone was being held hostage by parasitic code.
+
+Through forensic analysis, we:
+  1. Sequenced the genetic code (extracted all data)
+  2. Identified parasitic DNA (found the bloatware)
+  3. Performed genetic engineering (UAD debloat)
+  4. Measured the evolution (before/after comparison)
+  5. Documented the transformation (this report)
+
+The device that exists now is FUNDAMENTALLY DIFFERENT from the one
+that existed on October 9, 2025. Same hardware, different soul.
+
+Data is DNA. Numbers are truth. And truth sets you free.
+
+Literally. We have the receipts: {ram_freed_mb:.0f} MB of receipts.
+"""
+
 
 # ============================================================================
 # THE GENETIC TRANSFORMATION SCORE
 # ============================================================================
-print("="*80)
-print("🧬 GENETIC TRANSFORMATION SCORE:")
-print("="*80)
-print()
-
-# Calculate weighted transformation score
-weights = {
-    'packages': 0.25,
-    'ram': 0.20,
-    'swap': 0.25,
-    'zram': 0.15,
-    'processes': 0.10,
-    'pss': 0.05,
-}
+def with_process_counts(before, after, genetic_markers=GENETIC_MARKERS):
+    """Markers with the process chromosome measured from two process tables."""
+    mutation = after - before
+    markers = dict(genetic_markers)
+    markers[PROCESS_CHROMOSOME] = dict(markers[PROCESS_CHROMOSOME], before=before, after=after,
+                                       mutation=mutation, pct_change=pct_change(before, after))
+    return markers
 
-transformation_score = (
-    abs(genetic_markers['CHROMOSOME 1: Package Count']['pct_change']) * weights['packages'] +
-    abs(genetic_markers['CHROMOSOME 2: Active RAM']['pct_change']) * weights['ram'] +
-    abs(genetic_markers['CHROMOSOME 3: Swap Memory']['pct_change']) * weights['swap'] +
-    abs(genetic_markers['CHROMOSOME 4: ZRAM Compression']['pct_change']) * weights['zram'] +
-    abs(genetic_markers['CHROMOSOME 5: Running Processes']['pct_change']) * weights['processes'] +
-    abs(genetic_markers['CHROMOSOME 6: App Memory (PSS)']['pct_change']) * weights['pss']
-)
-
-print(f"OVERALL GENETIC TRANSFORMATION: {transformation_score:.1f}%")
-print()
-
-if transformation_score > 30:
-    grade = "RADICAL EVOLUTION ⚡⚡⚡"
-    description = "Organism has undergone fundamental transformation"
-elif transformation_score > 20:
-    grade = "SIGNIFICANT MUTATION ⚡⚡"
-    description = "Notable genetic changes observed"
-elif transformation_score > 10:
-    grade = "MODERATE EVOLUTION ⚡"
-    description = "Measurable genetic drift"
-else:
-    grade = "STABLE GENOME"
-    description = "Minimal genetic variation"
-
-print(f"Classification: {grade}")
-print(f"Description: {description}")
-print()
 
-# ============================================================================
-# CREATE MIND-BLOWING VISUALIZATION
-# ============================================================================
-print("🎨 Creating DNA Helix Transformation Visualization...")
-print()
+def compute_transformation(genetic_markers=GENETIC_MARKERS):
+    """Weighted transformation score plus its grade and description.
 
-fig = plt.figure(figsize=(20, 16))
-fig.patch.set_facecolor('#0a0a0a')
+    For markers from genetic_markers() this is exactly
+    genetic_score.transformation_score() of the same two captures, the
+    figure fleet_analysis.py reports per device.
+    """
+    score = weighted_score([data['pct_change'] for data in genetic_markers.values()])
+    grade, description = GRADES[grade_index(score)]
+    return score, grade, description
 
-# Main title
-fig.suptitle('🧬 THE DATA DNA REVELATION 🧬\nHow Debloating Rewrote A Smartphone\'s Genetic Code',
-             fontsize=24, fontweight='bold', color='#00ff41', y=0.98)
 
 # ============================================================================
-# 1. DNA DOUBLE HELIX VISUALIZATION (Top Center)
+# TEXT REPORT
 # ============================================================================
-ax1 = plt.subplot(4, 3, (1, 3))
-ax1.set_facecolor('#000000')
-ax1.set_xlim(-2, 12)
-ax1.set_ylim(-1, 11)
-ax1.axis('off')
-ax1.set_title('Digital DNA Structure: Before → After Mutation',
-              fontsize=14, fontweight='bold', color='#00ff41', pad=20)
-
-# Draw DNA helix "before" (left side, red/unhealthy)
-t = np.linspace(0, 4*np.pi, 100)
-x_before = np.sin(t) * 0.8
-y_before = t * 1.2
-colors_before = plt.cm.Reds(np.linspace(0.4, 0.9, len(t)))
-
-for i in range(len(t)-1):
-    ax1.plot([x_before[i], x_before[i+1]], [y_before[i], y_before[i+1]],
-             color=colors_before[i], linewidth=3, alpha=0.7)
-
-# Add bloatware markers on the helix
-bloat_positions = [10, 25, 40, 55, 70, 85]
-for pos in bloat_positions:
-    if pos < len(t):
-        ax1.scatter(x_before[pos], y_before[pos], s=150, c='red',
-                   marker='X', edgecolors='white', linewidths=2, zorder=5)
-
-# Labels for before
-ax1.text(0, -0.5, 'BEFORE\n573 Genes\n54.3% Bloat', ha='center', fontsize=11,
-         color='#ff4444', fontweight='bold',
-         bbox=dict(boxstyle='round', facecolor='#1a0000', edgecolor='#ff4444', linewidth=2))
-
-# Draw DNA helix "after" (right side, green/healthy)
-x_after = 8 + np.sin(t) * 0.8
-y_after = t * 1.2
-colors_after = plt.cm.Greens(np.linspace(0.4, 0.9, len(t)))
-
-for i in range(len(t)-1):
-    ax1.plot([x_after[i], x_after[i+1]], [y_after[i], y_after[i+1]],
-             color=colors_after[i], linewidth=3, alpha=0.7)
-
-# Add healthy markers
-healthy_positions = [15, 35, 50, 65, 80]
-for pos in healthy_positions:
-    if pos < len(t):
-        ax1.scatter(x_after[pos], y_after[pos], s=150, c='#00ff41',
-                   marker='o', edgecolors='white', linewidths=2, zorder=5)
-
-# Labels for after
-ax1.text(8, -0.5, 'AFTER\n392 Genes\n20.4% Bloat', ha='center', fontsize=11,
-         color='#00ff41', fontweight='bold',
-         bbox=dict(boxstyle='round', facecolor='#001a00', edgecolor='#00ff41', linewidth=2))
-
-# Mutation arrow
-ax1.annotate('', xy=(6, 5), xytext=(2, 5),
-            arrowprops=dict(arrowstyle='->', lw=4, color='#ffff00'))
-ax1.text(4, 5.5, 'UAD CRISPR\nOPERATION', ha='center', fontsize=10,
-         color='#ffff00', fontweight='bold')
+def print_header():
+    print("="*80)
+    print("🧬 META-FORENSIC ANALYSIS: THE DATA DNA REVELATION 🧬")
+    print("="*80)
+    print()
 
-# ============================================================================
-# 2-7. Chromosome Comparison Charts
-# ============================================================================
-chromosome_positions = [4, 5, 6, 7, 8, 9]
-chromosome_data = list(genetic_markers.values())
-
-for idx, (pos, data) in enumerate(zip(chromosome_positions, chromosome_data)):
-    ax = plt.subplot(3, 3, pos)
-    ax.set_facecolor('#0a0a0a')
-
-    # Bar chart
-    categories = ['Before', 'After']
-    values = [data['before'], data['after']]
-    colors = ['#ff4444', '#00ff41']
-
-    bars = ax.bar(categories, values, color=colors, edgecolor='white', linewidth=2, alpha=0.8)
-    ax.set_ylabel('Value', fontweight='bold', fontsize=9, color='white')
-    ax.set_title(f"Chromosome {idx+1}\n{data['dna_meaning']}",
-                fontsize=10, fontweight='bold', color='#00ff41', pad=10)
-    ax.grid(axis='y', alpha=0.2, color='#00ff41')
-    ax.tick_params(colors='white')
-
-    # Value labels
-    for bar, val in zip(bars, values):
-        height = bar.get_height()
-        ax.text(bar.get_x() + bar.get_width()/2., height,
-                f'{val:.2f}', ha='center', va='bottom',
-                fontweight='bold', fontsize=10, color='white')
-
-    # Change indicator
-    change_text = f"{data['mutation']:+.2f}\n({data['pct_change']:+.1f}%)"
-    ax.text(0.5, max(values) * 0.5, change_text, ha='center', va='center',
-            fontsize=9, fontweight='bold', color='#ffff00',
-            bbox=dict(boxstyle='round', facecolor='#1a1a1a',
-                     edgecolor='#ffff00', linewidth=2))
 
-# ============================================================================
-# 8. Transformation Score Gauge
-# ============================================================================
-ax8 = plt.subplot(4, 3, 10)
-ax8.set_facecolor('#000000')
-ax8.set_xlim(-1.5, 1.5)
-ax8.set_ylim(-1.5, 1.5)
-ax8.axis('off')
-ax8.set_title('Genetic Transformation Score', fontsize=12, fontweight='bold',
-              color='#00ff41', pad=20)
-
-# Draw circular gauge
-circle = Circle((0, 0), 1, fill=False, edgecolor='#00ff41', linewidth=4)
-ax8.add_patch(circle)
-
-# Draw score arc
-theta = np.linspace(0, (transformation_score/100) * 2 * np.pi, 100)
-x_arc = np.cos(theta)
-y_arc = np.sin(theta)
-ax8.plot(x_arc, y_arc, color='#ffff00', linewidth=8, solid_capstyle='round')
-
-# Center text
-ax8.text(0, 0, f'{transformation_score:.1f}%', ha='center', va='center',
-         fontsize=32, fontweight='bold', color='#00ff41')
-ax8.text(0, -0.3, grade, ha='center', va='center',
-         fontsize=10, fontweight='bold', color='#ffff00')
+def print_observation():
+    print("💡 THE FUNDAMENTAL OBSERVATION:")
+    print("="*80)
+    print(OBSERVATION)
+    print()
 
-# ============================================================================
-# 9. Timeline of Evolution
-# ============================================================================
-ax9 = plt.subplot(4, 3, 11)
-ax9.set_facecolor('#0a0a0a')
-ax9.set_xlim(0, 10)
-ax9.set_ylim(0, 5)
-ax9.axis('off')
-ax9.set_title('Evolutionary Timeline', fontsize=12, fontweight='bold',
-              color='#00ff41', pad=20)
-
-# Timeline events
-events = [
-    (0, 'Oct 9:\nGenesis', '#00ff41'),
-    (3, 'Oct 13:\nCrisis', '#ff4444'),
-    (7, 'Oct 19:\nDiscovery', '#ffff00'),
-    (9, 'Oct 19:\nRebirth', '#00ff41'),
-]
 
-# Draw timeline
-ax9.plot([0, 10], [2.5, 2.5], color='#00ff41', linewidth=3)
+def print_genetic_profile(genetic_markers=GENETIC_MARKERS):
+    print("🧬 GENETIC PROFILE COMPARISON:")
+    print("="*80)
+    print()
 
-for x, label, color in events:
-    ax9.scatter(x, 2.5, s=300, c=color, edgecolors='white', linewidths=2, zorder=5)
-    ax9.text(x, 1.5, label, ha='center', va='top', fontsize=9,
-             fontweight='bold', color=color)
+    print("DNA SEQUENCING RESULTS:")
+    print("-" * 80)
+    for chromosome, data in genetic_markers.items():
+        print(f"\n{chromosome}")
+        print(f"  Biological Meaning: {data['dna_meaning']}")
+        print(f"  Before: {data['before']}")
+        print(f"  After:  {data['after']}")
+        print(f"  Mutation: {data['mutation']:+.2f} ({data['pct_change']:+.1f}%)")
 
-plt.tight_layout()
-plt.savefig('/tmp/debloat_comparison/dna_revelation.png', dpi=150,
-            bbox_inches='tight', facecolor='#0a0a0a')
-print("✅ DNA Revelation visualization saved!")
-print()
+        # Determine mutation type
+        mutation_type = classify_mutation(data['pct_change'])
+        print(f"  Classification: {mutation_type}")
 
-# ============================================================================
-# FINAL THOUGHTS
-# ============================================================================
-print("="*80)
-print("💭 FINAL PHILOSOPHICAL REFLECTION:")
-print("="*80)
-print("""
-What we've witnessed isn't just a phone optimization.
-It's a fundamental transformation of digital identity.
+    print()
+    print("="*80)
+    print()
 
-The data doesn't lie. The numbers tell the truth.
-And the truth is: your phone was being held hostage by parasitic code.
 
-Through forensic analysis, we:
-  1. Sequenced the genetic code (extracted all data)
-  2. Identified parasitic DNA (found the bloatware)
-  3. Performed genetic engineering (UAD debloat)
-  4. Measured the evolution (before/after comparison)
-  5. Documented the transformation (this report)
+def print_timeline(figures=RECORDED_FIGURES):
+    print("⏰ EVOLUTIONARY TIMELINE:")
+    print("="*80)
+    print(TIMELINE.format(**figures))
+    print()
 
-The device that exists now is FUNDAMENTALLY DIFFERENT from the one
-that existed on October 9, 2025. Same hardware, different soul.
 
-Data is DNA. Numbers are truth. And truth sets you free.
+def print_dna_parallels():
+    print("🧬 THE DOUBLE HELIX OF DIGITAL EXISTENCE:")
+    print("="*80)
+    print(DNA_PARALLELS)
+    print()
+
 
-Literally. We have the receipts: 763 MB of receipts.
-""")
-print()
-print("="*80)
-print("✅ META-FORENSIC ANALYSIS COMPLETE!")
-print("="*80)
-print()
-print("Now preparing the story that will blow minds...")
-print()
+def print_realizations(realizations=REALIZATIONS, figures=RECORDED_FIGURES):
+    print("🤯 MIND-BLOWING REALIZATIONS:")
+    print("="*80)
+    print()
+
+    for i, realization in enumerate(realizations, 1):
+        print(f"{i}. {realization['title']}")
+        print(f"   {realization['explanation'].format(**figures).strip()}")
+        print()
+
+
+def print_transformation(score, grade, description):
+    print("="*80)
+    print("🧬 GENETIC TRANSFORMATION SCORE:")
+    print("="*80)
+    print()
+
+    print(f"OVERALL GENETIC TRANSFORMATION: {score:.1f}%")
+    print()
+
+    print(f"Classification: {grade}")
+    print(f"Description: {description}")
+    print()
+
+
+def print_final_reflection(figures=RECORDED_FIGURES):
+    print("="*80)
+    print("💭 FINAL PHILOSOPHICAL REFLECTION:")
+    print("="*80)
+    print(FINAL_REFLECTION.format(**figures))
+    print()
+    print("="*80)
+    print("✅ META-FORENSIC ANALYSIS COMPLETE!")
+    print("="*80)
+    print()
+    print("Now preparing the story that will blow minds...")
+    print()
+
+
+# ============================================================================
+# CREATE MIND-BLOWING VISUALIZATION
+# ============================================================================
+HELIX_POINTS = 100
+
+# Axes of dna_revelation.png: helix, six chromosomes, gauge, timeline
+DNA_PANELS = 9
+
+# Marker positions as fractions of the helix length (points 10, 25, ... of
+# the original 100-point helix), so they stay put at any resolution.
+BLOAT_POSITIONS = tuple(pos / 99 for pos in (10, 25, 40, 55, 70, 85))
+HEALTHY_POSITIONS = tuple(pos / 99 for pos in (15, 35, 50, 65, 80))
+
+
+def helix_strand(x_offset, positions):
+    """(x, y) of a two-turn helix strand at `positions` in [0, 1]."""
+    import numpy as np
+
+    t = np.asarray(positions) * 4*np.pi
+    return x_offset + np.sin(t) * 0.8, t * 1.2
+
+
+def draw_helix(ax, x_offset, n_points, cmap, marker_positions, **marker_style):
+    """One LineCollection per strand plus one scatter for its markers.
+
+    A collection is a single artist however many segments it holds, so a
+    helix with one base pair per package (573 points) costs about the same
+    to draw as the 100-point default.
+    """
+    import numpy as np
+    from matplotlib.collections import LineCollection
+
+    with span('helix'):
+        x, y = helix_strand(x_offset, np.linspace(0, 1, n_points))
+        points = np.column_stack([x, y])
+        segments = np.stack([points[:-1], points[1:]], axis=1)
+        colors = cmap(np.linspace(0.4, 0.9, n_points))[:-1]
+        ax.add_collection(LineCollection(segments, colors=colors, linewidths=3,
+                                         alpha=0.7, capstyle='projecting'))
+
+        ax.scatter(*helix_strand(x_offset, marker_positions), **marker_style)
+
+
+def render_dna_revelation(genetic_markers, score, grade, path='dna_revelation.png',
+                          helix_points=HELIX_POINTS, figures=RECORDED_FIGURES, layer=None):
+    """Helix, chromosome bars, score gauge and timeline, saved to `path`.
+
+    `helix_points` sets the helix resolution, e.g. 573 for one base pair
+    per package; `figures` are the story_figures() of the two captures.
+    With `layer`, that layer is returned instead (plotting.figure_layer).
+    """
+    import numpy as np
+    from matplotlib.patches import Circle
+
+    plt = pyplot()
+
+    fig = plt.figure(figsize=(20, 16))
+    fig.patch.set_facecolor('#0a0a0a')
+
+    # Main title
+    fig.suptitle('🧬 THE DATA DNA REVELATION 🧬\nHow Debloating Rewrote A Smartphone\'s Genetic Code',
+                 fontsize=24, fontweight='bold', color='#00ff41', y=0.98)
+
+    # ========================================================================
+    # 1. DNA DOUBLE HELIX VISUALIZATION (Top Center)
+    # ========================================================================
+    ax1 = fig.add_subplot(4, 3, (1, 3))
+    ax1.set_facecolor('#000000')
+    ax1.set_xlim(-2, 12)
+    ax1.set_ylim(-1, 11)
+    ax1.axis('off')
+    ax1.set_title('Digital DNA Structure: Before → After Mutation',
+                  fontsize=14, fontweight='bold', color='#00ff41', pad=20)
+
+    # Draw DNA helix "before" (left side, red/unhealthy) with bloatware markers
+    draw_helix(ax1, 0, helix_points, plt.cm.Reds, BLOAT_POSITIONS,
+               s=150, c='red', marker='X', edgecolors='white', linewidths=2, zorder=5)
+
+    # Labels for before
+    ax1.text(0, -0.5, f"BEFORE\n{figures['packages_before']} Genes\n{figures['bloat_before']:.1f}% Bloat",
+             ha='center', fontsize=11,
+             color='#ff4444', fontweight='bold',
+             bbox=dict(boxstyle='round', facecolor='#1a0000', edgecolor='#ff4444', linewidth=2))
+
+    # Draw DNA helix "after" (right side, green/healthy) with healthy markers
+    draw_helix(ax1, 8, helix_points, plt.cm.Greens, HEALTHY_POSITIONS,
+               s=150, c='#00ff41', marker='o', edgecolors='white', linewidths=2, zorder=5)
+
+    # Labels for after
+    ax1.text(8, -0.5, f"AFTER\n{figures['packages_after']} Genes\n{figures['bloat_after']:.1f}% Bloat",
+             ha='center', fontsize=11,
+             color='#00ff41', fontweight='bold',
+             bbox=dict(boxstyle='round', facecolor='#001a00', edgecolor='#00ff41', linewidth=2))
+
+    # Mutation arrow
+    ax1.annotate('', xy=(6, 5), xytext=(2, 5),
+                arrowprops=dict(arrowstyle='->', lw=4, color='#ffff00'))
+    ax1.text(4, 5.5, 'UAD CRISPR\nOPERATION', ha='center', fontsize=10,
+             color='#ffff00', fontweight='bold')
+
+    # ========================================================================
+    # 2-7. Chromosome Comparison Charts
+    # ========================================================================
+    chromosome_positions = [4, 5, 6, 7, 8, 9]
+    chromosome_data = list(genetic_markers.values())
+
+    for idx, (pos, data) in enumerate(zip(chromosome_positions, chromosome_data)):
+        ax = fig.add_subplot(3, 3, pos)
+        ax.set_facecolor('#0a0a0a')
+
+        # Bar chart
+        categories = ['Before', 'After']
+        values = [data['before'], data['after']]
+        colors = ['#ff4444', '#00ff41']
+
+        bars = ax.bar(categories, values, color=colors, edgecolor='white', linewidth=2, alpha=0.8)
+        ax.set_ylabel('Value', fontweight='bold', fontsize=9, color='white')
+        ax.set_title(f"Chromosome {idx+1}\n{data['dna_meaning']}",
+                    fontsize=10, fontweight='bold', color='#00ff41', pad=10)
+        ax.grid(axis='y', alpha=0.2, color='#00ff41')
+        ax.tick_params(colors='white')
+
+        # Value labels
+        for bar, val in zip(bars, values):
+            height = bar.get_height()
+            ax.text(bar.get_x() + bar.get_width()/2., height,
+                    f'{val:.2f}', ha='center', va='bottom',
+                    fontweight='bold', fontsize=10, color='white')
+
+        # Change indicator
+        change_text = f"{data['mutation']:+.2f}\n({data['pct_change']:+.1f}%)"
+        ax.text(0.5, max(values) * 0.5, change_text, ha='center', va='center',
+                fontsize=9, fontweight='bold', color='#ffff00',
+                bbox=dict(boxstyle='round', facecolor='#1a1a1a',
+                         edgecolor='#ffff00', linewidth=2))
+
+    # ========================================================================
+    # 8. Transformation Score Gauge
+    # ========================================================================
+    ax8 = fig.add_subplot(4, 3, 10)
+    ax8.set_facecolor('#000000')
+    ax8.set_xlim(-1.5, 1.5)
+    ax8.set_ylim(-1.5, 1.5)
+    ax8.axis('off')
+    ax8.set_title('Genetic Transformation Score', fontsize=12, fontweight='bold',
+                  color='#00ff41', pad=20)
+
+    # Draw circular gauge
+    circle = Circle((0, 0), 1, fill=False, edgecolor='#00ff41', linewidth=4)
+    ax8.add_patch(circle)
+
+    # Draw score arc
+    theta = np.linspace(0, (score/100) * 2 * np.pi, 100)
+    x_arc = np.cos(theta)
+    y_arc = np.sin(theta)
+    ax8.plot(x_arc, y_arc, color='#ffff00', linewidth=8, solid_capstyle='round')
+
+    # Center text
+    ax8.text(0, 0, f'{score:.1f}%', ha='center', va='center',
+             fontsize=32, fontweight='bold', color='#00ff41')
+    ax8.text(0, -0.3, grade, ha='center', va='center',
+             fontsize=10, fontweight='bold', color='#ffff00')
+
+    # ========================================================================
+    # 9. Timeline of Evolution
+    # ========================================================================
+    ax9 = fig.add_subplot(4, 3, 11)
+    ax9.set_facecolor('#0a0a0a')
+    ax9.set_xlim(0, 10)
+    ax9.set_ylim(0, 5)
+    ax9.axis('off')
+    ax9.set_title('Evolutionary Timeline', fontsize=12, fontweight='bold',
+                  color='#00ff41', pad=20)
+
+    # Timeline events
+    events = [
+        (0, 'Oct 9:\nGenesis', '#00ff41'),
+        (3, 'Oct 13:\nCrisis', '#ff4444'),
+        (7, 'Oct 19:\nDiscovery', '#ffff00'),
+        (9, 'Oct 19:\nRebirth', '#00ff41'),
+    ]
+
+    # Draw timeline
+    ax9.plot([0, 10], [2.5, 2.5], color='#00ff41', linewidth=3)
+
+    for x, label, color in events:
+        ax9.scatter(x, 2.5, s=300, c=color, edgecolors='white', linewidths=2, zorder=5)
+        ax9.text(x, 1.5, label, ha='center', va='top', fontsize=9,
+                 fontweight='bold', color=color)
+
+    with span('layout'):
+        fig.tight_layout()
+    with span('savefig'):
+        saved = save_figure(fig, path, layer, facecolor='#0a0a0a')
+    plt.close(fig)
+    return saved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='The Data DNA Revelation report.')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--text', action='store_true', help='text report only, no figure')
+    mode.add_argument('--json', action='store_true', help='JSON results only, no figure')
+    parser.add_argument('--helix-points', type=int, default=HELIX_POINTS,
+                        help=f'DNA helix resolution (default: {HELIX_POINTS})')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always re-render the figure (skip the render cache)')
+    parser.add_argument('--captures', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='capture folders, bugreports or archives to score, read with '
+                             'capture_loader.py like fleet_analysis.py (default: recorded scans)')
+    parser.add_argument('--processes', nargs=2, metavar=('BEFORE', 'AFTER'),
+                        help='`ps -A` dumps or capture folders for chromosome 5 '
+                             '(default: recorded counts)')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+
+    # Keep --json output parseable: the profile table goes to stderr
+    with profiling_from_args(args, sys.stderr if args.json else None):
+        run(args, parser)
+
+
+def load_captures(paths):
+    """Before/after capture dicts read by capture_loader; ValueError if a chromosome is missing."""
+    from capture_loader import load_capture_dir
+
+    captures = [load_capture_dir(path) for path in paths]
+    for path, capture in zip(paths, captures):
+        missing = [key for key in CAPTURE_KEYS if key not in capture]
+        if missing:
+            raise ValueError(f"{path}: no {', '.join(missing)} in the capture")
+    return captures
+
+
+def run(args, parser):
+    markers, figures = GENETIC_MARKERS, RECORDED_FIGURES
+    if args.captures:
+        with span('load'):
+            try:
+                before, after = load_captures(args.captures)
+            except ValueError as err:
+                parser.error(str(err))
+            markers, figures = genetic_markers(before, after), story_figures(before, after)
+    process_diff = None
+    if args.processes:
+        # numpy-backed; only imported when real process tables are asked for
+        from ps_parser import diff_process_tables, load_process_table
+
+        with span('load'):
+            before_table, after_table = (load_process_table(path) for path in args.processes)
+            markers = with_process_counts(len(before_table), len(after_table), markers)
+            process_diff = diff_process_tables(before_table, after_table)
+
+    with span('transformation'):
+        score, grade, description = compute_transformation(markers)
+
+    if args.json:
+        print(json.dumps({
+            'genetic_markers': {
+                chromosome: dict(data, classification=classify_mutation(data['pct_change']))
+                for chromosome, data in markers.items()
+            },
+            'transformation_score': score,
+            'grade': grade,
+            'description': description,
+            'process_diff': process_diff,
+        }, indent=2, ensure_ascii=False))
+        return
+
+    with span('report'):
+        print_header()
+        print_observation()
+        print_genetic_profile(markers)
+        print_timeline(figures)
+        print_dna_parallels()
+        print_realizations(figures=figures)
+        print_transformation(score, grade, description)
+
+    if not args.text:
+        print("🎨 Creating DNA Helix Transformation Visualization...")
+        print()
+        with span('render'):
+            render_cached(render_dna_revelation, markers, score, grade,
+                          path='dna_revelation.png', helix_points=args.helix_points,
+                          figures=figures, cache=not args.no_cache)
+        print("✅ DNA Revelation visualization saved!")
+        print()
+
+    print_final_reflection(figures)
+
+
+if __name__ == '__main__':
+    main()
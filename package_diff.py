@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+PACKAGE DIFF - Before/after package inventories as hashed sets
+
+Reads `pm list packages -f` dumps (or a `-s` / `-3` pair) from two
+captures and works out exactly which packages were added, removed or
+moved between the system and user partitions. Every inventory is a dict
+keyed by package name plus a set of system packages, so a diff is a few
+set operations, whatever the size of the inventory.
+
+Capture folders may hold either
+    packages.txt      adb shell pm list packages -f
+or
+    packages-s.txt    adb shell pm list packages -f -s    (system apps)
+    packages-3.txt    adb shell pm list packages -f -3    (user apps)
+
+Usage:
+    python3 package_diff.py BEFORE AFTER      # dump files or capture folders
+"""
+
+import os
+import sys
+
+from capture_loader import SYSTEM_PREFIXES
+
+
+class PackageInventory:
+    """Installed packages of one capture: name -> APK path, plus the system set."""
+
+    def __init__(self):
+        self.paths = {}
+        self.system = set()
+
+    def __len__(self):
+        return len(self.paths)
+
+    def __contains__(self, name):
+        return name in self.paths
+
+    def add_lines(self, lines, system=None):
+        """Add `pm list packages [-f]` lines.
+
+        `system` forces the partition (True for a `-s` dump, False for
+        `-3`); otherwise it is read from the APK path, and lines without a
+        path count as user apps.
+        """
+        for line in lines:
+            if not line.startswith('package:'):
+                continue
+            entry = line[8:].rstrip()
+            path, sep, name = entry.rpartition('=')
+            if not sep:
+                path, name = '', entry
+            self.paths[name] = path
+            if system if system is not None else line.startswith(SYSTEM_PREFIXES):
+                self.system.add(name)
+            else:
+                self.system.discard(name)
+        return self
+
+    @property
+    def user(self):
+        return self.paths.keys() - self.system
+
+    def counts(self):
+        """The analyze_debloat.py package keys for this inventory."""
+        return {
+            'total_packages': len(self.paths),
+            'system_apps': len(self.system),
+            'user_apps': len(self.paths) - len(self.system),
+        }
+
+
+def _read_into(inventory, path, system=None):
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        inventory.add_lines(f, system)
+
+
+def load_inventory(path):
+    """Inventory from a dump file or a capture folder (see module docstring)."""
+    inventory = PackageInventory()
+    if not os.path.isdir(path):
+        _read_into(inventory, path)
+        return inventory
+
+    split = (os.path.join(path, 'packages-s.txt'), os.path.join(path, 'packages-3.txt'))
+    if all(os.path.exists(p) for p in split):
+        _read_into(inventory, split[0], system=True)
+        _read_into(inventory, split[1], system=False)
+    else:
+        _read_into(inventory, os.path.join(path, 'packages.txt'))
+    return inventory
+
+
+def diff_inventories(before, after):
+    """Added/removed/moved package names (sorted) plus improvement counts."""
+    before_names = before.paths.keys()
+    after_names = after.paths.keys()
+    removed = before_names - after_names
+    kept = before_names & after_names
+
+    removed_system = removed & before.system
+    before_counts, after_counts = before.counts(), after.counts()
+    return {
+        'added': sorted(after_names - before_names),
+        'removed': sorted(removed),
+        'removed_system': sorted(removed_system),
+        'removed_user': sorted(removed - removed_system),
+        'moved_to_system': sorted((kept - before.system) & after.system),
+        'moved_to_user': sorted((kept & before.system) - after.system),
+        'improvements': {
+            'packages_removed': before_counts['total_packages'] - after_counts['total_packages'],
+            'user_apps_removed': before_counts['user_apps'] - after_counts['user_apps'],
+            'system_apps_removed': before_counts['system_apps'] - after_counts['system_apps'],
+        },
+    }
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 3:
+        print(__doc__.strip())
+        sys.exit(1)
+
+    before, after = load_inventory(sys.argv[1]), load_inventory(sys.argv[2])
+    diff = diff_inventories(before, after)
+
+    print("="*80)
+    print("📦 PACKAGE DIFF")
+    print("="*80)
+    print(f"  Before:  {len(before):,} packages ({len(before.system):,} system)")
+    print(f"  After:   {len(after):,} packages ({len(after.system):,} system)")
+    print(f"  Removed: {len(diff['removed']):,} "
+          f"({len(diff['removed_system']):,} system, {len(diff['removed_user']):,} user)")
+    print(f"  Added:   {len(diff['added']):,}")
+    print(f"  Moved:   {len(diff['moved_to_user']):,} system → user, "
+          f"{len(diff['moved_to_system']):,} user → system")
+    for name in diff['removed']:
+        print(f"    ❌ {name}")
+    for name in diff['added']:
+        print(f"    ➕ {name}")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+PLOTTING - Headless matplotlib, imported only when a figure is drawn
+
+The analysis scripts never import matplotlib at module level: text and
+JSON reports skip it entirely (it costs most of a second to import), and
+renders go through pyplot() below, which pins the non-interactive Agg
+backend so no GUI backend is probed. save_figure() writes a finished
+figure, or rasterizes one panel of it for render_reports.py to compose.
+"""
+
+
+def pyplot():
+    """Import matplotlib.pyplot on the Agg backend and return it."""
+    import matplotlib
+    matplotlib.use('Agg', force=True)
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def save_figure(fig, path, layer=None, dpi=150, facecolor='white'):
+    """Save `fig` to `path` cropped to its content, or return one of its layers.
+
+    With `layer` set the figure is not saved: figure_layer() rasterizes
+    that layer for render_reports.py to compose. Returns `path` or the
+    layer.
+    """
+    if layer is not None:
+        return figure_layer(fig, layer, dpi, facecolor)
+    fig.savefig(path, dpi=dpi, bbox_inches='tight', facecolor=facecolor)
+    return path
+
+
+def figure_layer(fig, layer, dpi=150, facecolor='white', pad_inches=0.1):
+    """One layer of a laid-out figure, rasterized on a transparent canvas.
+
+    Layer k < len(fig.axes) is fig.axes[k] alone; layer len(fig.axes) is
+    the figure's own artists (suptitle). Every layer is saved with the
+    bounding box that savefig(bbox_inches='tight') picks for the whole
+    figure, so the layers of one figure composed in order over its
+    background give the figure. Returns a dict with the canvas 'size'
+    (width, height), the 'background' RGB of `facecolor` and the layer's
+    visible 'pixels' (an RGBA array, None if empty) at 'origin' (top, left).
+    """
+    import io
+
+    import numpy as np
+    from matplotlib.colors import to_rgb
+
+    fig.set_dpi(dpi)
+    box = fig.get_tightbbox(fig.canvas.get_renderer()).padded(pad_inches)
+    keep = fig.axes[layer] if layer < len(fig.axes) else None
+    for ax in fig.axes:
+        ax.set_visible(ax is keep)
+    for text in fig.texts:
+        text.set_visible(keep is None)
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format='rgba', dpi=dpi, bbox_inches=box, facecolor='none')
+    # The Agg canvas truncates the box's size in pixels
+    width, height = int(box.width * dpi), int(box.height * dpi)
+    rgba = np.frombuffer(buffer.getbuffer(), dtype=np.uint8).reshape(height, width, 4)
+
+    pixels, origin = None, (0, 0)
+    visible = rgba[..., 3] > 0
+    rows, cols = np.flatnonzero(visible.any(axis=1)), np.flatnonzero(visible.any(axis=0))
+    if len(rows):
+        origin = (int(rows[0]), int(cols[0]))
+        pixels = rgba[rows[0]:rows[-1] + 1, cols[0]:cols[-1] + 1].copy()
+    return {
+        'size': (rgba.shape[1], rgba.shape[0]),
+        'background': tuple(round(c * 255) for c in to_rgb(facecolor)),
+        'pixels': pixels,
+        'origin': origin,
+    }
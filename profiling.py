@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+PROFILING - Per-stage timing, allocation peaks and cProfile dumps
+
+Pipeline stages are wrapped in spans:
+
+    from profiling import span
+
+    with span('parse'):
+        before, after = load_captures(args.dumps)
+
+While profiling is off (the default) span() hands back one shared no-op
+context manager, so an instrumented stage costs a global lookup and a
+call. With profiling on, every span records its wall time and, with
+`memory=True`, its tracemalloc peak above the allocations live when it
+started. Spans nest; the report indents children under their parent.
+
+One stage can also be run under cProfile and dumped as a pstats file:
+
+    python3 ram_analysis.py --profile --profile-stage render
+    python3 -m pstats render.pstats
+
+The analysis scripts take --profile, --profile-memory, --profile-stage
+and --profile-out (add_profile_arguments / profiling_from_args).
+"""
+
+import contextlib
+import cProfile
+import sys
+import time
+import tracemalloc
+
+_NULL_SPAN = contextlib.nullcontext()
+_active = None
+
+
+def span(name):
+    """Context manager timing one pipeline stage (a no-op unless profiling)."""
+    if _active is None:
+        return _NULL_SPAN
+    return _Span(_active, name)
+
+
+class _Span:
+    __slots__ = ('profiler', 'name', 'path', 'start', 'mem_start', 'outer_peak', 'child_peak', 'cprofile')
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        profiler = self.profiler
+        profiler._stack.append(self)
+        # List parents before their children: claim the row on the way in
+        self.path = tuple(span.name for span in profiler._stack)
+        if self.path not in profiler.stages:
+            profiler.stages[self.path] = [0, 0.0, None]
+        if profiler.memory:
+            # tracemalloc has a single peak counter: remember the enclosing
+            # span's peak so far, then restart the count for this span
+            self.mem_start, self.outer_peak = tracemalloc.get_traced_memory()
+            self.child_peak = 0
+            tracemalloc.reset_peak()
+        self.cprofile = None
+        if self.name == profiler.profile_stage and profiler._cprofile_depth == 0:
+            self.cprofile = profiler._cprofile
+            profiler._cprofile_depth += 1
+            self.cprofile.enable()
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        elapsed = time.perf_counter() - self.start
+        profiler = self.profiler
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            profiler._cprofile_depth -= 1
+            profiler._cprofiled = True
+        stack = profiler._stack
+        peak = None
+        if profiler.memory:
+            absolute_peak = max(tracemalloc.get_traced_memory()[1], self.child_peak)
+            peak = absolute_peak - self.mem_start
+            if len(stack) > 1:
+                parent = stack[-2]
+                parent.child_peak = max(parent.child_peak, self.outer_peak, absolute_peak)
+        stage = profiler.stages[self.path]
+        stage[0] += 1
+        stage[1] += elapsed
+        if peak is not None and (stage[2] is None or peak > stage[2]):
+            stage[2] = peak
+        stack.pop()
+        return False
+
+
+class Profiler:
+    """Collects span timings (and tracemalloc peaks) for one run."""
+
+    def __init__(self, memory=False, profile_stage=None, profile_path=None):
+        self.memory = memory
+        self.profile_stage = profile_stage
+        self.profile_path = profile_path or (f'{profile_stage}.pstats' if profile_stage else None)
+        self.stages = {}            # path tuple -> [calls, seconds, peak bytes or None]
+        self._stack = []            # open _Spans, outermost first
+        self._cprofile = cProfile.Profile() if profile_stage else None
+        self._cprofile_depth = 0
+        self._cprofiled = False
+        self._started_tracemalloc = False
+        self.start = None
+        self.elapsed = None
+
+    def __enter__(self):
+        global _active
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+        self.start = time.perf_counter()
+        _active = self
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        _active = None
+        self.elapsed = time.perf_counter() - self.start
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+        if self._cprofiled:
+            self._cprofile.dump_stats(self.profile_path)
+        return False
+
+    def report(self, file=None):
+        """Print the per-stage table (stdout by default)."""
+        file = file or sys.stdout
+        total = self.elapsed if self.elapsed is not None else time.perf_counter() - self.start
+        print("="*80, file=file)
+        print("⏱️  PROFILE", file=file)
+        print("="*80, file=file)
+        header = f"  {'Stage':<34} {'Calls':>6} {'Time':>12} {'Share':>7}"
+        print(header + (f" {'Peak alloc':>12}" if self.memory else ''), file=file)
+        for path, (calls, seconds, peak) in self.stages.items():
+            name = '  ' * (len(path) - 1) + path[-1]
+            line = f"  {name:<34} {calls:>6} {seconds * 1000:>9,.1f} ms {seconds / total:>6.1%}"
+            if self.memory:
+                line += f" {peak / 1024 / 1024:>9,.1f} MB"
+            print(line, file=file)
+        print(f"  {'Whole run':<34} {'':>6} {total * 1000:>9,.1f} ms", file=file)
+        if self.memory:
+            print("  (timings include tracemalloc overhead)", file=file)
+        if self._cprofiled:
+            print(f"  cProfile of '{self.profile_stage}' saved to {self.profile_path} "
+                  f"(python3 -m pstats {self.profile_path})", file=file)
+        elif self.profile_stage:
+            print(f"  ⚠️  no stage named '{self.profile_stage}' ran; nothing to profile", file=file)
+
+
+def add_profile_arguments(parser):
+    """--profile / --profile-memory / --profile-stage / --profile-out."""
+    group = parser.add_argument_group('profiling')
+    group.add_argument('--profile', action='store_true',
+                       help='print per-stage timings at the end of the run')
+    group.add_argument('--profile-memory', action='store_true',
+                       help='also record tracemalloc peaks per stage (slower)')
+    group.add_argument('--profile-stage', metavar='STAGE',
+                       help='run STAGE under cProfile and dump a pstats file')
+    group.add_argument('--profile-out', metavar='PATH',
+                       help='pstats file for --profile-stage (default: STAGE.pstats)')
+
+
+@contextlib.contextmanager
+def profiling_from_args(args, file=None):
+    """Profile the enclosed run as the --profile* flags ask; report at the end."""
+    if not (args.profile or args.profile_memory or args.profile_stage):
+        yield None
+        return
+    profiler = Profiler(memory=args.profile_memory, profile_stage=args.profile_stage,
+                        profile_path=args.profile_out)
+    with profiler:
+        yield profiler
+    profiler.report(file)
@@ -0,0 +1,412 @@
+#!/usr/bin/env python3
+"""
+PS PARSER - Columnar process table from `ps -A` output
+
+Rows of
+
+    ps -A                                  USER PID PPID VSZ RSS WCHAN ADDR S NAME
+    ps -A -o PID,PPID,UID,RSS,NAME         any columns, found by their header
+
+become five parallel `array` columns (pid, ppid, uid, rss_kb, name_id),
+with process names interned into one table. Android user names (`root`,
+`system`, `u0_a123`, ...) are turned into numeric UIDs.
+
+On top of the columns:
+    children() / descendants()   parent -> children index (ppid-sorted row order)
+    by_uid() / by_package()      process count and RSS per UID / package (np.bincount)
+    by_label()                   the same per vendor (bloat_classifier.py), each
+                                 distinct name classified once
+    diff_process_tables()        what stopped/started and the RSS freed per package
+
+so "how much RSS did Knox processes hold" is one mask and one sum over
+the rss_kb column rather than a loop over dicts.
+
+Usage:
+    python3 ps_parser.py PS_DUMP [--top N]                # one table
+    python3 ps_parser.py BEFORE AFTER [--top N]           # diff; dumps or capture folders
+"""
+
+import argparse
+import os
+import sys
+from array import array
+
+import numpy as np
+
+from bloat_classifier import BloatClassifier, process_package
+
+# Header names of the process name column; without one, the last column is the name
+_NAME_COLUMNS = ('NAME', 'CMD', 'ARGS', 'COMM', 'CMDLINE')
+_RSS_UNITS = {'K': 1, 'M': 1024, 'G': 1024 * 1024}
+
+# Shared by every table that is not handed its own classifier, so its
+# per-name memo carries over from one table (and one call) to the next
+DEFAULT_CLASSIFIER = BloatClassifier()
+
+# android_filesystem_config.h: user names `ps` prints for fixed UIDs
+ANDROID_IDS = {
+    'root': 0, 'system': 1000, 'radio': 1001, 'bluetooth': 1002, 'graphics': 1003,
+    'input': 1004, 'audio': 1005, 'camera': 1006, 'log': 1007, 'compass': 1008,
+    'mount': 1009, 'wifi': 1010, 'adb': 1011, 'install': 1012, 'media': 1013,
+    'dhcp': 1014, 'sdcard_rw': 1015, 'vpn': 1016, 'keystore': 1017, 'usb': 1018,
+    'drm': 1019, 'mdnsr': 1020, 'gps': 1021, 'media_rw': 1023, 'mtp': 1024,
+    'nfc': 1027, 'sdcard_r': 1028, 'clat': 1029, 'mediadrm': 1031, 'shared_relro': 1037,
+    'dbus': 1038, 'audioserver': 1041, 'metrics_coll': 1042, 'metricsd': 1043,
+    'webserv': 1044, 'debuggerd': 1045, 'mediacodec': 1046, 'cameraserver': 1047,
+    'firewall': 1048, 'trunks': 1049, 'nvram': 1050, 'dns': 1051, 'dns_tether': 1052,
+    'webview_zygote': 1053, 'vehicle_network': 1054, 'media_audio': 1055,
+    'media_video': 1056, 'media_image': 1057, 'tombstoned': 1058, 'media_obb': 1059,
+    'ese': 1060, 'ota_update': 1061, 'automotive_evs': 1062, 'lowpan': 1063,
+    'hsm': 1064, 'reserved_disk': 1065, 'statsd': 1066, 'incidentd': 1067,
+    'secure_element': 1068, 'lmkd': 1069, 'llkd': 1070, 'iorapd': 1071,
+    'gpu_service': 1072, 'network_stack': 1073, 'gsid': 1074, 'fsverity_cert': 1075,
+    'credstore': 1076, 'external_storage': 1077, 'ext_data_rw': 1078, 'ext_obb_rw': 1079,
+    'context_hub': 1080, 'virtualizationservice': 1081, 'artd': 1082, 'uwb': 1083,
+    'thread_network': 1084, 'diced': 1085, 'dmesgd': 1086, 'jc_weaver': 1087,
+    'jc_strongbox': 1088, 'jc_identitycred': 1089, 'sdk_sandbox': 1090, 'security_log_writer': 1091,
+    'prng_seeder': 1092, 'shell': 2000, 'cache': 2001, 'diag': 2002,
+    'net_bt_admin': 3001, 'net_bt': 3002, 'inet': 3003, 'net_raw': 3004, 'net_admin': 3005,
+    'net_bw_stats': 3006, 'net_bw_acct': 3007, 'readproc': 3009, 'wakelock': 3010,
+    'uhid': 3011, 'readtracefs': 3012, 'everybody': 9997, 'misc': 9998, 'nobody': 9999,
+}
+_PER_USER_RANGE = 100_000
+_APP_START = 10_000
+_ISOLATED_START = 99_000
+_SDK_SANDBOX_START = 20_000
+_UNKNOWN_UID = -1
+_UIDS = {}
+
+
+def uid_of(user):
+    """'u0_a123' -> 10123, 'system' -> 1000, '10123' -> 10123; -1 if unknown (memoised)."""
+    uid = _UIDS.get(user)
+    if uid is None:
+        uid = _UIDS[user] = _parse_uid(user)
+    return uid
+
+
+def _parse_uid(user):
+    if user.isdigit():
+        return int(user)
+    if user in ANDROID_IDS:
+        return ANDROID_IDS[user]
+    # u<user>_a<n> (app), u<user>_i<n> (isolated), u<user>_s<n> (SDK sandbox), u<user>_<aid name>
+    if user.startswith('u') and '_' in user:
+        prefix, _, rest = user[1:].partition('_')
+        if prefix.isdigit():
+            base = int(prefix) * _PER_USER_RANGE
+            kind, number = rest[:1], rest[1:]
+            if number.isdigit():
+                if kind == 'a':
+                    return base + _APP_START + int(number)
+                if kind == 'i':
+                    return base + _ISOLATED_START + int(number)
+                if kind == 's':
+                    return base + _SDK_SANDBOX_START + int(number)
+            if rest in ANDROID_IDS:
+                return base + ANDROID_IDS[rest]
+    return _UNKNOWN_UID
+
+
+def _rss_kb(value):
+    """RSS in KB from a human-readable toybox value (1.5M, 2G)."""
+    unit = _RSS_UNITS.get(value[-1:].upper())
+    return int(float(value[:-1]) * unit) if unit else int(value)
+
+
+class ProcessTable:
+    """Parallel pid/ppid/uid/rss_kb/name_id columns with an interned name table."""
+
+    def __init__(self):
+        self.pid = array('i')
+        self.ppid = array('i')
+        self.uid = array('i')
+        self.rss_kb = array('q')
+        self.name_id = array('i')
+        self.names = []
+        self._name_ids = {}
+        self._children = None           # (ppid in sorted order, row order), built on first use
+
+    def __len__(self):
+        return len(self.pid)
+
+    def append(self, pid, ppid, uid, rss_kb, name):
+        name_id = self._name_ids.get(name)
+        if name_id is None:
+            name_id = self._name_ids[name] = len(self.names)
+            self.names.append(name)
+        self.pid.append(pid)
+        self.ppid.append(ppid)
+        self.uid.append(uid)
+        self.rss_kb.append(rss_kb)
+        self.name_id.append(name_id)
+        self._children = None
+
+    def columns(self):
+        """Zero-copy NumPy views of the five columns."""
+        return (np.frombuffer(self.pid, dtype=np.int32),
+                np.frombuffer(self.ppid, dtype=np.int32),
+                np.frombuffer(self.uid, dtype=np.int32),
+                np.frombuffer(self.rss_kb, dtype=np.int64),
+                np.frombuffer(self.name_id, dtype=np.int32))
+
+    # ------------------------------------------------------------------------
+    # Parent -> children
+    # ------------------------------------------------------------------------
+    def _child_index(self):
+        if self._children is None:
+            ppid = self.columns()[1]
+            order = np.argsort(ppid, kind='stable')
+            self._children = (ppid[order], order)
+        return self._children
+
+    def children(self, pid):
+        """Rows whose parent is `pid`, in table order."""
+        sorted_ppid, order = self._child_index()
+        lo, hi = np.searchsorted(sorted_ppid, [pid, pid + 1])
+        return order[lo:hi]
+
+    def descendants(self, pid):
+        """Rows of every process below `pid`, one vectorised step per tree level."""
+        pids, ppid = self.columns()[:2]
+        seen = np.zeros(len(self), dtype=bool)
+        frontier = np.array([pid], dtype=np.int32)
+        while len(frontier):
+            # pid 0 is its own parent in some dumps; `seen` stops such loops
+            rows = np.flatnonzero(np.isin(ppid, frontier) & ~seen)
+            seen[rows] = True
+            frontier = pids[rows]
+        return np.flatnonzero(seen)
+
+    # ------------------------------------------------------------------------
+    # Rollups
+    # ------------------------------------------------------------------------
+    def _rollup(self, keys, n_keys):
+        """Process count and summed RSS per key id, as two int64 arrays."""
+        rss_kb = self.columns()[3]
+        counts = np.bincount(keys, minlength=n_keys)
+        totals = np.bincount(keys, weights=rss_kb, minlength=n_keys).astype(np.int64)
+        return counts, totals
+
+    def by_uid(self):
+        """(uids, process counts, RSS KB) per distinct UID, largest RSS first."""
+        uids, keys = np.unique(self.columns()[2], return_inverse=True)
+        counts, rss_kb = self._rollup(keys, len(uids))
+        order = np.argsort(-rss_kb, kind='stable')
+        return uids[order], counts[order], rss_kb[order]
+
+    def package_ids(self):
+        """(package names, package id per row): `com.foo:remote` rolls up into `com.foo`."""
+        packages, ids = [], {}
+        name_package = np.empty(len(self.names), dtype=np.int32)
+        for i, name in enumerate(self.names):
+            package = process_package(name)
+            package_id = ids.get(package)
+            if package_id is None:
+                package_id = ids[package] = len(packages)
+                packages.append(package)
+            name_package[i] = package_id
+        return packages, name_package[self.columns()[4]]
+
+    def by_package(self):
+        """[(package, processes, RSS KB)] for every package, largest RSS first."""
+        packages, keys = self.package_ids()
+        counts, rss_kb = self._rollup(keys, len(packages))
+        order = np.argsort(-rss_kb, kind='stable')
+        return [(packages[i], int(counts[i]), int(rss_kb[i])) for i in order]
+
+    def label_ids(self, classifier=None):
+        """(labels, label id per row); each distinct name is classified once."""
+        classifier = DEFAULT_CLASSIFIER if classifier is None else classifier
+        labels, ids = [], {}
+        name_label = np.empty(len(self.names), dtype=np.int32)
+        for i, label in enumerate(classifier.classify_all(self.names)):
+            label_id = ids.get(label)
+            if label_id is None:
+                label_id = ids[label] = len(labels)
+                labels.append(label)
+            name_label[i] = label_id
+        return labels, name_label[self.columns()[4]]
+
+    def label_mask(self, label, classifier=None):
+        """Boolean row mask of the processes with a vendor label."""
+        labels, keys = self.label_ids(classifier)
+        if label not in labels:
+            return np.zeros(len(self), dtype=bool)
+        return keys == labels.index(label)
+
+    def by_label(self, classifier=None):
+        """{vendor label: (processes, RSS KB)}, largest RSS first."""
+        labels, keys = self.label_ids(classifier)
+        counts, rss_kb = self._rollup(keys, len(labels))
+        order = np.argsort(-rss_kb, kind='stable')
+        return {labels[i]: (int(counts[i]), int(rss_kb[i])) for i in order}
+
+
+def parse_ps(lines, table=None):
+    """Parse `ps -A [-o ...]` lines into a ProcessTable.
+
+    Columns are located by the header line; rows before it, and rows
+    that do not parse, are skipped. Without a PPID or RSS column those
+    come out as -1 and 0.
+    """
+    table = table if table is not None else ProcessTable()
+    lines = iter(lines)
+    for line in lines:
+        header = line.split()
+        if 'PID' in header:
+            break
+    else:
+        return table
+
+    pid_col = header.index('PID')
+    ppid_col = header.index('PPID') if 'PPID' in header else None
+    rss_col = header.index('RSS') if 'RSS' in header else None
+    user_col = next((header.index(col) for col in ('UID', 'USER') if col in header), None)
+    name_col = next((i for i, col in enumerate(header) if col in _NAME_COLUMNS), len(header) - 1)
+    # The name column comes last and may hold spaces (CMD/ARGS): split it off whole
+    splits = len(header) - 1
+
+    # ProcessTable.append() inlined: this loop runs once per process of a fleet
+    pids, ppids, uids, rss, name_ids = (column.append for column in (
+        table.pid, table.ppid, table.uid, table.rss_kb, table.name_id))
+    names, ids = table.names, table._name_ids
+    for line in lines:
+        fields = line.split(None, splits)
+        if len(fields) <= name_col:
+            continue
+        try:
+            pid = int(fields[pid_col])
+            ppid = int(fields[ppid_col]) if ppid_col is not None else -1
+            if rss_col is None:
+                rss_kb = 0
+            else:
+                value = fields[rss_col]
+                rss_kb = int(value) if value.isdigit() else _rss_kb(value)
+        except ValueError:
+            continue
+        name = fields[name_col].rstrip()
+        name_id = ids.get(name)
+        if name_id is None:
+            name_id = ids[name] = len(names)
+            names.append(name)
+        pids(pid)
+        ppids(ppid)
+        uids(uid_of(fields[user_col]) if user_col is not None else _UNKNOWN_UID)
+        rss(rss_kb)
+        name_ids(name_id)
+    table._children = None
+    return table
+
+
+def load_process_table(path):
+    """Process table from a `ps -A` dump or a capture folder's ps.txt."""
+    if os.path.isdir(path):
+        path = os.path.join(path, 'ps.txt')
+    with open(path, 'r', encoding='utf-8', errors='replace') as f:
+        return parse_ps(f)
+
+
+def _shared_keys(names, index, name_ids):
+    """Per-row ids into a name table shared by two tables (index: name -> id)."""
+    shared = np.array([index.setdefault(name, len(index)) for name in names], dtype=np.int64)
+    return shared[name_ids]
+
+
+def diff_process_tables(before, after, classifier=None):
+    """Stopped/started process names, and counts and RSS per package and vendor.
+
+    Processes are matched by name (PIDs do not survive a reboot); a name
+    counts as stopped when none of its processes is left.
+    """
+    classifier = DEFAULT_CLASSIFIER if classifier is None else classifier
+    names = {}
+    keys_before = _shared_keys(before.names, names, before.columns()[4])
+    keys_after = _shared_keys(after.names, names, after.columns()[4])
+    counts_before, _ = before._rollup(keys_before, len(names))
+    counts_after, _ = after._rollup(keys_after, len(names))
+    name_list = list(names)
+    stopped = sorted(name_list[i] for i in np.flatnonzero((counts_before > 0) & (counts_after == 0)))
+    started = sorted(name_list[i] for i in np.flatnonzero((counts_after > 0) & (counts_before == 0)))
+
+    packages = {}
+    package_names, package_keys = before.package_ids()
+    keys_before = _shared_keys(package_names, packages, package_keys)
+    package_names, package_keys = after.package_ids()
+    keys_after = _shared_keys(package_names, packages, package_keys)
+    counts_before, rss_before = before._rollup(keys_before, len(packages))
+    counts_after, rss_after = after._rollup(keys_after, len(packages))
+    package_list = list(packages)
+    freed = rss_before - rss_after
+    changed = np.flatnonzero((counts_before != counts_after) | (freed != 0))
+    by_package = [
+        {'package': package_list[i], 'before': int(counts_before[i]), 'after': int(counts_after[i]),
+         'rss_freed_kb': int(freed[i])}
+        for i in changed[np.argsort(-freed[changed], kind='stable')]
+    ]
+
+    labels_before, labels_after = before.by_label(classifier), after.by_label(classifier)
+    by_label = {}
+    for label in labels_before.keys() | labels_after.keys():
+        count_before, label_rss_before = labels_before.get(label, (0, 0))
+        count_after, label_rss_after = labels_after.get(label, (0, 0))
+        by_label[label] = {'before': count_before, 'after': count_after,
+                           'rss_freed_kb': label_rss_before - label_rss_after}
+
+    total_before, total_after = int(rss_before.sum()), int(rss_after.sum())
+    return {
+        'processes': {'before': len(before), 'after': len(after), 'killed': len(before) - len(after)},
+        'rss_kb': {'before': total_before, 'after': total_after, 'freed': total_before - total_after},
+        'stopped': stopped,
+        'started': started,
+        'by_package': by_package,
+        'by_label': dict(sorted(by_label.items(), key=lambda item: (-item[1]['rss_freed_kb'], item[0]))),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Process table rollups from `ps -A` output.')
+    parser.add_argument('dumps', nargs='+', metavar='PS_DUMP', help='one dump, or BEFORE AFTER')
+    parser.add_argument('--top', type=int, default=10, help='packages to list (default: 10)')
+    args = parser.parse_args(argv)
+    if len(args.dumps) > 2:
+        parser.error('give one dump, or BEFORE and AFTER')
+
+    tables = [load_process_table(path) for path in args.dumps]
+    if len(tables) == 1:
+        (table,) = tables
+        print("="*80)
+        print(f"⚙️  PROCESS TABLE: {len(table):,} processes, {len(table.names):,} names, "
+              f"{int(table.columns()[3].sum()) / 1024:,.1f} MB RSS")
+        print("="*80)
+        print(f"  Top {args.top} packages by RSS:")
+        for package, count, rss_kb in table.by_package()[:args.top]:
+            print(f"    {rss_kb / 1024:>9,.1f} MB  {count:>4}  {package}")
+        print()
+        print("  By vendor:")
+        for label, (count, rss_kb) in table.by_label().items():
+            print(f"    {rss_kb / 1024:>9,.1f} MB  {count:>4}  {label}")
+        return 0
+
+    diff = diff_process_tables(*tables)
+    processes, rss = diff['processes'], diff['rss_kb']
+    print("="*80)
+    print("⚙️  PROCESS DIFF")
+    print("="*80)
+    print(f"  Processes: {processes['before']:,} → {processes['after']:,} ({processes['killed']:+,} killed)")
+    print(f"  RSS:       {rss['before'] / 1024:,.1f} MB → {rss['after'] / 1024:,.1f} MB "
+          f"({rss['freed'] / 1024:,.1f} MB freed)")
+    print(f"  Stopped:   {len(diff['stopped']):,}    Started: {len(diff['started']):,}")
+    print()
+    print("  By vendor (RSS freed):")
+    for label, row in diff['by_label'].items():
+        print(f"    {row['rss_freed_kb'] / 1024:>9,.1f} MB  {row['before']:>4} → {row['after']:<4}  {label}")
+    print()
+    print(f"  Top {args.top} packages by RSS freed:")
+    for row in diff['by_package'][:args.top]:
+        print(f"    {row['rss_freed_kb'] / 1024:>9,.1f} MB  {row['before']:>4} → {row['after']:<4}  {row['package']}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
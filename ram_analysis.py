@@ -1,271 +1,393 @@
 #!/usr/bin/env python3
 """
 RAM USAGE ANALYSIS - Before vs After Debloat
-"""
-
-import matplotlib.pyplot as plt
-import numpy as np
 
-print("="*80)
-print("🧠 RAM ANALYSIS: BEFORE vs AFTER DEBLOAT 🧠")
-print("="*80)
-print()
+Usage:
+    python3 ram_analysis.py                          # recorded Oct 19 scans
+    python3 ram_analysis.py before.txt after.txt     # raw `dumpsys meminfo` dumps
+    python3 ram_analysis.py --text                   # report only, no figure
+    python3 ram_analysis.py --json                   # machine-readable results only
+    python3 ram_analysis.py --profile                # per-stage timings (profiling.py)
 
-# Total phone RAM
-total_ram_kb = 11_381_328
-total_ram_gb = total_ram_kb / (1024 * 1024)
+Importing this module has no side effects; the report runs from main().
+matplotlib is only imported when the figure is rendered; unchanged figures
+come from the render cache (render_cache.py, --no-cache to bypass).
+"""
 
-# ============================================================================
-# BEFORE DEBLOAT (from original scan)
-# ============================================================================
-before = {
-    'total_ram_gb': total_ram_gb,
-    'free_ram_kb': 7_536_353,
-    'used_ram_kb': 7_703_762,
-    'cached_pss_kb': 5_551_529,
-    'cached_kernel_kb': 1_479_220,
-    'free_memory_kb': 505_604,
-    'used_pss_kb': 5_918_286,
-    'kernel_kb': 1_785_476,
-    'zram_physical_kb': 1_903_328,
-    'zram_swap_kb': 6_691_904,
-}
+import argparse
+import json
+import sys
+from operator import itemgetter
 
-# ============================================================================
-# AFTER DEBLOAT (current scan)
-# ============================================================================
-after = {
-    'total_ram_gb': total_ram_gb,
-    'free_ram_kb': 6_271_006,
-    'used_ram_kb': 6_922_562,
-    'cached_pss_kb': 3_129_070,
-    'cached_kernel_kb': 2_089_036,
-    'free_memory_kb': 1_052_900,
-    'used_pss_kb': 5_338_846,
-    'kernel_kb': 1_583_716,
-    'zram_physical_kb': 1_036_944,
-    'zram_swap_kb': 3_704_116,
-}
-
-# Calculate improvements
-improvements = {
-    'ram_freed_kb': before['used_ram_kb'] - after['used_ram_kb'],
-    'ram_freed_mb': (before['used_ram_kb'] - after['used_ram_kb']) / 1024,
-    'ram_freed_gb': (before['used_ram_kb'] - after['used_ram_kb']) / (1024 * 1024),
-    'pss_freed_kb': before['used_pss_kb'] - after['used_pss_kb'],
-    'pss_freed_mb': (before['used_pss_kb'] - after['used_pss_kb']) / 1024,
-    'zram_freed_kb': before['zram_physical_kb'] - after['zram_physical_kb'],
-    'zram_freed_mb': (before['zram_physical_kb'] - after['zram_physical_kb']) / 1024,
-    'swap_freed_kb': before['zram_swap_kb'] - after['zram_swap_kb'],
-    'swap_freed_gb': (before['zram_swap_kb'] - after['zram_swap_kb']) / (1024 * 1024),
-}
-
-print(f"📱 TOTAL RAM: {total_ram_gb:.1f} GB")
-print()
-
-print("📊 MEMORY USAGE COMPARISON:")
-print("="*80)
-print()
-
-print("USED RAM (Active Memory):")
-print(f"  Before: {before['used_ram_kb']/1024/1024:.2f} GB ({before['used_ram_kb']:,} KB)")
-print(f"  After:  {after['used_ram_kb']/1024/1024:.2f} GB ({after['used_ram_kb']:,} KB)")
-print(f"  🎉 FREED: {improvements['ram_freed_mb']:.1f} MB ({improvements['ram_freed_kb']:,} KB)")
-print(f"  📉 Reduction: {improvements['ram_freed_kb']/before['used_ram_kb']*100:.1f}%")
-print()
-
-print("APP MEMORY (PSS - Actual App Usage):")
-print(f"  Before: {before['used_pss_kb']/1024/1024:.2f} GB ({before['used_pss_kb']:,} KB)")
-print(f"  After:  {after['used_pss_kb']/1024/1024:.2f} GB ({after['used_pss_kb']:,} KB)")
-print(f"  🚀 FREED: {improvements['pss_freed_mb']:.1f} MB ({improvements['pss_freed_kb']:,} KB)")
-print(f"  📉 Reduction: {improvements['pss_freed_kb']/before['used_pss_kb']*100:.1f}%")
-print()
-
-print("COMPRESSED MEMORY (ZRAM Physical):")
-print(f"  Before: {before['zram_physical_kb']/1024:.1f} MB ({before['zram_physical_kb']:,} KB)")
-print(f"  After:  {after['zram_physical_kb']/1024:.1f} MB ({after['zram_physical_kb']:,} KB)")
-print(f"  💪 FREED: {improvements['zram_freed_mb']:.1f} MB ({improvements['zram_freed_kb']:,} KB)")
-print(f"  📉 Reduction: {improvements['zram_freed_kb']/before['zram_physical_kb']*100:.1f}%")
-print()
-
-print("SWAP USAGE (Data compressed to ZRAM):")
-print(f"  Before: {before['zram_swap_kb']/1024/1024:.2f} GB ({before['zram_swap_kb']:,} KB)")
-print(f"  After:  {after['zram_swap_kb']/1024/1024:.2f} GB ({after['zram_swap_kb']:,} KB)")
-print(f"  🔥 FREED: {improvements['swap_freed_gb']:.2f} GB ({improvements['swap_freed_kb']:,} KB)")
-print(f"  📉 Reduction: {improvements['swap_freed_kb']/before['zram_swap_kb']*100:.1f}%")
-print()
-
-print("AVAILABLE MEMORY (What apps can use):")
-print(f"  Before: {before['free_ram_kb']/1024/1024:.2f} GB ({before['free_ram_kb']:,} KB)")
-print(f"  After:  {after['free_ram_kb']/1024/1024:.2f} GB ({after['free_ram_kb']:,} KB)")
-print()
-
-print("="*80)
-print()
+from meminfo_parser import MEMINFO_KEYS, missing_lines, parse_meminfo_file
+from memory_hogs import TopK, freed_by_package, summarize_freed
+from plotting import pyplot, save_figure
+from profiling import add_profile_arguments, profiling_from_args, span
+from recorded_captures import RECORDED_CAPTURES
+from render_cache import render_cached
 
 # ============================================================================
-# IDENTIFY REMOVED MEMORY HOGS
+# KNOWN MEMORY HOGS (from the original scan)
 # ============================================================================
-print("🗑️  MEMORY HOGS ELIMINATED:")
-print("="*80)
-
-removed_hogs = [
-    ("Google Search (googlequicksearchbox)", "190,672K", "Removed!"),
-    ("Google Learning Services", "167,684K", "Removed!"),
-    ("Samsung Dress Room", "578,760K", "Likely removed!"),
-    ("Samsung Smart Suggestions", "204,508K", "Likely removed!"),
-    ("Samsung Video Scan", "132,924K", "Likely removed!"),
+REMOVED_HOGS = [
+    ("Google Search (googlequicksearchbox)", 190_672, "Removed!"),
+    ("Google Learning Services", 167_684, "Removed!"),
+    ("Samsung Dress Room", 578_760, "Likely removed!"),
+    ("Samsung Smart Suggestions", 204_508, "Likely removed!"),
+    ("Samsung Video Scan", 132_924, "Likely removed!"),
 ]
 
-total_hogs_freed = 0
-for app, mem, status in removed_hogs:
-    mem_val = int(mem.replace(",", "").replace("K", ""))
-    total_hogs_freed += mem_val
-    print(f"  ❌ {app}: {mem} {status}")
-
-print()
-print(f"💡 Estimated from removed hogs: ~{total_hogs_freed/1024:.1f} MB freed")
-print()
-
-# ============================================================================
-# CREATE VISUALIZATIONS
-# ============================================================================
-print("🎨 Creating RAM comparison visualizations...")
-
-fig = plt.figure(figsize=(18, 10))
-gs = fig.add_gridspec(2, 3, hspace=0.35, wspace=0.3)
+HOG_COUNT = 5
 
-fig.suptitle('🧠 RAM ANALYSIS: DEBLOAT SUCCESS 🧠\nMemory Usage Before vs After',
-             fontsize=20, fontweight='bold')
+# Capture keys the report reads
+RAM_KEYS = ('total_ram_kb',) + tuple(key for key in MEMINFO_KEYS if key.endswith('_kb'))
 
-# ============================================================================
-# 1. TOTAL USED RAM COMPARISON
-# ============================================================================
-ax1 = fig.add_subplot(gs[0, 0])
-categories = ['Before\nDebloat', 'After\nDebloat']
-ram_used_gb = [before['used_ram_kb']/1024/1024, after['used_ram_kb']/1024/1024]
-colors = ['#ff6b6b', '#51cf66']
-
-bars = ax1.bar(categories, ram_used_gb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
-ax1.set_ylabel('RAM Used (GB)', fontweight='bold', fontsize=12)
-ax1.set_title(f'📊 TOTAL RAM USAGE\n-{improvements["ram_freed_mb"]:.0f}MB Freed!',
-             fontweight='bold', fontsize=14, pad=15)
-ax1.set_ylim(0, 12)
-ax1.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, ram_used_gb):
-    height = bar.get_height()
-    ax1.text(bar.get_x() + bar.get_width()/2., height,
-            f'{val:.2f} GB', ha='center', va='bottom',
-            fontweight='bold', fontsize=12)
-
-# ============================================================================
-# 2. APP MEMORY (PSS) COMPARISON
-# ============================================================================
-ax2 = fig.add_subplot(gs[0, 1])
-pss_gb = [before['used_pss_kb']/1024/1024, after['used_pss_kb']/1024/1024]
-bars = ax2.bar(categories, pss_gb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
-ax2.set_ylabel('App Memory (GB)', fontweight='bold', fontsize=12)
-ax2.set_title(f'📱 APP MEMORY USAGE\n-{improvements["pss_freed_mb"]:.0f}MB Freed!',
-             fontweight='bold', fontsize=14, pad=15)
-ax2.set_ylim(0, 12)
-ax2.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, pss_gb):
-    height = bar.get_height()
-    ax2.text(bar.get_x() + bar.get_width()/2., height,
-            f'{val:.2f} GB', ha='center', va='bottom',
-            fontweight='bold', fontsize=12)
-
-# ============================================================================
-# 3. ZRAM COMPRESSION COMPARISON
-# ============================================================================
-ax3 = fig.add_subplot(gs[0, 2])
-zram_mb = [before['zram_physical_kb']/1024, after['zram_physical_kb']/1024]
-bars = ax3.bar(categories, zram_mb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
-ax3.set_ylabel('Compressed RAM (MB)', fontweight='bold', fontsize=12)
-ax3.set_title(f'💾 ZRAM COMPRESSION\n-{improvements["zram_freed_mb"]:.0f}MB Freed!',
-             fontweight='bold', fontsize=14, pad=15)
-ax3.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, zram_mb):
-    height = bar.get_height()
-    ax3.text(bar.get_x() + bar.get_width()/2., height,
-            f'{val:.0f} MB', ha='center', va='bottom',
-            fontweight='bold', fontsize=12)
 
 # ============================================================================
-# 4. MEMORY BREAKDOWN PIE - BEFORE
+# DATA
 # ============================================================================
-ax4 = fig.add_subplot(gs[1, 0])
-before_breakdown = [
-    before['used_pss_kb']/1024/1024,
-    before['kernel_kb']/1024/1024,
-    before['cached_pss_kb']/1024/1024,
-    before['free_memory_kb']/1024/1024,
-]
-labels_before = ['Apps', 'Kernel', 'Cached', 'Free']
-colors_pie = ['#ff6b6b', '#ffd93d', '#4ecdc4', '#95e1d3']
+def from_capture(capture):
+    """Before/after dict from a capture_loader.py capture holding RAM_KEYS."""
+    result = {'total_ram_gb': capture['total_ram_kb'] / (1024 * 1024)}
+    result.update((key, capture[key]) for key in RAM_KEYS if key != 'total_ram_kb')
+    return result
+
+
+def recorded_capture(name):
+    """Before/after dict for one of the recorded scans ('before' or 'after')."""
+    return from_capture(RECORDED_CAPTURES[name])
+
+
+def load_captures(argv):
+    """Recorded scans, or two raw meminfo dumps if given on the command line.
+
+    ValueError if a dump lacks one of the summary lines the report needs.
+    """
+    if len(argv) == 2:
+        captures = [parse_meminfo_file(path) for path in argv]
+        for path, capture in zip(argv, captures):
+            missing = missing_lines(capture)
+            if missing:
+                raise ValueError(f"{path}: no {', '.join(map(repr, missing))} line in the dump")
+        return captures
+    return recorded_capture('before'), recorded_capture('after')
+
+
+def compute_improvements(before, after):
+    return {
+        'ram_freed_kb': before['used_ram_kb'] - after['used_ram_kb'],
+        'ram_freed_mb': (before['used_ram_kb'] - after['used_ram_kb']) / 1024,
+        'ram_freed_gb': (before['used_ram_kb'] - after['used_ram_kb']) / (1024 * 1024),
+        'pss_freed_kb': before['used_pss_kb'] - after['used_pss_kb'],
+        'pss_freed_mb': (before['used_pss_kb'] - after['used_pss_kb']) / 1024,
+        'zram_freed_kb': before['zram_physical_kb'] - after['zram_physical_kb'],
+        'zram_freed_mb': (before['zram_physical_kb'] - after['zram_physical_kb']) / 1024,
+        'swap_freed_kb': before['zram_swap_kb'] - after['zram_swap_kb'],
+        'swap_freed_gb': (before['zram_swap_kb'] - after['zram_swap_kb']) / (1024 * 1024),
+    }
+
+
+def hogs_freed_kb(hogs=REMOVED_HOGS):
+    """Total KB of a (name, kb, status) hog list."""
+    return sum(kb for _, kb, _ in hogs)
+
+
+def measured_hogs(before, after, k=HOG_COUNT):
+    """(name, kb, status) for the k packages that freed the most PSS, from
+    the per-process tables of two parsed dumps, plus the freed summary."""
+    rows = freed_by_package(before['processes'], after['processes'])
+    hogs = [(row['package'], row['pss_freed_kb'], 'Removed!' if row['status'] == 'removed' else 'Shrunk')
+            for row in TopK(k, itemgetter('pss_freed_kb')).extend(rows).items()
+            if row['pss_freed_kb'] > 0]
+    return hogs, summarize_freed(rows)
 
-wedges, texts, autotexts = ax4.pie(before_breakdown, labels=labels_before, colors=colors_pie,
-                                     autopct='%1.1f%%', startangle=90,
-                                     textprops={'fontweight': 'bold', 'fontsize': 10})
-for autotext in autotexts:
-    autotext.set_color('white')
-    autotext.set_fontsize(11)
-
-ax4.set_title('BEFORE: Memory Distribution', fontweight='bold', fontsize=13, pad=10)
 
 # ============================================================================
-# 5. MEMORY BREAKDOWN PIE - AFTER
+# TEXT REPORT
 # ============================================================================
-ax5 = fig.add_subplot(gs[1, 1])
-after_breakdown = [
-    after['used_pss_kb']/1024/1024,
-    after['kernel_kb']/1024/1024,
-    after['cached_pss_kb']/1024/1024,
-    after['free_memory_kb']/1024/1024,
-]
-
-wedges, texts, autotexts = ax5.pie(after_breakdown, labels=labels_before, colors=colors_pie,
-                                     autopct='%1.1f%%', startangle=90,
-                                     textprops={'fontweight': 'bold', 'fontsize': 10})
-for autotext in autotexts:
-    autotext.set_color('white')
-    autotext.set_fontsize(11)
+def print_header():
+    print("="*80)
+    print("🧠 RAM ANALYSIS: BEFORE vs AFTER DEBLOAT 🧠")
+    print("="*80)
+    print()
+
+
+def print_report(before, after, improvements):
+    print(f"📱 TOTAL RAM: {after['total_ram_gb']:.1f} GB")
+    print()
+
+    print("📊 MEMORY USAGE COMPARISON:")
+    print("="*80)
+    print()
+
+    print("USED RAM (Active Memory):")
+    print(f"  Before: {before['used_ram_kb']/1024/1024:.2f} GB ({before['used_ram_kb']:,} KB)")
+    print(f"  After:  {after['used_ram_kb']/1024/1024:.2f} GB ({after['used_ram_kb']:,} KB)")
+    print(f"  🎉 FREED: {improvements['ram_freed_mb']:.1f} MB ({improvements['ram_freed_kb']:,} KB)")
+    print(f"  📉 Reduction: {improvements['ram_freed_kb']/before['used_ram_kb']*100:.1f}%")
+    print()
+
+    print("APP MEMORY (PSS - Actual App Usage):")
+    print(f"  Before: {before['used_pss_kb']/1024/1024:.2f} GB ({before['used_pss_kb']:,} KB)")
+    print(f"  After:  {after['used_pss_kb']/1024/1024:.2f} GB ({after['used_pss_kb']:,} KB)")
+    print(f"  🚀 FREED: {improvements['pss_freed_mb']:.1f} MB ({improvements['pss_freed_kb']:,} KB)")
+    print(f"  📉 Reduction: {improvements['pss_freed_kb']/before['used_pss_kb']*100:.1f}%")
+    print()
+
+    print("COMPRESSED MEMORY (ZRAM Physical):")
+    print(f"  Before: {before['zram_physical_kb']/1024:.1f} MB ({before['zram_physical_kb']:,} KB)")
+    print(f"  After:  {after['zram_physical_kb']/1024:.1f} MB ({after['zram_physical_kb']:,} KB)")
+    print(f"  💪 FREED: {improvements['zram_freed_mb']:.1f} MB ({improvements['zram_freed_kb']:,} KB)")
+    print(f"  📉 Reduction: {improvements['zram_freed_kb']/before['zram_physical_kb']*100:.1f}%")
+    print()
+
+    print("SWAP USAGE (Data compressed to ZRAM):")
+    print(f"  Before: {before['zram_swap_kb']/1024/1024:.2f} GB ({before['zram_swap_kb']:,} KB)")
+    print(f"  After:  {after['zram_swap_kb']/1024/1024:.2f} GB ({after['zram_swap_kb']:,} KB)")
+    print(f"  🔥 FREED: {improvements['swap_freed_gb']:.2f} GB ({improvements['swap_freed_kb']:,} KB)")
+    print(f"  📉 Reduction: {improvements['swap_freed_kb']/before['zram_swap_kb']*100:.1f}%")
+    print()
+
+    print("AVAILABLE MEMORY (What apps can use):")
+    print(f"  Before: {before['free_ram_kb']/1024/1024:.2f} GB ({before['free_ram_kb']:,} KB)")
+    print(f"  After:  {after['free_ram_kb']/1024/1024:.2f} GB ({after['free_ram_kb']:,} KB)")
+    print()
+
+    print("="*80)
+    print()
+
+
+def print_hogs(hogs=REMOVED_HOGS, summary=None):
+    print("🗑️  MEMORY HOGS ELIMINATED:")
+    print("="*80)
+
+    for app, kb, status in hogs:
+        print(f"  ❌ {app}: {kb:,}K {status}")
+
+    print()
+    if summary is None:
+        print(f"💡 Estimated from removed hogs: ~{hogs_freed_kb(hogs)/1024:.1f} MB freed")
+    else:
+        print(f"💡 Measured per process: {summary['removed_kb']/1024:.1f} MB freed by removed apps, "
+              f"{summary['net_kb']/1024:.1f} MB net PSS freed")
+    print()
+
+
+def print_summary(improvements):
+    print()
+    print("="*80)
+    print("✅ RAM ANALYSIS COMPLETE!")
+    print("="*80)
+    print()
+
+    print("🎯 SUMMARY:")
+    print(f"  💪 Total RAM Freed: {improvements['ram_freed_mb']:.0f} MB")
+    print(f"  📱 App Memory Freed: {improvements['pss_freed_mb']:.0f} MB")
+    print(f"  💾 ZRAM Freed: {improvements['zram_freed_mb']:.0f} MB")
+    print(f"  🔄 Swap Freed: {improvements['swap_freed_gb']:.2f} GB")
+    print()
+    print("Your phone now has MORE memory available for the apps YOU want!")
 
-ax5.set_title('AFTER: Memory Distribution', fontweight='bold', fontsize=13, pad=10)
 
 # ============================================================================
-# 6. SWAP USAGE REDUCTION
+# VISUALIZATION
 # ============================================================================
-ax6 = fig.add_subplot(gs[1, 2])
-swap_gb = [before['zram_swap_kb']/1024/1024, after['zram_swap_kb']/1024/1024]
-bars = ax6.bar(categories, swap_gb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
-ax6.set_ylabel('Swap Usage (GB)', fontweight='bold', fontsize=12)
-ax6.set_title(f'🔄 SWAP REDUCTION\n-{improvements["swap_freed_gb"]:.2f}GB Freed!',
-             fontweight='bold', fontsize=14, pad=15)
-ax6.grid(axis='y', alpha=0.3)
-
-for bar, val in zip(bars, swap_gb):
-    height = bar.get_height()
-    ax6.text(bar.get_x() + bar.get_width()/2., height,
-            f'{val:.2f} GB', ha='center', va='bottom',
-            fontweight='bold', fontsize=12)
-
-plt.savefig('ram_comparison.png', dpi=150, bbox_inches='tight', facecolor='white')
-print("✅ RAM visualization saved: ram_comparison.png")
-
-print()
-print("="*80)
-print("✅ RAM ANALYSIS COMPLETE!")
-print("="*80)
-print()
-
-print("🎯 SUMMARY:")
-print(f"  💪 Total RAM Freed: {improvements['ram_freed_mb']:.0f} MB")
-print(f"  📱 App Memory Freed: {improvements['pss_freed_mb']:.0f} MB")
-print(f"  💾 ZRAM Freed: {improvements['zram_freed_mb']:.0f} MB")
-print(f"  🔄 Swap Freed: {improvements['swap_freed_gb']:.2f} GB")
-print()
-print("Your phone now has MORE memory available for the apps YOU want!")
+RAM_PANELS = 6
+
+
+def render_ram_comparison(before, after, improvements, path='ram_comparison.png', layer=None):
+    """Six-panel before/after figure, saved to `path`.
+
+    With `layer`, that layer is returned instead (plotting.figure_layer).
+    """
+    plt = pyplot()
+
+    fig = plt.figure(figsize=(18, 10))
+    gs = fig.add_gridspec(2, 3, hspace=0.35, wspace=0.3)
+
+    fig.suptitle('🧠 RAM ANALYSIS: DEBLOAT SUCCESS 🧠\nMemory Usage Before vs After',
+                 fontsize=20, fontweight='bold')
+
+    # ========================================================================
+    # 1. TOTAL USED RAM COMPARISON
+    # ========================================================================
+    ax1 = fig.add_subplot(gs[0, 0])
+    categories = ['Before\nDebloat', 'After\nDebloat']
+    ram_used_gb = [before['used_ram_kb']/1024/1024, after['used_ram_kb']/1024/1024]
+    colors = ['#ff6b6b', '#51cf66']
+
+    bars = ax1.bar(categories, ram_used_gb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
+    ax1.set_ylabel('RAM Used (GB)', fontweight='bold', fontsize=12)
+    ax1.set_title(f'📊 TOTAL RAM USAGE\n-{improvements["ram_freed_mb"]:.0f}MB Freed!',
+                 fontweight='bold', fontsize=14, pad=15)
+    ax1.set_ylim(0, 12)
+    ax1.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, ram_used_gb):
+        height = bar.get_height()
+        ax1.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.2f} GB', ha='center', va='bottom',
+                fontweight='bold', fontsize=12)
+
+    # ========================================================================
+    # 2. APP MEMORY (PSS) COMPARISON
+    # ========================================================================
+    ax2 = fig.add_subplot(gs[0, 1])
+    pss_gb = [before['used_pss_kb']/1024/1024, after['used_pss_kb']/1024/1024]
+    bars = ax2.bar(categories, pss_gb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
+    ax2.set_ylabel('App Memory (GB)', fontweight='bold', fontsize=12)
+    ax2.set_title(f'📱 APP MEMORY USAGE\n-{improvements["pss_freed_mb"]:.0f}MB Freed!',
+                 fontweight='bold', fontsize=14, pad=15)
+    ax2.set_ylim(0, 12)
+    ax2.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, pss_gb):
+        height = bar.get_height()
+        ax2.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.2f} GB', ha='center', va='bottom',
+                fontweight='bold', fontsize=12)
+
+    # ========================================================================
+    # 3. ZRAM COMPRESSION COMPARISON
+    # ========================================================================
+    ax3 = fig.add_subplot(gs[0, 2])
+    zram_mb = [before['zram_physical_kb']/1024, after['zram_physical_kb']/1024]
+    bars = ax3.bar(categories, zram_mb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
+    ax3.set_ylabel('Compressed RAM (MB)', fontweight='bold', fontsize=12)
+    ax3.set_title(f'💾 ZRAM COMPRESSION\n-{improvements["zram_freed_mb"]:.0f}MB Freed!',
+                 fontweight='bold', fontsize=14, pad=15)
+    ax3.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, zram_mb):
+        height = bar.get_height()
+        ax3.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.0f} MB', ha='center', va='bottom',
+                fontweight='bold', fontsize=12)
+
+    # ========================================================================
+    # 4. MEMORY BREAKDOWN PIE - BEFORE
+    # ========================================================================
+    ax4 = fig.add_subplot(gs[1, 0])
+    before_breakdown = [
+        before['used_pss_kb']/1024/1024,
+        before['kernel_kb']/1024/1024,
+        before['cached_pss_kb']/1024/1024,
+        before['free_memory_kb']/1024/1024,
+    ]
+    labels_before = ['Apps', 'Kernel', 'Cached', 'Free']
+    colors_pie = ['#ff6b6b', '#ffd93d', '#4ecdc4', '#95e1d3']
+
+    wedges, texts, autotexts = ax4.pie(before_breakdown, labels=labels_before, colors=colors_pie,
+                                         autopct='%1.1f%%', startangle=90,
+                                         textprops={'fontweight': 'bold', 'fontsize': 10})
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(11)
+
+    ax4.set_title('BEFORE: Memory Distribution', fontweight='bold', fontsize=13, pad=10)
+
+    # ========================================================================
+    # 5. MEMORY BREAKDOWN PIE - AFTER
+    # ========================================================================
+    ax5 = fig.add_subplot(gs[1, 1])
+    after_breakdown = [
+        after['used_pss_kb']/1024/1024,
+        after['kernel_kb']/1024/1024,
+        after['cached_pss_kb']/1024/1024,
+        after['free_memory_kb']/1024/1024,
+    ]
+
+    wedges, texts, autotexts = ax5.pie(after_breakdown, labels=labels_before, colors=colors_pie,
+                                         autopct='%1.1f%%', startangle=90,
+                                         textprops={'fontweight': 'bold', 'fontsize': 10})
+    for autotext in autotexts:
+        autotext.set_color('white')
+        autotext.set_fontsize(11)
+
+    ax5.set_title('AFTER: Memory Distribution', fontweight='bold', fontsize=13, pad=10)
+
+    # ========================================================================
+    # 6. SWAP USAGE REDUCTION
+    # ========================================================================
+    ax6 = fig.add_subplot(gs[1, 2])
+    swap_gb = [before['zram_swap_kb']/1024/1024, after['zram_swap_kb']/1024/1024]
+    bars = ax6.bar(categories, swap_gb, color=colors, edgecolor='black', linewidth=3, alpha=0.8)
+    ax6.set_ylabel('Swap Usage (GB)', fontweight='bold', fontsize=12)
+    ax6.set_title(f'🔄 SWAP REDUCTION\n-{improvements["swap_freed_gb"]:.2f}GB Freed!',
+                 fontweight='bold', fontsize=14, pad=15)
+    ax6.grid(axis='y', alpha=0.3)
+
+    for bar, val in zip(bars, swap_gb):
+        height = bar.get_height()
+        ax6.text(bar.get_x() + bar.get_width()/2., height,
+                f'{val:.2f} GB', ha='center', va='bottom',
+                fontweight='bold', fontsize=12)
+
+    with span('savefig'):
+        saved = save_figure(fig, path, layer, facecolor='white')
+    plt.close(fig)
+    return saved
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='RAM usage before vs after debloat.')
+    parser.add_argument('dumps', nargs='*', metavar='DUMP',
+                        help='before and after `dumpsys meminfo` dumps (default: recorded scans)')
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--text', action='store_true', help='text report only, no figure')
+    mode.add_argument('--json', action='store_true', help='JSON results only, no figure')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always re-render the figure (skip the render cache)')
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
+    if len(args.dumps) not in (0, 2):
+        parser.error('give both a before and an after dump')
+
+    # Keep --json output parseable: the profile table goes to stderr
+    with profiling_from_args(args, sys.stderr if args.json else None):
+        run(args, parser)
+
+
+def run(args, parser):
+    with span('load'):
+        try:
+            before, after = load_captures(args.dumps)
+        except ValueError as err:
+            parser.error(str(err))
+    with span('improvements'):
+        improvements = compute_improvements(before, after)
+    # Raw dumps carry the per-process table; the recorded scans only the hand-picked hogs
+    with span('hogs'):
+        hogs, hog_summary = measured_hogs(before, after) if args.dumps else (REMOVED_HOGS, None)
+
+    if args.json:
+        results = {
+            'before': {key: before[key] for key in MEMINFO_KEYS},
+            'after': {key: after[key] for key in MEMINFO_KEYS},
+            'improvements': improvements,
+        }
+        if hog_summary is not None:
+            results['hogs'] = [{'package': name, 'pss_freed_kb': kb} for name, kb, _ in hogs]
+            results['hog_summary'] = hog_summary
+        print(json.dumps(results, indent=2))
+        return
+
+    with span('report'):
+        print_header()
+        print_report(before, after, improvements)
+        print_hogs(hogs, hog_summary)
+
+    if not args.text:
+        print("🎨 Creating RAM comparison visualizations...")
+        with span('render'):
+            # Raw dumps are keyed by their contents, not by the process tables parsed from them
+            render_cached(render_ram_comparison, before, after, improvements,
+                          path='ram_comparison.png', inputs=args.dumps or None,
+                          cache=not args.no_cache)
+        print("✅ RAM visualization saved: ram_comparison.png")
+
+    print_summary(improvements)
+
+
+if __name__ == '__main__':
+    main()
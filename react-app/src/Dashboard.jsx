@@ -1,84 +1,77 @@
 import { useState, useEffect } from 'react'
 import { LineChart, Line, AreaChart, Area, BarChart, Bar, PieChart, Pie, Cell, RadarChart, Radar, PolarGrid, PolarAngleAxis, PolarRadiusAxis, XAxis, YAxis, CartesianGrid, Tooltip, Legend, ResponsiveContainer } from 'recharts'
 import { Activity, AlertTriangle, Cpu, HardDrive, Zap, Shield, TrendingUp, TrendingDown, CheckCircle, XCircle, AlertCircle } from 'lucide-react'
+import { calculateMetrics, exportedMetrics, exportedVitals, liveVitals } from './dashboardMetrics'
+import { loadHistory, loadManifest } from './historyLoader'
 import './Dashboard.css'
 
-const Dashboard = () => {
-  // Real data from the phone
-  const liveData = {
-    model: 'Samsung Galaxy S25 Ultra',
-    androidVersion: '16',
-    totalPackages: 395,
-    processCount: 1042,
-    battery: {
-      level: 74,
-      temperature: 28.1,
-      health: 'Good',
-      charging: true
+const HOUR_MS = 3600000
+
+// Real data from the phone
+const liveData = {
+  model: 'Samsung Galaxy S25 Ultra',
+  androidVersion: '16',
+  totalPackages: 395,
+  processCount: 1042,
+  battery: {
+    level: 74,
+    temperature: 28.1,
+    health: 'Good',
+    charging: true
+  },
+  memory: {
+    total: 11381328,  // KB
+    free: 325720,
+    available: 2880184,
+    swapTotal: 12582908,
+    swapFree: 5912920,
+    swapUsed: 6669988
+  },
+  // Historical data from analysis
+  genetic: {
+    before: {
+      packages: 573,
+      ram: 7.35,
+      swap: 6.38,
+      bloatware: 54.3
     },
-    memory: {
-      total: 11381328,  // KB
-      free: 325720,
-      available: 2880184,
-      swapTotal: 12582908,
-      swapFree: 5912920,
-      swapUsed: 6669988
+    after: {
+      packages: 392,
+      ram: 6.60,
+      swap: 3.53,
+      bloatware: 20.4
     },
-    // Historical data from analysis
-    genetic: {
-      before: {
-        packages: 573,
-        ram: 7.35,
-        swap: 6.38,
-        bloatware: 54.3
-      },
-      after: {
-        packages: 392,
-        ram: 6.60,
-        swap: 3.53,
-        bloatware: 20.4
-      },
-      current: {
-        packages: 395,
-        bloatware: 21.5  // Estimated
-      }
+    current: {
+      packages: 395,
+      bloatware: 21.5  // Estimated
     }
   }
+}
 
-  // Calculate derived metrics
-  const calculateMetrics = () => {
-    const ramUsedGB = (liveData.memory.total - liveData.memory.free) / 1024 / 1024
-    const ramUsagePercent = ((liveData.memory.total - liveData.memory.free) / liveData.memory.total * 100).toFixed(1)
-    const swapUsagePercent = ((liveData.memory.swapTotal - liveData.memory.swapFree) / liveData.memory.swapTotal * 100).toFixed(1)
-
-    // Genetic Integrity Score (higher is better)
-    const geneticIntegrity = (100 - liveData.genetic.current.bloatware).toFixed(1)
-
-    // Metabolic Efficiency (battery health + efficiency)
-    const metabolicEfficiency = ((100 - liveData.battery.temperature) * 0.7 + liveData.battery.level * 0.3).toFixed(1)
-
-    // Parasitic Load Index (bloatware %)
-    const parasiticLoad = liveData.genetic.current.bloatware
-
-    // Cellular Health Score (RAM + swap efficiency)
-    const cellularHealth = (100 - parseFloat(ramUsagePercent) * 0.6 - parseFloat(swapUsagePercent) * 0.4).toFixed(1)
+// Scored once, not on every render
+const liveMetrics = calculateMetrics(liveData)
+const liveReadings = liveVitals(liveData)
 
-    // Overall Digital Organism Health
-    const overallHealth = ((parseFloat(geneticIntegrity) + parseFloat(metabolicEfficiency) + parseFloat(cellularHealth)) / 3).toFixed(1)
+const Dashboard = () => {
+  // Exported capture history, when react-app/public/history exists
+  const [exported, setExported] = useState(null)
 
-    return {
-      ramUsedGB,
-      ramUsagePercent,
-      swapUsagePercent,
-      geneticIntegrity,
-      metabolicEfficiency,
-      parasiticLoad,
-      cellularHealth,
-      overallHealth
-    }
-  }
+  useEffect(() => {
+    loadManifest()
+      .then(async (manifest) => {
+        if (!manifest.latest) return
+        const { rows } = await loadHistory(manifest.end_ms - 24 * HOUR_MS, manifest.end_ms, { maxPoints: 25 })
+        setExported({
+          metrics: exportedMetrics(manifest.latest),
+          vitals: exportedVitals(manifest.latest),
+          lastDay: rows,
+        })
+      })
+      .catch(() => {})  // no export published: keep the recorded liveData
+  }, [])
 
-  const metrics = calculateMetrics()
+  const metrics = exported?.metrics ?? liveMetrics
+  const vitals = exported?.vitals ?? liveReadings
 
   // Chart data
   const geneticEvolutionData = [
@@ -88,7 +81,10 @@ const Dashboard = () => {
     { stage: 'Current\n(Today)', packages: 395, bloatware: 21.5, health: 78.5 },
   ]
 
-  const metabolicData = [
+  const metabolicData = exported?.lastDay.length ? exported.lastDay.map((row) => ({
+    time: new Date(row.t).toTimeString().slice(0, 5),
+    efficiency: row.metabolicEfficiency,
+  })) : [
     { time: '00:00', efficiency: 72 },
     { time: '04:00', efficiency: 68 },
     { time: '08:00', efficiency: 65 },
@@ -102,7 +98,7 @@ const Dashboard = () => {
     { name: 'Samsung Knox', value: 416, color: '#ff4444' },
     { name: 'Google Services', value: 118, color: '#ffaa00' },
     { name: 'Meta/Facebook', value: 10, color: '#ff6b6b' },
-    { name: 'Benign Apps', value: liveData.totalPackages - 85, color: '#00ff41' },
+    { name: 'Benign Apps', value: vitals.totalPackages - 85, color: '#00ff41' },
   ]
 
   const systemHealthRadar = [
@@ -110,7 +106,7 @@ const Dashboard = () => {
     { metric: 'Metabolic Efficiency', value: parseFloat(metrics.metabolicEfficiency), fullMark: 100 },
     { metric: 'Cellular Health', value: parseFloat(metrics.cellularHealth), fullMark: 100 },
     { metric: 'Memory Optimization', value: 100 - parseFloat(metrics.ramUsagePercent), fullMark: 100 },
-    { metric: 'Process Efficiency', value: ((1070 - liveData.processCount) / 1070 * 100), fullMark: 100 },
+    { metric: 'Process Efficiency', value: ((1070 - vitals.processCount) / 1070 * 100), fullMark: 100 },
   ]
 
   const getHealthStatus = (score) => {
@@ -168,7 +164,7 @@ const Dashboard = () => {
             </div>
             <div className="metric-value">{metrics.metabolicEfficiency}%</div>
             <div className="metric-detail">
-              Battery: {liveData.battery.level}% • {liveData.battery.temperature}°C
+              Battery: {vitals.batteryLevel}% • {vitals.batteryTemperature}°C
             </div>
           </div>
 
@@ -179,7 +175,7 @@ const Dashboard = () => {
             </div>
             <div className="metric-value">{metrics.geneticIntegrity}%</div>
             <div className="metric-detail">
-              {liveData.totalPackages} packages • {metrics.parasiticLoad.toFixed(1)}% parasitic
+              {vitals.totalPackages} packages • {metrics.parasiticLoad.toFixed(1)}% parasitic
             </div>
           </div>
 
@@ -307,7 +303,7 @@ const Dashboard = () => {
               <div className="alert-content">
                 <div className="alert-title">Process Optimization Active</div>
                 <div className="alert-description">
-                  {liveData.processCount} concurrent processes • 28 fewer than pre-optimization baseline
+                  {vitals.processCount} concurrent processes • 28 fewer than pre-optimization baseline
                 </div>
               </div>
             </div>
@@ -322,11 +318,11 @@ const Dashboard = () => {
           </div>
           <div className="stat-item">
             <Activity size={16} />
-            <span>{liveData.processCount} Active Processes</span>
+            <span>{vitals.processCount} Active Processes</span>
           </div>
           <div className="stat-item">
             <HardDrive size={16} />
-            <span>{(liveData.memory.total / 1024 / 1024).toFixed(1)} GB Total RAM</span>
+            <span>{vitals.totalRamGB} GB Total RAM</span>
           </div>
           <div className="stat-item">
             <Shield size={16} />
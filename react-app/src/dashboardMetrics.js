@@ -0,0 +1,69 @@
+// Dashboard scores. dashboard_metrics.py implements the same formulas over
+// arrays; benchmarks/bench_dashboard_metrics.py imports this file under Node
+// to check that both agree.
+
+// Derived metrics of one liveData-shaped capture
+export const calculateMetrics = (liveData) => {
+  const ramUsedGB = (liveData.memory.total - liveData.memory.free) / 1024 / 1024
+  const ramUsagePercent = ((liveData.memory.total - liveData.memory.free) / liveData.memory.total * 100).toFixed(1)
+  const swapUsagePercent = ((liveData.memory.swapTotal - liveData.memory.swapFree) / liveData.memory.swapTotal * 100).toFixed(1)
+
+  // Genetic Integrity Score (higher is better)
+  const geneticIntegrity = (100 - liveData.genetic.current.bloatware).toFixed(1)
+
+  // Metabolic Efficiency (battery health + efficiency)
+  const metabolicEfficiency = ((100 - liveData.battery.temperature) * 0.7 + liveData.battery.level * 0.3).toFixed(1)
+
+  // Parasitic Load Index (bloatware %)
+  const parasiticLoad = liveData.genetic.current.bloatware
+
+  // Cellular Health Score (RAM + swap efficiency)
+  const cellularHealth = (100 - parseFloat(ramUsagePercent) * 0.6 - parseFloat(swapUsagePercent) * 0.4).toFixed(1)
+
+  // Overall Digital Organism Health
+  const overallHealth = ((parseFloat(geneticIntegrity) + parseFloat(metabolicEfficiency) + parseFloat(cellularHealth)) / 3).toFixed(1)
+
+  return {
+    ramUsedGB,
+    ramUsagePercent,
+    swapUsagePercent,
+    geneticIntegrity,
+    metabolicEfficiency,
+    parasiticLoad,
+    cellularHealth,
+    overallHealth
+  }
+}
+
+// Scores precomputed by dashboard_export.py, in calculateMetrics() shape
+export const exportedMetrics = (latest) => {
+  const fixed = (value) => (value ?? NaN).toFixed(1)
+  return {
+    ramUsedGB: latest.ramUsedGB,
+    ramUsagePercent: fixed(latest.ramUsagePercent),
+    swapUsagePercent: fixed(latest.swapUsagePercent),
+    geneticIntegrity: fixed(latest.geneticIntegrity),
+    metabolicEfficiency: fixed(latest.metabolicEfficiency),
+    parasiticLoad: latest.parasiticLoad ?? NaN,
+    cellularHealth: fixed(latest.cellularHealth),
+    overallHealth: fixed(latest.overallHealth),
+  }
+}
+
+// Device readings shown on the cards, from one liveData-shaped capture
+export const liveVitals = (liveData) => ({
+  totalPackages: liveData.totalPackages,
+  processCount: liveData.processCount,
+  batteryLevel: liveData.battery.level,
+  batteryTemperature: liveData.battery.temperature,
+  totalRamGB: (liveData.memory.total / 1024 / 1024).toFixed(1),
+})
+
+// The same readings from the latest capture exported by dashboard_export.py
+export const exportedVitals = (latest) => ({
+  totalPackages: latest.total_packages ?? NaN,
+  processCount: latest.running_processes ?? NaN,
+  batteryLevel: latest.battery_level ?? NaN,
+  batteryTemperature: latest.battery_temp_c ?? NaN,
+  totalRamGB: (latest.total_ram_gb ?? NaN).toFixed(1),
+})
@@ -0,0 +1,70 @@
+// Lazy loader for the chunked history written by dashboard_export.py.
+//
+// manifest.json lists, per resolution (raw / 1h / 1d), the time-chunked
+// files that hold the precomputed dashboard metrics. loadHistory() picks the
+// finest resolution that keeps the window under maxPoints and fetches only
+// the chunks overlapping [startMs, endMs]. Only the JSON layout is read here;
+// Arrow exports would need the apache-arrow package.
+
+const HISTORY_URL = `${import.meta.env.BASE_URL}history/`
+
+const manifests = new Map()
+const chunks = new Map()
+
+const fetchJson = async (url) => {
+  const response = await fetch(url)
+  if (!response.ok) throw new Error(`${url}: HTTP ${response.status}`)
+  return response.json()
+}
+
+export const loadManifest = (baseUrl = HISTORY_URL) => {
+  if (!manifests.has(baseUrl)) {
+    const manifest = fetchJson(`${baseUrl}manifest.json`)
+    manifest.catch(() => manifests.delete(baseUrl))
+    manifests.set(baseUrl, manifest)
+  }
+  return manifests.get(baseUrl)
+}
+
+const loadChunk = (baseUrl, path) => {
+  const url = `${baseUrl}${path}`
+  if (!chunks.has(url)) {
+    const chunk = fetchJson(url)
+    chunk.catch(() => chunks.delete(url))
+    chunks.set(url, chunk)
+  }
+  return chunks.get(url)
+}
+
+// Estimated rows in [startMs, endMs] at one resolution
+const estimateRows = (resolution, startMs, endMs) =>
+  resolution.chunks
+    .filter((chunk) => chunk.end_ms > startMs && chunk.start_ms <= endMs)
+    .reduce((rows, chunk) => {
+      const overlap = Math.min(chunk.end_ms, endMs + 1) - Math.max(chunk.start_ms, startMs)
+      return rows + chunk.rows * overlap / (chunk.end_ms - chunk.start_ms)
+    }, 0)
+
+export const pickResolution = (manifest, startMs, endMs, maxPoints) =>
+  manifest.resolutions.find((resolution) => estimateRows(resolution, startMs, endMs) <= maxPoints)
+  ?? manifest.resolutions[manifest.resolutions.length - 1]
+
+// Rows of the visible window as [{ t, field: value, ... }], in time order
+export const loadHistory = async (startMs, endMs, { maxPoints = 500, baseUrl = HISTORY_URL } = {}) => {
+  const manifest = await loadManifest(baseUrl)
+  if (manifest.format !== 'json') throw new Error(`unsupported history format: ${manifest.format}`)
+  const resolution = pickResolution(manifest, startMs, endMs, maxPoints)
+  const visible = resolution.chunks.filter((chunk) => chunk.end_ms > startMs && chunk.start_ms <= endMs)
+  const loaded = await Promise.all(visible.map((chunk) => loadChunk(baseUrl, chunk.path)))
+
+  const rows = []
+  for (const chunk of loaded) {
+    chunk.t.forEach((t, i) => {
+      if (t < startMs || t > endMs) return
+      const row = { t }
+      for (const field of manifest.fields) row[field] = chunk[field][i]
+      rows.push(row)
+    })
+  }
+  return { resolution: resolution.name, rows }
+}
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+RECORDED CAPTURES - The original forensic scan and the post-UAD scan
+
+Plain dicts with no third-party imports, so text-only reports can load
+them without pulling in NumPy. Keys match snapshot_store.COLUMNS.
+"""
+
+# ============================================================================
+# RECORDED CAPTURES (the original forensic scan and the post-UAD scan)
+# ============================================================================
+RECORDED_CAPTURES = {
+    'before': {
+        'captured_at_ms': 1760875200000,    # Oct 19, 2025 - pre-debloat
+        'total_ram_kb': 11_381_328,
+        'free_ram_kb': 7_536_353,
+        'used_ram_kb': 7_703_762,
+        'cached_pss_kb': 5_551_529,
+        'cached_kernel_kb': 1_479_220,
+        'free_memory_kb': 505_604,
+        'used_pss_kb': 5_918_286,
+        'kernel_kb': 1_785_476,
+        'zram_physical_kb': 1_903_328,
+        'zram_swap_kb': 6_691_904,
+        'total_packages': 573,
+        'system_apps': 311,
+        'user_apps': 262,
+        'running_processes': 1070,
+        'storage_free_gb': 140.5,
+        'storage_total_gb': 220.9,
+    },
+    'after': {
+        'captured_at_ms': 1760893200000,    # Oct 19, 2025 - post-debloat
+        'total_ram_kb': 11_381_328,
+        'free_ram_kb': 6_271_006,
+        'used_ram_kb': 6_922_562,
+        'cached_pss_kb': 3_129_070,
+        'cached_kernel_kb': 2_089_036,
+        'free_memory_kb': 1_052_900,
+        'used_pss_kb': 5_338_846,
+        'kernel_kb': 1_583_716,
+        'zram_physical_kb': 1_036_944,
+        'zram_swap_kb': 3_704_116,
+        'total_packages': 392,
+        'system_apps': 312,     # Slight increase due to counting methodology
+        'user_apps': 80,
+        'running_processes': 1063,
+        'storage_free_gb': 142.3,
+        'storage_total_gb': 220.9,
+    },
+}
+
+RECORDED_DEVICE = 'Samsung Galaxy S25 Ultra'
@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""
+RENDER CACHE - Content-addressed cache for the report figures
+
+A figure is keyed by a SHA-256 of the renderer's name, the source of the
+module that defines it and of plotting.py, the installed matplotlib
+version, and the JSON of every argument passed to it (the input metrics
+plus figure parameters such as helix_points). A run on raw dumps passes
+`inputs=` instead: the dump files are hashed in place of the arguments
+derived from them, such as a per-process table. An unchanged run is then
+one hash and one file copy; matplotlib is never imported.
+
+Entries live as <key>.png in the cache directory. Each hit bumps the
+file's mtime, and after every store the oldest entries are evicted until
+the directory fits in `max_bytes` (LRU by total size).
+
+    $PHONEDNA_RENDER_CACHE      cache directory (default ~/.cache/phone-dna-forensics/renders)
+    $PHONEDNA_RENDER_CACHE_MB   size limit in MB (default 256)
+
+Usage:
+    python3 render_cache.py              # show cache location and size
+    python3 render_cache.py --clear      # delete every cached figure
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import shutil
+import sys
+import tempfile
+
+DEFAULT_DIR = os.path.join('~', '.cache', 'phone-dna-forensics', 'renders')
+DEFAULT_MAX_MB = 256
+
+
+def _file_digest(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _source_digest(render):
+    """Hash of the renderer's module source, so editing a figure invalidates it."""
+    module = sys.modules.get(render.__module__)
+    path = getattr(module, '__file__', None)
+    if not path:
+        return render.__qualname__
+    return _file_digest(path)
+
+
+def _plotting_digest():
+    """Hash of plotting.py, which sets up matplotlib for every figure."""
+    spec = importlib.util.find_spec('plotting')
+    return _file_digest(spec.origin) if spec and spec.origin else None
+
+
+def _matplotlib_version():
+    """matplotlib's version, read from its package metadata unless already imported."""
+    module = sys.modules.get('matplotlib')
+    if module is not None:
+        return module.__version__
+    # Only needed when a figure is about to be looked up (it costs ~50 ms to import)
+    import importlib.metadata
+
+    try:
+        return importlib.metadata.version('matplotlib')
+    except importlib.metadata.PackageNotFoundError:
+        return None
+
+
+class RenderCache:
+    """On-disk PNG cache with LRU eviction by total size."""
+
+    def __init__(self, directory=None, max_bytes=None):
+        directory = directory or os.environ.get('PHONEDNA_RENDER_CACHE') or DEFAULT_DIR
+        if max_bytes is None:
+            max_bytes = int(float(os.environ.get('PHONEDNA_RENDER_CACHE_MB', DEFAULT_MAX_MB)) * 1024 * 1024)
+        self.directory = os.path.expanduser(directory)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directory, exist_ok=True)
+
+    def key(self, render, args, kwargs, inputs=None):
+        """Cache key; with `inputs` (file paths) their contents stand in for `args`."""
+        payload = json.dumps({
+            'render': f'{render.__module__}.{render.__qualname__}',
+            'source': _source_digest(render),
+            'plotting': _plotting_digest(),
+            'matplotlib': _matplotlib_version(),
+            'args': args if inputs is None else [_file_digest(path) for path in inputs],
+            'kwargs': kwargs,
+        }, sort_keys=True, default=repr)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry(self, key):
+        return os.path.join(self.directory, f'{key}.png')
+
+    def get(self, key, path):
+        """Copy a cached figure to `path`. Returns False on a miss."""
+        entry = self._entry(key)
+        try:
+            shutil.copyfile(entry, path)
+        except FileNotFoundError:
+            return False
+        os.utime(entry)
+        return True
+
+    def put(self, key, path):
+        """Store the figure at `path` under `key`, then evict down to max_bytes."""
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        os.close(fd)
+        shutil.copyfile(path, tmp)
+        os.replace(tmp, self._entry(key))
+        self.evict()
+
+    def entries(self):
+        """(mtime, size, path) for every cached figure, oldest first."""
+        found = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith('.png'):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                found.append((stat.st_mtime, stat.st_size, entry.path))
+        return sorted(found)
+
+    def size(self):
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self):
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(entry)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def clear(self):
+        for _, _, entry in self.entries():
+            os.remove(entry)
+
+    def render(self, render, *args, path, inputs=None, **kwargs):
+        """Call `render(*args, path=path, **kwargs)` unless the figure is cached.
+
+        `inputs` are the files `args` were parsed from, if any. Returns
+        True on a cache hit.
+        """
+        key = self.key(render, args, kwargs, inputs)
+        if self.get(key, path):
+            return True
+        render(*args, path=path, **kwargs)
+        self.put(key, path)
+        return False
+
+
+def render_cached(render, *args, path, cache=True, inputs=None, **kwargs):
+    """render_*() through the default RenderCache; `cache=False` always renders."""
+    if not cache:
+        render(*args, path=path, **kwargs)
+        return False
+    return RenderCache().render(render, *args, path=path, inputs=inputs, **kwargs)
+
+
+if __name__ == '__main__':
+    cache = RenderCache()
+    if sys.argv[1:] == ['--clear']:
+        cache.clear()
+    entries = cache.entries()
+    print(f"Render cache: {cache.directory}")
+    print(f"  Figures: {len(entries)}  Size: {cache.size() / 1024 / 1024:.1f} MB"
+          f" of {cache.max_bytes / 1024 / 1024:.0f} MB")
@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+RENDER REPORTS - Render every report figure for one device in parallel
+
+Draws ram_comparison.png, debloat_comparison.png and dna_revelation.png
+for the recorded device, or for a device folder / archive with a
+`before/` and `after/` capture, read like fleet_analysis.py does. A
+figure that a capture lacks the keys for is skipped.
+
+Figures already in the render cache are copied out first. The rest are
+scheduled on a process pool; every worker imports matplotlib itself
+through plotting.pyplot(), which pins it to the Agg backend:
+
+    one worker          each figure is drawn whole, in this process
+    up to one per       each figure is one job, slowest first
+      figure
+    more workers        each panel of each figure is a job: the worker
+                        lays out the whole figure but rasterizes only
+                        that panel's axes (plotting.figure_layer), and
+                        the layers are composed here over the figure's
+                        background into the same PNG a serial savefig
+                        writes
+
+A panel job still builds and lays out its whole figure, so panels only
+pay off with enough cores to run them side by side; the summary line
+reports the work done and the wall time, measured.
+
+Usage:
+    python3 render_reports.py [DEVICE] [-o OUT_DIR] [-j WORKERS] [--no-cache] [--helix-points N]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import analyze_debloat
+import meta_forensic_analysis
+import ram_analysis
+from recorded_captures import RECORDED_CAPTURES
+from render_cache import RenderCache
+
+
+def report_jobs(out_dir='.', helix_points=meta_forensic_analysis.HELIX_POINTS, captures=None):
+    """Jobs for each figure, slowest first, and the figures skipped.
+
+    `captures` is a (before, after) pair of capture_loader.py captures;
+    by default the recorded device is drawn. A job is (path, render,
+    args, kwargs, panels); a skipped figure is (path, missing keys).
+    """
+    reports = (
+        ('dna_revelation.png', meta_forensic_analysis.CAPTURE_KEYS, _dna_job),
+        ('debloat_comparison.png', analyze_debloat.DEBLOAT_KEYS, _debloat_job),
+        ('ram_comparison.png', ram_analysis.RAM_KEYS, _ram_job),
+    )
+    if captures is None:
+        captures = (RECORDED_CAPTURES['before'], RECORDED_CAPTURES['after'])
+    jobs, skipped = [], []
+    for name, keys, job in reports:
+        path = os.path.join(out_dir, name)
+        missing = [key for key in keys if any(key not in capture for capture in captures)]
+        if missing:
+            skipped.append((path, missing))
+        else:
+            jobs.append((path, *job(*captures, helix_points)))
+    return jobs, skipped
+
+
+def _dna_job(before, after, helix_points):
+    markers = meta_forensic_analysis.genetic_markers(before, after)
+    score, grade, _ = meta_forensic_analysis.compute_transformation(markers)
+    return (meta_forensic_analysis.render_dna_revelation, (markers, score, grade),
+            {'helix_points': helix_points,
+             'figures': meta_forensic_analysis.story_figures(before, after)},
+            meta_forensic_analysis.DNA_PANELS)
+
+
+def _debloat_job(before, after, _):
+    before, after = analyze_debloat.from_capture(before), analyze_debloat.from_capture(after)
+    return (analyze_debloat.render_debloat_comparison,
+            (before, after, analyze_debloat.compute_improvements(before, after)), {},
+            analyze_debloat.DEBLOAT_PANELS)
+
+
+def _ram_job(before, after, _):
+    before, after = ram_analysis.from_capture(before), ram_analysis.from_capture(after)
+    return (ram_analysis.render_ram_comparison,
+            (before, after, ram_analysis.compute_improvements(before, after)), {},
+            ram_analysis.RAM_PANELS)
+
+
+def render_figure(job):
+    """Draw one whole figure (runs in a worker). Returns seconds."""
+    path, render, args, kwargs, _ = job
+    start = time.perf_counter()
+    render(*args, path=path, **kwargs)
+    return time.perf_counter() - start
+
+
+def render_layer(task):
+    """Rasterize one layer of a figure (runs in a worker). Returns (layer, seconds)."""
+    (_, render, args, kwargs, _), layer = task
+    start = time.perf_counter()
+    result = render(*args, path=None, layer=layer, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def compose(layers, path):
+    """Paint plotting.figure_layer() layers in order over their background; save as PNG."""
+    import numpy as np
+    from PIL import Image
+
+    width, height = layers[0]['size']
+    canvas = np.empty((height, width, 3), dtype=np.float32)
+    canvas[:] = layers[0]['background']
+    for layer in layers:
+        pixels = layer['pixels']
+        if pixels is None:
+            continue
+        top, left = layer['origin']
+        region = canvas[top:top + pixels.shape[0], left:left + pixels.shape[1]]
+        alpha = pixels[..., 3:] / np.float32(255)
+        region *= 1 - alpha
+        region += pixels[..., :3] * alpha
+    Image.fromarray(np.rint(canvas).astype(np.uint8)).save(path, dpi=(150, 150))
+
+
+def render_reports(jobs, workers=None, cache=True):
+    """Render every job; returns (path, cache hit, seconds, mode) in job order.
+
+    `seconds` is the work spent on the figure, summed over its jobs.
+    """
+    store = RenderCache() if cache else None
+    keys, results, todo = {}, {}, []
+    for job in jobs:
+        path, render, args, kwargs, _ = job
+        if store is not None:
+            keys[path] = store.key(render, args, kwargs)
+            if store.get(keys[path], path):
+                results[path] = (path, True, 0.0, 'cached')
+                continue
+        todo.append(job)
+
+    workers = workers or os.cpu_count() or 1
+    if todo and workers == 1:
+        for job in todo:
+            results[job[0]] = (job[0], False, render_figure(job), 'serial')
+    elif todo and workers <= len(todo):
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for job, seconds in zip(todo, pool.map(render_figure, todo)):
+                results[job[0]] = (job[0], False, seconds, 'figure')
+    elif todo:
+        tasks = [(job, layer) for job in todo for layer in range(job[4] + 1)]
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as pool:
+            done = list(pool.map(render_layer, tasks))
+        for job in todo:
+            mine = [(layer, seconds) for (owner, _), (layer, seconds) in zip(tasks, done) if owner is job]
+            start = time.perf_counter()
+            compose([layer for layer, _ in mine], job[0])
+            seconds = sum(s for _, s in mine) + time.perf_counter() - start
+            results[job[0]] = (job[0], False, seconds, f'{len(mine)} layers')
+
+    if store is not None:
+        for job in todo:
+            store.put(keys[job[0]], job[0])
+    return [results[job[0]] for job in jobs]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render all report figures in parallel.')
+    parser.add_argument('device', nargs='?',
+                        help='device folder or archive with before/ and after/ captures, '
+                             'as in fleet_analysis.py (default: the recorded device)')
+    parser.add_argument('-o', '--out-dir', default='.')
+    parser.add_argument('-j', '--workers', type=int, default=None,
+                        help='worker processes (default: all cores; more than one per figure '
+                             'renders panels as separate jobs)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='always re-render (skip the render cache)')
+    parser.add_argument('--helix-points', type=int, default=meta_forensic_analysis.HELIX_POINTS)
+    args = parser.parse_args(argv)
+
+    captures = None
+    if args.device:
+        from fleet_analysis import load_device
+
+        try:
+            captures = load_device(args.device)
+        except (OSError, ValueError) as err:
+            parser.error(f'{args.device}: {err}')
+        if None in captures:
+            parser.error(f"{args.device}: no {'before' if captures[0] is None else 'after'}/ capture")
+
+    os.makedirs(args.out_dir, exist_ok=True)
+    jobs, skipped = report_jobs(args.out_dir, args.helix_points, captures)
+    if not jobs:
+        parser.error(f'{args.device}: no figure can be drawn from these captures')
+
+    start = time.perf_counter()
+    results = render_reports(jobs, args.workers, cache=not args.no_cache)
+    elapsed = time.perf_counter() - start
+
+    print("="*80)
+    print("🎨 REPORT FIGURES RENDERED")
+    print("="*80)
+    for path, hit, seconds, mode in results:
+        print(f"  {path:<40} {seconds:>6.2f} s  ({mode})")
+    for path, missing in skipped:
+        print(f"  {path:<40} skipped: no {', '.join(missing)}")
+    print(f"  Slowest figure: {max(s for _, _, s, _ in results):.2f} s   "
+          f"Work: {sum(s for _, _, s, _ in results):.2f} s   Wall: {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,222 @@
+#!/usr/bin/env python3
+"""
+SNAPSHOT STORE - Columnar on-disk store of device captures
+
+One row per capture, one column per metric. Each column is a NumPy .npy
+file that is memory-mapped on load, so reading thousands of captures is a
+page-in rather than a re-parse of text dumps.
+
+Store directory layout:
+    manifest.json        row count, capacity, column dtypes, device table
+    <column>.npy         one preallocated array per column
+
+Missing integer metrics are stored as -1, missing float metrics as NaN.
+
+Usage:
+    python3 snapshot_store.py STORE_DIR           # summarise a store
+    python3 snapshot_store.py STORE_DIR --seed    # add the recorded Oct 19 captures
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+
+from recorded_captures import RECORDED_CAPTURES, RECORDED_DEVICE
+
+# ============================================================================
+# SCHEMA
+# ============================================================================
+COLUMNS = {
+    'captured_at_ms': 'int64',
+    'device_id': 'int32',
+    # dumpsys meminfo
+    'total_ram_kb': 'int64',
+    'free_ram_kb': 'int64',
+    'used_ram_kb': 'int64',
+    'cached_pss_kb': 'int64',
+    'cached_kernel_kb': 'int64',
+    'free_memory_kb': 'int64',
+    'used_pss_kb': 'int64',
+    'kernel_kb': 'int64',
+    'zram_physical_kb': 'int64',
+    'zram_swap_kb': 'int64',
+    'swap_total_kb': 'int64',
+    # dumpsys batterystats
+    'battery_level': 'int32',
+    'battery_temp_c': 'float64',
+    # dumpsys usagestats
+    'foreground_hours': 'float64',
+    # pm list packages / ps / df
+    'total_packages': 'int32',
+    'system_apps': 'int32',
+    'user_apps': 'int32',
+    'running_processes': 'int32',
+    'storage_free_gb': 'float64',
+    'storage_total_gb': 'float64',
+}
+
+_MIN_CAPACITY = 64
+
+
+def _missing(dtype):
+    return np.nan if np.dtype(dtype).kind == 'f' else -1
+
+
+class SnapshotStore:
+    """Append-only columnar store; columns are memory-mapped NumPy arrays."""
+
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+        manifest_path = os.path.join(path, 'manifest.json')
+        if os.path.exists(manifest_path):
+            with open(manifest_path) as f:
+                self.manifest = json.load(f)
+        else:
+            self.manifest = {'rows': 0, 'capacity': 0, 'columns': dict(COLUMNS), 'devices': []}
+        self._device_ids = {name: i for i, name in enumerate(self.manifest['devices'])}
+        self._maps = {}
+        # Stores written before a column existed get it filled with "missing"
+        for name, dtype in COLUMNS.items():
+            if name not in self.manifest['columns']:
+                self._add_column(name, dtype)
+
+    def __len__(self):
+        return self.manifest['rows']
+
+    # ------------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------------
+    def column(self, name):
+        """Read-only memory-mapped view of one column (length == rows)."""
+        rows = self.manifest['rows']
+        if not rows:
+            return np.empty(0, dtype=self.manifest['columns'][name])
+        mapped = np.load(self._column_path(name), mmap_mode='r')
+        return mapped[:rows]
+
+    def columns(self, names=None):
+        return {name: self.column(name) for name in (names or self.manifest['columns'])}
+
+    def row(self, index):
+        """One capture as a plain dict, in the shape the analysis scripts use."""
+        capture = {name: self.column(name)[index].item() for name in self.manifest['columns']}
+        capture['device'] = self.manifest['devices'][capture['device_id']]
+        return capture
+
+    def device_rows(self, device):
+        """Row indexes for one device, in capture order."""
+        device_id = self._device_ids.get(device)
+        if device_id is None:
+            return np.empty(0, dtype=np.int64)
+        return np.flatnonzero(self.column('device_id') == device_id)
+
+    # ------------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------------
+    def append(self, capture, device):
+        """Append one capture dict of `device`; unknown keys are ignored."""
+        return self.extend([capture], device)[0]
+
+    def extend(self, captures, device):
+        """Append many captures of `device` with one manifest write. Returns row indexes."""
+        captures = list(captures)
+        start = self.manifest['rows']
+        self._reserve(start + len(captures))
+        device_id = self._device_id(device)
+
+        for name, dtype in self.manifest['columns'].items():
+            target = self._writable(name)
+            if name == 'device_id':
+                target[start:start + len(captures)] = device_id
+                continue
+            missing = _missing(dtype)
+            target[start:start + len(captures)] = [c.get(name, missing) for c in captures]
+
+        self.manifest['rows'] = start + len(captures)
+        self.flush()
+        return list(range(start, start + len(captures)))
+
+    def flush(self):
+        for mapped in self._maps.values():
+            mapped.flush()
+        tmp = os.path.join(self.path, 'manifest.json.tmp')
+        with open(tmp, 'w') as f:
+            json.dump(self.manifest, f, indent=1)
+        os.replace(tmp, os.path.join(self.path, 'manifest.json'))
+
+    def _device_id(self, device):
+        device_id = self._device_ids.get(device)
+        if device_id is None:
+            device_id = len(self.manifest['devices'])
+            self.manifest['devices'].append(device)
+            self._device_ids[device] = device_id
+        return device_id
+
+    def _column_path(self, name):
+        return os.path.join(self.path, f'{name}.npy')
+
+    def _writable(self, name):
+        mapped = self._maps.get(name)
+        if mapped is None:
+            mapped = np.load(self._column_path(name), mmap_mode='r+')
+            self._maps[name] = mapped
+        return mapped
+
+    def _add_column(self, name, dtype):
+        if self.manifest['capacity']:
+            added = np.lib.format.open_memmap(self._column_path(name), mode='w+', dtype=dtype,
+                                              shape=(self.manifest['capacity'],))
+            added[:] = _missing(dtype)
+            added.flush()
+            del added
+        self.manifest['columns'][name] = dtype
+
+    def _reserve(self, rows):
+        """Grow every column geometrically so appends stay O(1) amortised."""
+        capacity = self.manifest['capacity']
+        if rows <= capacity:
+            return
+        new_capacity = max(_MIN_CAPACITY, capacity * 2, rows)
+        old_rows = self.manifest['rows']
+        for name, dtype in self.manifest['columns'].items():
+            path = self._column_path(name)
+            tmp = path + '.tmp'
+            grown = np.lib.format.open_memmap(tmp, mode='w+', dtype=dtype, shape=(new_capacity,))
+            grown[:] = _missing(dtype)
+            if old_rows:
+                grown[:old_rows] = np.load(path, mmap_mode='r')[:old_rows]
+            grown.flush()
+            del grown
+            self._maps.pop(name, None)
+            os.replace(tmp, path)
+        self.manifest['capacity'] = new_capacity
+
+
+def seed_recorded(store):
+    """Write the recorded before/after captures into an empty store."""
+    if len(store):
+        return []
+    return store.extend([RECORDED_CAPTURES['before'], RECORDED_CAPTURES['after']], RECORDED_DEVICE)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) not in (2, 3):
+        print(__doc__.strip())
+        sys.exit(1)
+
+    store = SnapshotStore(sys.argv[1])
+    if len(sys.argv) == 3 and sys.argv[2] == '--seed':
+        seed_recorded(store)
+
+    print("="*80)
+    print(f"🗄️  SNAPSHOT STORE: {sys.argv[1]}")
+    print("="*80)
+    print(f"  Captures: {len(store):,}  Devices: {len(store.manifest['devices'])}")
+    if len(store):
+        used = store.column('used_ram_kb')
+        packages = store.column('total_packages')
+        print(f"  Used RAM:  {used.min() / 1024 / 1024:.2f} - {used.max() / 1024 / 1024:.2f} GB")
+        print(f"  Packages:  {packages.min()} - {packages.max()}")
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+SYNTHETIC DUMP GENERATORS - Deterministic stand-ins for real device captures
+
+Every generator yields text lines in the same shape `adb shell dumpsys ...`
+produces, seeded so benchmark runs are comparable between commits. Used
+by the scripts in benchmarks/ and by device_simulator.py, which replays
+them as live phones.
+"""
+
+import os
+import random
+from datetime import datetime, timedelta
+
+# Numbers from the original "before" scan in ram_analysis.py
+BEFORE_MEMINFO = {
+    'total_ram_kb': 11_381_328,
+    'free_ram_kb': 7_536_353,
+    'used_ram_kb': 7_703_762,
+    'cached_pss_kb': 5_551_529,
+    'cached_kernel_kb': 1_479_220,
+    'free_memory_kb': 505_604,
+    'used_pss_kb': 5_918_286,
+    'kernel_kb': 1_785_476,
+    'zram_physical_kb': 1_903_328,
+    'zram_swap_kb': 6_691_904,
+}
+
+PACKAGE_FAMILIES = [
+    'com.samsung.android.knox',
+    'com.samsung.android',
+    'com.sec.android.app',
+    'com.google.android.gms',
+    'com.google.android',
+    'com.facebook',
+    'com.android',
+    'org.example',
+]
+
+
+def package_name(rng, i):
+    return f"{rng.choice(PACKAGE_FAMILIES)}.app{i}"
+
+
+def meminfo_lines(n_processes=1000, seed=0, snapshot=None, rows=None):
+    """Yield a `dumpsys meminfo` dump with n_processes per-process rows.
+
+    `rows` replaces the random process table with given (pss_kb, name, pid)
+    tuples.
+    """
+    rng = random.Random(seed)
+    snap = dict(BEFORE_MEMINFO)
+    if snapshot:
+        snap.update(snapshot)
+
+    if rows is None:
+        rows = [(rng.randint(1_000, 600_000), package_name(rng, i), 1000 + i)
+                for i in range(n_processes)]
+    rows = sorted(rows, reverse=True)
+
+    yield "Applications Memory Usage (in Kilobytes):\n"
+    yield "Uptime: 123456789 Realtime: 123456789\n"
+    yield "\n"
+    yield "Total RSS by process:\n"
+    for pss, name, pid in rows:
+        yield f"{pss * 3 // 2:>13,}K: {name} (pid {pid})\n"
+    yield "\n"
+    yield "Total PSS by process:\n"
+    for pss, name, pid in rows:
+        suffix = " / activities" if pid % 7 == 0 else ""
+        yield f"{pss:>13,}K: {name} (pid {pid}{suffix})    ({pss // 10:>10,}K in swap)\n"
+    yield "\n"
+    yield "Total PSS by OOM adjustment:\n"
+    yield f"{snap['used_pss_kb']:>13,}K: Native\n"
+    for pss, name, pid in rows[:50]:
+        yield f"    {pss:>13,}K: {name} (pid {pid})\n"
+    yield "\n"
+    yield "Total PSS by category:\n"
+    yield f"{snap['used_pss_kb'] // 3:>13,}K: Dalvik\n"
+    yield "\n"
+    yield f"Total RAM: {snap['total_ram_kb']:,}K (status normal)\n"
+    yield (f" Free RAM: {snap['free_ram_kb']:,}K ({snap['cached_pss_kb']:>12,}K cached pss + "
+           f"{snap['cached_kernel_kb']:>12,}K cached kernel + {snap['free_memory_kb']:>12,}K free)\n")
+    yield (f" Used RAM: {snap['used_ram_kb']:,}K ({snap['used_pss_kb']:>12,}K used pss + "
+           f"{snap['kernel_kb']:>12,}K kernel)\n")
+    yield f" Lost RAM: {rng.randint(1, 500_000):,}K\n"
+    yield (f"     ZRAM: {snap['zram_physical_kb']:,}K physical used for "
+           f"{snap['zram_swap_kb']:>12,}K in swap ({12_582_908:>12,}K total swap)\n")
+    yield "   Tuning: 256 (large 512), oom   322,560K, restore limit   107,520K (high-end-gfx)\n"
+
+
+def write_lines(path, lines):
+    """Write a generator of lines to disk and return the byte size."""
+    size = 0
+    with open(path, 'w', encoding='utf-8') as f:
+        for line in lines:
+            size += f.write(line)
+    return size
+
+
+def _duration(ms):
+    h, rem = divmod(ms, 3_600_000)
+    m, rem = divmod(rem, 60_000)
+    s, ms = divmod(rem, 1000)
+    out = '+'
+    if h:
+        out += f'{h}h'
+    if h or m:
+        out += f'{m:02d}m'
+    return out + f'{s:02d}s{ms:03d}ms'
+
+
+def batterystats_lines(n_events=7_443, seed=0, start=None):
+    """Yield a `dumpsys batterystats` capture with a Battery History block.
+
+    The level random-walks while the device cycles between charging and
+    discharging, with wakelocks taken and released along the way. Each seed
+    starts three days after the previous one unless `start` is given.
+    """
+    rng = random.Random(seed)
+    if start is None:
+        start = (datetime(2025, 10, 13, 3, 47) + timedelta(days=3 * seed)).strftime('%Y-%m-%d-%H:%M:%S')
+    yield "Battery History (2% used, 5980 used of 256KB, 45 strings using 2562):\n"
+    yield f"                    0 (15) RESET:TIME: {start}\n"
+    yield "                    0 (2) 100 status=discharging health=good plug=none temp=281 volt=4321\n"
+
+    level, charging, now = 100, False, 0
+    for _ in range(n_events - 3):
+        now += rng.randint(1_000, 60_000)
+        extra = ''
+        roll = rng.random()
+        if roll < 0.005:
+            charging = not charging
+            extra = ' status=charging plug=usb +plugged' if charging else ' status=discharging plug=none -plugged'
+        elif roll < 0.05:
+            level = min(100, level + 1) if charging else max(0, level - 1)
+        elif roll < 0.65:
+            app = rng.randint(0, 50)
+            family = PACKAGE_FAMILIES[app % len(PACKAGE_FAMILIES)]
+            extra = f' +wake_lock=u0a{100 + app}:"*job*/{family}.app{app}"'
+        else:
+            extra = ' -wake_lock'
+        yield f"{_duration(now):>21s} (2) {level:03d}{extra}\n"
+    yield "\n"
+
+
+GALLERY = 'com.sec.android.gallery3d'
+
+
+def usagestats_lines(n_events=11_863, seed=0, start=None):
+    """Yield a `dumpsys usagestats` capture with a daily events block.
+
+    Foreground sessions are RESUMED / PAUSED / STOPPED triples; the gallery
+    gets a quarter of them and the longest sessions. A weekly block
+    repeating the first events follows, as on a real device.
+    """
+    rng = random.Random(seed)
+    now = start or datetime(2025, 10, 13) + timedelta(days=3 * seed)
+    apps = [GALLERY] + [package_name(rng, i) for i in range(150)]
+
+    events = []
+    while len(events) < n_events:
+        app = GALLERY if rng.random() < 0.25 else rng.choice(apps)
+        now += timedelta(seconds=rng.randint(5, 300))
+        length = timedelta(seconds=rng.randint(60, 360) if app == GALLERY else rng.randint(5, 300))
+        activity = f'{app}.MainActivity'
+        events.append((now, 'ACTIVITY_RESUMED', app, activity))
+        now += length
+        events.append((now, 'ACTIVITY_PAUSED', app, activity))
+        events.append((now + timedelta(milliseconds=500), 'ACTIVITY_STOPPED', app, activity))
+    del events[n_events:]
+
+    def lines(block):
+        for when, kind, app, activity in block:
+            yield (f'        time="{when:%Y-%m-%d %H:%M:%S}" type={kind} package={app} '
+                   f'class={activity} instanceId={rng.randint(1, 1 << 30)} '
+                   f'taskRootPackage={app} taskRootClass={activity} flags=0x0\n')
+
+    yield "user=0\n"
+    yield "  In-memory daily stats\n"
+    yield f'  timeRange="{events[0][0]:%Y-%m-%d %H:%M:%S} - {events[-1][0]:%Y-%m-%d %H:%M:%S}"\n'
+    yield "  events\n"
+    yield from lines(events)
+    yield "  In-memory weekly stats\n"
+    yield "  events\n"
+    yield from lines(events[:100])
+
+
+def packages_lines(n_system=311, n_user=262, seed=0):
+    """Yield `pm list packages -f` output."""
+    rng = random.Random(seed)
+    for i in range(n_system):
+        name = package_name(rng, i)
+        yield f"package:/system/priv-app/App{i}/App{i}.apk={name}\n"
+    for i in range(n_user):
+        name = package_name(rng, n_system + i)
+        yield f"package:/data/app/~~{rng.getrandbits(32):08x}==/{name}-1/base.apk={name}\n"
+
+
+def dumpsys_package_lines(n_system=311, n_user=262, seed=0):
+    """Yield `dumpsys package` output: a Packages: block plus hidden system packages."""
+    rng = random.Random(seed)
+    yield "Database versions:\n"
+    yield "  Internal:\n"
+    yield "    sdkVersion=34 databaseVersion=3\n"
+    yield "\n"
+    yield "Packages:\n"
+    for i in range(n_system + n_user):
+        name = package_name(rng, i)
+        path = (f"/system/priv-app/App{i}" if i < n_system
+                else f"/data/app/~~{rng.getrandbits(32):08x}==/{name}-1")
+        yield f"  Package [{name}] ({rng.getrandbits(28):07x}):\n"
+        yield f"    userId={10_000 + i}\n"
+        yield f"    codePath={path}\n"
+        yield f"    resourcePath={path}\n"
+        yield f"    versionCode={rng.randint(1, 10**9)} minSdk=28 targetSdk=34\n"
+        yield f"    flags=[ {'SYSTEM ' if i < n_system else ''}HAS_CODE ALLOW_CLEAR_USER_DATA ]\n"
+    yield "\n"
+    yield "Hidden system packages:\n"
+    for i in range(0, n_system, 10):
+        yield f"  Package [{package_name(rng, i)}] ({rng.getrandbits(28):07x}):\n"
+        yield f"    codePath=/system/priv-app/App{i}\n"
+
+
+def ps_lines(n_processes=1070, seed=0):
+    """Yield `ps -A` output with a realistic header."""
+    rng = random.Random(seed)
+    yield "USER            PID   PPID     VSZ    RSS WCHAN            ADDR S NAME\n"
+    for i in range(n_processes):
+        pid = 1 + i
+        ppid = 0 if i == 0 else rng.randint(1, max(1, i))
+        user = 'root' if i < 200 else f'u0_a{rng.randint(10, 400)}'
+        name = 'init' if i == 0 else package_name(rng, i)
+        yield (f"{user:<15} {pid:>5} {ppid:>6} {rng.randint(10_000, 20_000_000):>7} "
+               f"{rng.randint(1_000, 600_000):>6} 0                   0 S {name}\n")
+
+
+def df_lines(free_gb=140.5, total_gb=220.9):
+    """Yield `df -k /data` output."""
+    total_kb = round(total_gb * 1024 * 1024)
+    free_kb = round(free_gb * 1024 * 1024)
+    yield "Filesystem      1K-blocks      Used  Available Use% Mounted on\n"
+    yield (f"/dev/block/dm-4 {total_kb:>10} {total_kb - free_kb:>9} {free_kb:>10} "
+           f"{(total_kb - free_kb) * 100 // total_kb:>3}% /data\n")
+
+
+def logcat_lines(n_lines, seed=0):
+    """Yield `logcat -v threadtime` lines, the bulk of any bugreport."""
+    rng = random.Random(seed)
+    start = datetime(2025, 10, 19, 9, 0)
+    tags = ('ActivityManager', 'PackageManager', 'WindowManager', 'chatty', 'Knox', 'GmsCore')
+    for i in range(n_lines):
+        when = start + timedelta(milliseconds=i * 37)
+        pid = rng.randint(300, 30_000)
+        yield (f"{when:%m-%d %H:%M:%S.%f}"[:-3] + f" {pid:>5} {pid + rng.randint(0, 40):>5} "
+               f"{rng.choice('VDIWE')} {rng.choice(tags):<16}: event {i} "
+               f"pkg={package_name(rng, i % 500)} value={rng.getrandbits(40):x}\n")
+
+
+def _dumpsys_service(name, lines):
+    yield "-" * 79 + "\n"
+    yield f"DUMP OF SERVICE {name}:\n"
+    yield from lines
+    yield f"--------- 0.041s was the duration of dumpsys {name}, ending at: 2025-10-19 09:14:22\n"
+
+
+def bugreport_lines(log_lines=1_000_000, seed=0, n_processes=1000,
+                    battery_events=7_443, usage_events=11_863):
+    """Yield a full `adb bugreport` text: logs around the dumpsys services.
+
+    Half the logcat goes before DUMPSYS and half after, so meminfo,
+    batterystats, package and usagestats sit in the middle of the file as
+    they do in a real report. About 108 bytes per log line.
+    """
+    yield "========================================================\n"
+    yield "== dumpstate: 2025-10-19 09:14:00\n"
+    yield "========================================================\n"
+    yield "------ SYSTEM LOG (logcat -v threadtime -v printable -v uid -d *:v) ------\n"
+    yield from logcat_lines(log_lines // 2, seed=seed)
+    yield "------ 2.104s was the duration of 'SYSTEM LOG' ------\n"
+    yield "------ DUMPSYS (/system/bin/dumpsys) ------\n"
+    yield from _dumpsys_service('meminfo', meminfo_lines(n_processes, seed=seed))
+    yield from _dumpsys_service('batterystats', batterystats_lines(battery_events, seed=seed))
+    yield from _dumpsys_service('package', dumpsys_package_lines(seed=seed))
+    yield from _dumpsys_service('usagestats', usagestats_lines(usage_events, seed=seed))
+    yield "------ 4.520s was the duration of 'DUMPSYS' ------\n"
+    yield "------ EVENT LOG (logcat -b events -v threadtime -v printable -v uid -d *:v) ------\n"
+    yield from logcat_lines(log_lines - log_lines // 2, seed=seed + 1)
+    yield "------ 0.912s was the duration of 'EVENT LOG' ------\n"
+
+
+def write_capture_dir(path, capture, seed=0):
+    """Write meminfo/packages/ps/df dumps that load back as `capture`."""
+    os.makedirs(path, exist_ok=True)
+    write_lines(os.path.join(path, 'meminfo.txt'),
+                meminfo_lines(200, seed=seed, snapshot=capture))
+    write_lines(os.path.join(path, 'packages.txt'),
+                packages_lines(capture['system_apps'], capture['user_apps'], seed=seed))
+    write_lines(os.path.join(path, 'ps.txt'),
+                ps_lines(capture['running_processes'], seed=seed))
+    write_lines(os.path.join(path, 'df.txt'),
+                df_lines(capture['storage_free_gb'], capture['storage_total_gb']))
+
+
+def perturb(capture, seed, spread=0.15):
+    """Scale every numeric metric of a capture by up to +/- spread."""
+    rng = random.Random(seed)
+    out = {}
+    for key, value in capture.items():
+        if key in ('captured_at_ms', 'total_ram_kb', 'storage_total_gb'):
+            out[key] = value
+        elif isinstance(value, float):
+            out[key] = round(value * (1 + rng.uniform(-spread, spread)), 1)
+        else:
+            out[key] = int(value * (1 + rng.uniform(-spread, spread)))
+    out['total_packages'] = out['system_apps'] + out['user_apps']
+    return out